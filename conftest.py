@@ -22,6 +22,7 @@ from config import settings
 from infrastructure.app import create_app
 from infrastructure.database.core import build_engine
 from infrastructure.database.deps import get_session
+from infrastructure.utility.redis_client import RedisCacheTest
 
 pytest_plugins = [
     "apps.activities.tests.fixtures.configs",
@@ -166,6 +167,13 @@ async def arbitrary_session(arbitrary_engine: AsyncEngine) -> AsyncGenerator:
         await conn.rollback()
 
 
+@pytest.fixture(autouse=True)
+def clear_redis_cache() -> Generator:
+    # Database changes are rolled back after every test, the cache must not keep them
+    yield
+    RedisCacheTest._storage.clear()
+
+
 @pytest.fixture
 def client(session: AsyncSession, app: FastAPI) -> TestClient:
     app.dependency_overrides[get_session] = lambda: session
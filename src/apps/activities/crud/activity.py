@@ -31,6 +31,13 @@ class ActivitiesCRUD(BaseCRUD[ActivitySchema]):
         query = delete(ActivitySchema).where(ActivitySchema.applet_id == applet_id)
         await self._execute(query)
 
+    async def update_changed(self, schemas: list[ActivitySchema], values: list[dict]) -> list[ActivitySchema]:
+        return await self._update_changed(schemas, values)
+
+    async def delete_by_ids(self, ids: list[uuid.UUID]):
+        query = delete(ActivitySchema).where(ActivitySchema.id.in_(ids))
+        await self._execute(query)
+
     async def get_by_applet_id(self, applet_id: uuid.UUID, is_reviewable=None) -> list[ActivitySchema]:
         query: Query = select(ActivitySchema)
         query = query.where(ActivitySchema.applet_id == applet_id)
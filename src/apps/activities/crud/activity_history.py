@@ -27,6 +27,13 @@ class ActivityHistoriesCRUD(BaseCRUD[ActivityHistorySchema]):
         result = await self._execute(query)
         return result.scalars().all()
 
+    async def retrieve_by_applet_versions(self, id_versions: list[str]) -> list[ActivityHistorySchema]:
+        query: Query = select(ActivityHistorySchema)
+        query = query.where(ActivityHistorySchema.applet_id.in_(id_versions))
+        query = query.order_by(ActivityHistorySchema.order.asc())
+        result = await self._execute(query)
+        return result.scalars().all()
+
     async def retrieve_activities_by_applet_version(self, id_version) -> list[ActivityHistorySchema]:
         query: Query = select(ActivityHistorySchema)
         query = query.where(ActivityHistorySchema.applet_id == id_version)
@@ -24,6 +24,20 @@ class ActivityItemsCRUD(BaseCRUD[ActivityItemSchema]):
         query = delete(ActivityItemSchema).where(ActivityItemSchema.activity_id.in_(activity_id_query))
         await self._execute(query)
 
+    async def update_changed(self, schemas: list[ActivityItemSchema], values: list[dict]) -> list[ActivityItemSchema]:
+        return await self._update_changed(schemas, values)
+
+    async def delete_by_ids(self, ids: list[uuid.UUID]):
+        query = delete(ActivityItemSchema).where(ActivityItemSchema.id.in_(ids))
+        await self._execute(query)
+
+    async def get_by_applet_id(self, applet_id: uuid.UUID) -> list[ActivityItemSchema]:
+        activity_id_query: Query = select(ActivitySchema.id).where(ActivitySchema.applet_id == applet_id)
+        query: Query = select(ActivityItemSchema)
+        query = query.where(ActivityItemSchema.activity_id.in_(activity_id_query))
+        result = await self._execute(query)
+        return result.scalars().all()
+
     async def get_by_activity_id(self, activity_id: uuid.UUID) -> list[ActivityItemSchema]:
         query: Query = select(ActivityItemSchema)
         query = query.where(ActivityItemSchema.activity_id == activity_id)
@@ -18,6 +18,7 @@ from apps.activities.domain.activity_update import (
 )
 from apps.activities.errors import ActivityAccessDeniedError, ActivityDoeNotExist
 from apps.activities.services.activity_item import ActivityItemService
+from apps.activity_flows.crud import FlowItemsCRUD
 from apps.applets.crud import AppletsCRUD, UserAppletAccessCRUD
 from apps.schedule.crud.events import ActivityEventsCRUD, EventCRUD
 from apps.schedule.service.schedule import ScheduleService
@@ -104,7 +105,14 @@ class ActivityService:
         return activities
 
     async def update_create(self, applet_id: uuid.UUID, activities_create: list[ActivityUpdate]) -> list[ActivityFull]:
-        schemas = []
+        """Updates activities of the applet to the given ones.
+
+        Only new, changed and removed activities and items are written,
+        flow items of removed activities are removed with them.
+        """
+        new_schemas = []
+        stored_schemas = []
+        stored_values = []
         activity_key_id_map: dict[uuid.UUID, uuid.UUID] = dict()
         activity_id_key_map: dict[uuid.UUID, uuid.UUID] = dict()
         prepared_activity_items = list()
@@ -113,6 +121,8 @@ class ActivityService:
 
         all_activity_ids = [activity.activity_id for activity in all_activities]
 
+        stored = {schema.id: schema for schema in await ActivitiesCRUD(self.session).get_by_applet_id(applet_id)}
+
         # Save new activity ids
         new_activities = []
         existing_activities = []
@@ -127,28 +137,31 @@ class ActivityService:
             else:
                 new_activities.append(activity_id)
 
-            schemas.append(
-                ActivitySchema(
-                    id=activity_id,
-                    applet_id=applet_id,
-                    name=activity_data.name,
-                    description=activity_data.description,
-                    splash_screen=activity_data.splash_screen,
-                    image=activity_data.image,
-                    show_all_at_once=activity_data.show_all_at_once,
-                    is_skippable=activity_data.is_skippable,
-                    is_reviewable=activity_data.is_reviewable,
-                    response_is_editable=activity_data.response_is_editable,
-                    is_hidden=activity_data.is_hidden,
-                    scores_and_reports=activity_data.scores_and_reports.dict()
-                    if activity_data.scores_and_reports
-                    else None,
-                    subscale_setting=activity_data.subscale_setting.dict() if activity_data.subscale_setting else None,
-                    order=index + 1,
-                    report_included_item_name=(activity_data.report_included_item_name),
-                    performance_task_type=activity_data.performance_task_type,
-                )
+            values = dict(
+                id=activity_id,
+                applet_id=applet_id,
+                name=activity_data.name,
+                description=activity_data.description,
+                splash_screen=activity_data.splash_screen,
+                image=activity_data.image,
+                show_all_at_once=activity_data.show_all_at_once,
+                is_skippable=activity_data.is_skippable,
+                is_reviewable=activity_data.is_reviewable,
+                response_is_editable=activity_data.response_is_editable,
+                is_hidden=activity_data.is_hidden,
+                scores_and_reports=activity_data.scores_and_reports.dict()
+                if activity_data.scores_and_reports
+                else None,
+                subscale_setting=activity_data.subscale_setting.dict() if activity_data.subscale_setting else None,
+                order=index + 1,
+                report_included_item_name=(activity_data.report_included_item_name),
+                performance_task_type=activity_data.performance_task_type,
             )
+            if (schema := stored.pop(activity_id, None)) is not None:
+                stored_schemas.append(schema)
+                stored_values.append(values)
+            else:
+                new_schemas.append(ActivitySchema(**values))
 
             for item in activity_data.items:
                 prepared_activity_items.append(
@@ -165,17 +178,20 @@ class ActivityService:
                         is_hidden=item.is_hidden,
                     )
                 )
-        activity_schemas = await ActivitiesCRUD(self.session).create_many(schemas)
-        activity_items = await ActivityItemService(self.session).update_create(prepared_activity_items)
-        activities = list()
+        await ActivitiesCRUD(self.session).update_changed(stored_schemas, stored_values)
+        activity_schemas = [*stored_schemas, *await ActivitiesCRUD(self.session).create_many(new_schemas)]
+        activity_items = await ActivityItemService(self.session).update_applet_items(applet_id, prepared_activity_items)
+        if stored:
+            # Flow items restrict removing their activities
+            await FlowItemsCRUD(self.session).delete_by_activity_ids(list(stored))
+            await ActivitiesCRUD(self.session).delete_by_ids(list(stored))
 
         activity_id_map: dict[uuid.UUID, ActivityFull] = dict()
 
         for activity_schema in activity_schemas:
             activity_schema.key = activity_id_key_map[activity_schema.id]
-            activity = ActivityFull.from_orm(activity_schema)
-            activities.append(activity)
-            activity_id_map[activity.id] = activity
+            activity_id_map[activity_schema.id] = ActivityFull.from_orm(activity_schema)
+        activities = [activity_id_map[activity_id] for activity_id in activity_id_key_map]
 
         for activity_item in activity_items:
             activity_id_map[activity_item.activity_id].items.append(activity_item)
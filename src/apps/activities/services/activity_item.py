@@ -48,6 +48,36 @@ class ActivityItemService:
         item_schemas = await ActivityItemsCRUD(self.session).create_many(schemas)
         return [ActivityItemFull.from_orm(item) for item in item_schemas]
 
+    async def update_applet_items(
+        self, applet_id: uuid.UUID, activity_items: list[PreparedActivityItemUpdate]
+    ) -> list[ActivityItemFull]:
+        """Writes new, changed and removed items of the applet only."""
+        crud = ActivityItemsCRUD(self.session)
+        stored = {schema.id: schema for schema in await crud.get_by_applet_id(applet_id)}
+        new_schemas = list()
+        stored_schemas = list()
+        stored_values = list()
+        activity_id_ordering_map: dict[uuid.UUID, int] = defaultdict(int)
+
+        for activity_item in activity_items:
+            values = dict(
+                **activity_item.dict(),
+                order=activity_id_ordering_map[activity_item.activity_id] + 1,
+            )
+            activity_id_ordering_map[activity_item.activity_id] += 1
+            if (schema := stored.pop(activity_item.id, None)) is not None:
+                stored_schemas.append(schema)
+                stored_values.append(values)
+            else:
+                new_schemas.append(ActivityItemSchema(**values))
+
+        if stored:
+            await crud.delete_by_ids(list(stored))
+        await crud.update_changed(stored_schemas, stored_values)
+        item_schemas = await crud.create_many(new_schemas)
+        schema_map = {schema.id: schema for schema in [*stored_schemas, *item_schemas]}
+        return [ActivityItemFull.from_orm(schema_map[activity_item.id]) for activity_item in activity_items]
+
     async def get_single_language_by_activity_id(
         self, activity_id: uuid.UUID, language: str
     ) -> list[ActivityItemSingleLanguageDetail]:
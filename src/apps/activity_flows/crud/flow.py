@@ -36,6 +36,13 @@ class FlowsCRUD(BaseCRUD[ActivityFlowSchema]):
         query = delete(ActivityFlowSchema).where(ActivityFlowSchema.applet_id == applet_id)
         await self._execute(query)
 
+    async def update_changed(self, schemas: list[ActivityFlowSchema], values: list[dict]) -> list[ActivityFlowSchema]:
+        return await self._update_changed(schemas, values)
+
+    async def delete_by_ids(self, ids: list[uuid.UUID]):
+        query = delete(ActivityFlowSchema).where(ActivityFlowSchema.id.in_(ids))
+        await self._execute(query)
+
     async def get_by_applet_id(self, applet_id) -> list[ActivityFlowSchema]:
         query: Query = select(ActivityFlowSchema)
         query = query.where(ActivityFlowSchema.applet_id == applet_id)
@@ -24,6 +24,13 @@ class FlowsHistoryCRUD(BaseCRUD[ActivityFlowHistoriesSchema]):
         result = await self._execute(query)
         return result.scalars().all()
 
+    async def retrieve_by_applet_versions(self, id_versions: list[str]) -> list[ActivityFlowHistoriesSchema]:
+        query: Query = select(ActivityFlowHistoriesSchema)
+        query = query.where(ActivityFlowHistoriesSchema.applet_id.in_(id_versions))
+        query = query.order_by(ActivityFlowHistoriesSchema.order.asc())
+        result = await self._execute(query)
+        return result.scalars().all()
+
     async def get_by_id_versions(self, id_versions: list[str]) -> list[ActivityFlowHistoriesSchema]:
         if not id_versions:
             return []
@@ -20,6 +20,19 @@ class FlowItemsCRUD(BaseCRUD[ActivityFlowItemSchema]):
         query = delete(ActivityFlowItemSchema).where(ActivityFlowItemSchema.activity_flow_id.in_(flow_id_query))
         await self._execute(query)
 
+    async def update_changed(
+        self, schemas: list[ActivityFlowItemSchema], values: list[dict]
+    ) -> list[ActivityFlowItemSchema]:
+        return await self._update_changed(schemas, values)
+
+    async def delete_by_ids(self, ids: list[uuid.UUID]):
+        query = delete(ActivityFlowItemSchema).where(ActivityFlowItemSchema.id.in_(ids))
+        await self._execute(query)
+
+    async def delete_by_activity_ids(self, activity_ids: list[uuid.UUID]):
+        query = delete(ActivityFlowItemSchema).where(ActivityFlowItemSchema.activity_id.in_(activity_ids))
+        await self._execute(query)
+
     async def get_by_applet_id(self, applet_id: uuid.UUID) -> list[ActivityFlowItemSchema]:
         query = select(ActivityFlowItemSchema)
         query = query.join(
@@ -78,37 +78,51 @@ class FlowService:
         flows_update: list[FlowUpdate],
         activity_key_id_map: dict[uuid.UUID, uuid.UUID],
     ) -> list[FlowFull]:
-        schemas = list()
+        """Updates flows of the applet to the given ones.
+
+        Only new, changed and removed flows and flow items are written.
+        """
+        new_schemas = list()
+        stored_schemas = list()
+        stored_values = list()
         prepared_flow_items = list()
 
         all_flows = [flow.flow_id for flow in await FlowEventsCRUD(self.session).get_by_applet_id(applet_id)]
 
+        stored = {schema.id: schema for schema in await FlowsCRUD(self.session).get_by_applet_id(applet_id)}
+
         # Save new flow ids
         new_flows = []
         existing_flows = []
+        flow_ids = []
 
         for index, flow_update in enumerate(flows_update):
             flow_id = flow_update.id or uuid.uuid4()
+            flow_ids.append(flow_id)
 
             if flow_update.id:
                 existing_flows.append(flow_id)
             else:
                 new_flows.append(flow_id)
 
-            schemas.append(
-                ActivityFlowSchema(
-                    id=flow_id,
-                    applet_id=applet_id,
-                    name=flow_update.name,
-                    description=flow_update.description,
-                    is_single_report=flow_update.is_single_report,
-                    hide_badge=flow_update.hide_badge,
-                    is_hidden=flow_update.is_hidden,
-                    order=index + 1,
-                    report_included_activity_name=(flow_update.report_included_activity_name),
-                    report_included_item_name=(flow_update.report_included_item_name),
-                )
+            values = dict(
+                id=flow_id,
+                applet_id=applet_id,
+                name=flow_update.name,
+                description=flow_update.description,
+                is_single_report=flow_update.is_single_report,
+                hide_badge=flow_update.hide_badge,
+                is_hidden=flow_update.is_hidden,
+                order=index + 1,
+                report_included_activity_name=(flow_update.report_included_activity_name),
+                report_included_item_name=(flow_update.report_included_item_name),
             )
+            if (schema := stored.pop(flow_id, None)) is not None:
+                stored_schemas.append(schema)
+                stored_values.append(values)
+            else:
+                new_schemas.append(ActivityFlowSchema(**values))
+
             for flow_item_update in flow_update.items:
                 prepared_flow_items.append(
                     PreparedFlowItemUpdate(
@@ -117,16 +131,17 @@ class FlowService:
                         activity_id=activity_key_id_map[flow_item_update.activity_key],
                     )
                 )
-        flow_schemas = await FlowsCRUD(self.session).create_many(schemas)
-        flow_items = await FlowItemService(self.session).create_update(prepared_flow_items)
-        flows = list()
+        await FlowsCRUD(self.session).update_changed(stored_schemas, stored_values)
+        flow_schemas = [*stored_schemas, *await FlowsCRUD(self.session).create_many(new_schemas)]
+        flow_items = await FlowItemService(self.session).update_applet_items(applet_id, prepared_flow_items)
+        if stored:
+            await FlowsCRUD(self.session).delete_by_ids(list(stored))
 
         flow_id_map = dict()
 
         for flow_schema in flow_schemas:
-            flow = FlowFull.from_orm(flow_schema)
-            flows.append(flow)
-            flow_id_map[flow.id] = flow
+            flow_id_map[flow_schema.id] = FlowFull.from_orm(flow_schema)
+        flows = [flow_id_map[flow_id] for flow_id in flow_ids]
 
         for flow_item in flow_items:
             flow_id_map[flow_item.activity_flow_id].items.append(flow_item)
@@ -47,6 +47,38 @@ class FlowItemService:
 
         return [ActivityFlowItemFull.from_orm(schema) for schema in item_schemas]
 
+    async def update_applet_items(
+        self, applet_id: uuid.UUID, items: list[PreparedFlowItemUpdate]
+    ) -> list[ActivityFlowItemFull]:
+        """Writes new, changed and removed flow items of the applet only."""
+        crud = FlowItemsCRUD(self.session)
+        stored = {schema.id: schema for schema in await crud.get_by_applet_id(applet_id)}
+        new_schemas = list()
+        stored_schemas = list()
+        stored_values = list()
+        flow_id_ordering_map: dict[uuid.UUID, int] = defaultdict(int)
+
+        for item in items:
+            values = dict(
+                id=item.id,
+                activity_flow_id=item.activity_flow_id,
+                activity_id=item.activity_id,
+                order=flow_id_ordering_map[item.activity_flow_id] + 1,
+            )
+            flow_id_ordering_map[item.activity_flow_id] += 1
+            if (schema := stored.pop(item.id, None)) is not None:
+                stored_schemas.append(schema)
+                stored_values.append(values)
+            else:
+                new_schemas.append(ActivityFlowItemSchema(**values))
+
+        if stored:
+            await crud.delete_by_ids(list(stored))
+        await crud.update_changed(stored_schemas, stored_values)
+        item_schemas = await crud.create_many(new_schemas)
+        schema_map = {schema.id: schema for schema in [*stored_schemas, *item_schemas]}
+        return [ActivityFlowItemFull.from_orm(schema_map[item.id]) for item in items]
+
     async def remove_applet_flow_items(self, applet_id: uuid.UUID):
         await FlowItemsCRUD(self.session).delete_by_applet_id(applet_id)
 
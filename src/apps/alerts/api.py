@@ -6,7 +6,7 @@ from pydantic import parse_obj_as
 from apps.alerts.domain import AlertPublic, AlertResponseMulti
 from apps.alerts.service import AlertService
 from apps.authentication.deps import get_current_user
-from apps.shared.query_params import BaseQueryParams, QueryParams, parse_query_params
+from apps.shared.query_params import CursorQueryParams, QueryParams, parse_query_params
 from apps.users.domain import User
 from infrastructure.database import atomic
 from infrastructure.database.deps import get_session
@@ -14,7 +14,7 @@ from infrastructure.database.deps import get_session
 
 async def get_all_alerts(
     user: User = Depends(get_current_user),
-    query_params: QueryParams = Depends(parse_query_params(BaseQueryParams)),
+    query_params: QueryParams = Depends(parse_query_params(CursorQueryParams)),
     session=Depends(get_session),
 ) -> AlertResponseMulti:
     async with atomic(session):
@@ -26,6 +26,7 @@ async def get_all_alerts(
         result=parse_obj_as(list[AlertPublic], alerts),
         count=counts["alerts_all"],
         not_watched=counts["alerts_not_watched"],
+        cursor=service.get_cursor(alerts, query_params.limit),
     )
 
 
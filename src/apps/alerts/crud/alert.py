@@ -1,12 +1,13 @@
 import uuid
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Query
 
 from apps.alerts.db.schemas import AlertSchema
 from apps.applets.db.schemas import AppletHistorySchema, AppletSchema
 from apps.shared.ordering import Ordering
-from apps.shared.paging import paging
+from apps.shared.paging import keyset_paging, paging
 from apps.shared.searching import Searching
 from apps.workspaces.db.schemas import UserAppletAccessSchema, UserWorkspaceSchema
 from apps.workspaces.domain.constants import Role
@@ -32,11 +33,11 @@ class _AlertOrdering(Ordering):
 class AlertCRUD(BaseCRUD[AlertSchema]):
     schema_class = AlertSchema
 
-    async def create_many(self, schemas: list[AlertSchema]) -> list[AlertSchema]:
-        return await self._create_many(schemas)
+    async def create_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
 
     async def get_all_for_user(
-        self, user_id: uuid.UUID, page: int, limit: int
+        self, user_id: uuid.UUID, page: int, limit: int, after: list | None = None
     ) -> list[
         tuple[
             AlertSchema,
@@ -79,8 +80,11 @@ class AlertCRUD(BaseCRUD[AlertSchema]):
             isouter=True,
         )
         query = query.where(AlertSchema.user_id == user_id, AppletSchema.is_deleted.is_(False))
-        query = query.order_by(AlertSchema.created_at.desc())
-        query = paging(query, page, limit)
+        if after is None:
+            query = query.order_by(AlertSchema.created_at.desc(), AlertSchema.id.desc())
+            query = paging(query, page, limit)
+        else:
+            query = keyset_paging(query, [(AlertSchema.created_at, True), (AlertSchema.id, True)], after, limit)
 
         db_result = await self._execute(query)
         return db_result.all()
@@ -106,3 +110,10 @@ class AlertCRUD(BaseCRUD[AlertSchema]):
         query = query.values(is_watched=True)
 
         await self._execute(query)
+
+    async def delete_by_answer_ids(self, applet_id: uuid.UUID, answer_ids: list[uuid.UUID]):
+        query: Query = delete(AlertSchema)
+        query = query.where(AlertSchema.applet_id == applet_id)
+        query = query.where(AlertSchema.answer_id.in_(answer_ids))
+
+        await self._execute(query)
@@ -3,7 +3,7 @@ import uuid
 
 from pydantic import validator
 
-from apps.shared.domain import InternalModel, PublicModel, ResponseMulti, dict_keys_to_camel_case
+from apps.shared.domain import CursorResponseMulti, InternalModel, PublicModel, dict_keys_to_camel_case
 
 __all__ = [
     "Alert",
@@ -83,5 +83,12 @@ class AlertHandlerResult(InternalModel):
     respondent_id: str
 
 
-class AlertResponseMulti(ResponseMulti[AlertPublic]):
+class AlertAppletMeta(InternalModel):
+    applet_name: str
+    image: str
+    encryption: dict
+    workspace: str
+
+
+class AlertResponseMulti(CursorResponseMulti[AlertPublic]):
     not_watched: int
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+
+from cachetools import TTLCache
+
+from apps.alerts.domain import AlertAppletMeta, AlertHandlerResult, AlertMessage
+from apps.applets.crud import AppletHistoriesCRUD, AppletsCRUD
+from apps.workspaces.crud.user_applet_access import UserAppletAccessCRUD
+from apps.workspaces.crud.workspaces import UserWorkspaceCRUD
+from apps.workspaces.domain.constants import Role
+from config import settings
+from infrastructure.database import session_manager
+from infrastructure.logger import logger
+from infrastructure.utility import RedisCache
+
+__all__ = ["AlertHub", "alert_hub"]
+
+
+class AlertHub:
+    """Delivers alerts published to Redis to websockets of this process.
+
+    All sockets share one pattern subscription to the user channels.
+    The listener only routes messages into a bounded inbox of the user,
+    a worker of the user enriches an alert once with a short-lived session,
+    however many sockets of the user are connected, and puts it into
+    a bounded queue of every socket. The subscription is open while there
+    are sockets.
+    """
+
+    channel_prefix = "channel_"
+
+    def __init__(self):
+        self._queues: dict[uuid.UUID, set[asyncio.Queue]] = defaultdict(set)
+        self._inboxes: dict[uuid.UUID, asyncio.Queue] = {}
+        self._workers: dict[uuid.UUID, asyncio.Task] = {}
+        self._listener: asyncio.Task | None = None
+        self._meta_cache: TTLCache = TTLCache(
+            maxsize=settings.alerts.ws_meta_cache_size,
+            ttl=settings.alerts.ws_meta_ttl,
+        )
+
+    @property
+    def connections(self) -> int:
+        return sum(len(queues) for queues in self._queues.values())
+
+    def subscribe(self, user_id: uuid.UUID) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.alerts.ws_queue_size)
+        self._queues[user_id].add(queue)
+        if not self._listener or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return queue
+
+    def unsubscribe(self, user_id: uuid.UUID, queue: asyncio.Queue):
+        queues = self._queues.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._queues[user_id]
+                self._inboxes.pop(user_id, None)
+                worker = self._workers.pop(user_id, None)
+                if worker:
+                    worker.cancel()
+        if not self._queues and self._listener:
+            self._listener.cancel()
+            self._listener = None
+
+    async def _listen(self):
+        while True:
+            try:
+                async for raw_message in RedisCache().pattern_messages(f"{self.channel_prefix}*"):
+                    self._enqueue(raw_message)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(e)
+            await asyncio.sleep(settings.alerts.ws_reconnect_delay)
+
+    def _get_user_id(self, raw_message: dict) -> uuid.UUID | None:
+        if raw_message.get("type") != "pmessage":
+            return None
+        channel = raw_message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        try:
+            return uuid.UUID(channel.removeprefix(self.channel_prefix))
+        except ValueError:
+            return None
+
+    def _enqueue(self, raw_message: dict):
+        """Routes a message to the worker of the user without waiting for it,
+        a slow enrichment does not hold up alerts of other users.
+        """
+        user_id = self._get_user_id(raw_message)
+        if not user_id or not self._queues.get(user_id):
+            return
+        inbox = self._inboxes.get(user_id)
+        if inbox is None:
+            inbox = asyncio.Queue(maxsize=settings.alerts.ws_queue_size)
+            self._inboxes[user_id] = inbox
+            self._workers[user_id] = asyncio.create_task(self._work(inbox))
+        if inbox.full():
+            inbox.get_nowait()
+            logger.warning(f"Alerts of {user_id} are not enriched in time, alert dropped")
+        inbox.put_nowait(raw_message)
+
+    async def _work(self, inbox: asyncio.Queue):
+        while True:
+            raw_message = await inbox.get()
+            await self.dispatch(raw_message)
+
+    async def dispatch(self, raw_message: dict):
+        user_id = self._get_user_id(raw_message)
+        if not user_id or not self._queues.get(user_id):
+            return
+
+        try:
+            alert_message = AlertMessage(**json.loads(raw_message["data"]))
+        except (ValueError, TypeError):
+            return
+        try:
+            alert = await self._build_alert(alert_message)
+        except Exception as e:
+            logger.exception(e)
+            return
+
+        for queue in self._queues.get(user_id, ()):
+            if queue.full():
+                # The socket does not keep up, drop the oldest alert.
+                # Alerts are stored, the dashboard can fetch them later
+                queue.get_nowait()
+                logger.warning(f"Alerts websocket of {user_id} is slow, alert dropped")
+            queue.put_nowait(alert)
+
+    async def _build_alert(self, alert_message: AlertMessage) -> AlertHandlerResult:
+        session_maker = session_manager.get_session()
+        async with session_maker() as session:
+            respondent_access = await UserAppletAccessCRUD(session).get_applet_role_by_user_id(
+                alert_message.applet_id,
+                alert_message.respondent_id,
+                Role.RESPONDENT,
+            )
+            key = (alert_message.applet_id, alert_message.version)
+            meta = self._meta_cache.get(key)
+            if not meta:
+                applet_history = await AppletHistoriesCRUD(session).retrieve_by_applet_version(
+                    f"{alert_message.applet_id}_{alert_message.version}"
+                )
+                applet = await AppletsCRUD(session).get_by_id(alert_message.applet_id)
+                if respondent_access:
+                    owner_id = respondent_access.owner_id
+                else:
+                    # The respondent has no access anymore, the workspace is found by the applet owner
+                    owner_id = (await UserAppletAccessCRUD(session).get_applet_owner(alert_message.applet_id)).user_id
+                workspace = await UserWorkspaceCRUD(session).get_by_user_id(owner_id)
+                meta = AlertAppletMeta(
+                    applet_name=applet_history.display_name,
+                    image=applet_history.image,
+                    encryption=applet.encryption,
+                    workspace=workspace.workspace_name,
+                )
+                self._meta_cache[key] = meta
+
+        return AlertHandlerResult(
+            id=str(alert_message.id),
+            applet_id=str(alert_message.applet_id),
+            applet_name=meta.applet_name,
+            version=alert_message.version,
+            secret_id=respondent_access.meta.get("secretUserId", "Anonymous") if respondent_access else "Anonymous",
+            activity_id=str(alert_message.activity_id),
+            activity_item_id=str(alert_message.activity_item_id),
+            message=alert_message.message,
+            created_at=alert_message.created_at.isoformat(),
+            answer_id=str(alert_message.answer_id),
+            encryption=meta.encryption,
+            image=meta.image,
+            workspace=meta.workspace,
+            respondent_id=str(alert_message.respondent_id),
+        )
+
+
+alert_hub = AlertHub()
@@ -2,6 +2,7 @@ import uuid
 
 from apps.alerts.crud.alert import AlertCRUD
 from apps.alerts.domain import Alert
+from apps.shared.paging import decode_cursor, encode_cursor
 from apps.shared.query_params import QueryParams
 
 
@@ -12,7 +13,10 @@ class AlertService:
 
     async def get_all_alerts(self, filters: QueryParams) -> list[Alert]:
         alerts = []
-        schemas = await AlertCRUD(self.session).get_all_for_user(self.user_id, filters.page, filters.limit)
+        after = None
+        if filters.cursor:
+            after, _ = decode_cursor(filters.cursor)
+        schemas = await AlertCRUD(self.session).get_all_for_user(self.user_id, filters.page, filters.limit, after)
 
         for alert, applet_history, access, applet, workspace in schemas:
             alerts.append(
@@ -36,6 +40,13 @@ class AlertService:
             )
         return alerts
 
+    @staticmethod
+    def get_cursor(alerts: list[Alert], limit: int) -> str | None:
+        """Cursor of the page following alerts, None for the last page."""
+        if len(alerts) < limit:
+            return None
+        return encode_cursor([alerts[-1].created_at, alerts[-1].id])
+
     async def get_all_alerts_count(self) -> dict:
         count = await AlertCRUD(self.session).get_all_for_user_count(self.user_id)
         return count
@@ -1,3 +1,12 @@
+import asyncio
+import datetime
+import json
+import uuid
+
+from apps.alerts.crud.alert import AlertCRUD
+from apps.alerts.domain import AlertMessage
+from apps.alerts.hub import AlertHub
+from apps.applets.crud import AppletsCRUD
 from apps.shared.test import BaseTest
 
 
@@ -31,3 +40,133 @@ class TestAlert(BaseTest):
         assert response.status_code == 200
         assert response.json()["count"] == 2
         assert response.json()["result"][0]["isWatched"] is True
+
+    async def test_all_alerts_by_cursor(self, client):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+
+        response = await client.get(self.alert_list_url)
+        expected = [alert["id"] for alert in response.json()["result"]]
+
+        response = await client.get(self.alert_list_url, dict(limit=1))
+        assert response.status_code == 200
+        ids = [alert["id"] for alert in response.json()["result"]]
+        cursor = response.json()["cursor"]
+        response = await client.get(self.alert_list_url, dict(limit=1, cursor=cursor))
+        assert response.status_code == 200
+        ids += [alert["id"] for alert in response.json()["result"]]
+        assert ids == expected
+        assert response.json()["count"] == 2
+
+    async def test_create_many(self, session):
+        user_id = uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa1")
+        values = [
+            dict(
+                user_id=user_id,
+                respondent_id=user_id,
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+                version="1.0.0",
+                alert_message=f"message {i}",
+            )
+            for i in range(3)
+        ]
+
+        rows = await AlertCRUD(session).create_many(values)
+
+        assert [row.alert_message for row in rows] == ["message 0", "message 1", "message 2"]
+        assert all(row.is_watched is False for row in rows)
+        assert await AlertCRUD(session).count(user_id=user_id) == 5
+
+    @staticmethod
+    def _alert_message(
+        user_id: uuid.UUID, alert_id: uuid.UUID, respondent_id: str = "7484f34a-3acc-4ee6-8a94-fd7299502fa1"
+    ) -> dict:
+        message = AlertMessage(
+            id=alert_id,
+            respondent_id=respondent_id,
+            applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            version="1.0.0",
+            message="message",
+            created_at=datetime.datetime.utcnow(),
+            activity_id="09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+            activity_item_id="a18d3409-2c96-4a5e-a1f3-1c1c14be0011",
+            answer_id="655ddd55-a9f4-48f3-abae-4cbfa9c695da",
+        )
+        return dict(
+            type="pmessage",
+            channel=f"channel_{user_id}".encode(),
+            data=json.dumps(message.dict(), default=str),
+        )
+
+    async def test_alert_hub_enriches_alert_once_for_all_sockets(self, mock_get_session, mocker):
+        hub = AlertHub()
+        user_id = uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa1")
+        first, second = hub.subscribe(user_id), hub.subscribe(user_id)
+        spy = mocker.spy(AppletsCRUD, "get_by_id")
+
+        await hub.dispatch(self._alert_message(user_id, uuid.uuid4()))
+        await hub.dispatch(self._alert_message(user_id, uuid.uuid4()))
+
+        assert first.qsize() == second.qsize() == 2
+        alert = first.get_nowait()
+        assert alert.applet_id == "92917a56-d586-4613-b7aa-991f2c4b15b1"
+        assert alert.workspace
+        # applet data is cached between alerts
+        assert spy.call_count == 1
+
+        hub.unsubscribe(user_id, first)
+        hub.unsubscribe(user_id, second)
+        assert hub.connections == 0
+
+    async def test_alert_hub_skips_users_without_sockets(self, mocker):
+        hub = AlertHub()
+        spy = mocker.spy(hub, "_build_alert")
+        await hub.dispatch(self._alert_message(uuid.uuid4(), uuid.uuid4()))
+        spy.assert_not_called()
+
+    async def test_alert_hub_drops_oldest_alert_of_slow_socket(self, mock_get_session, mocker):
+        mocker.patch("config.settings.alerts.ws_queue_size", 1)
+        hub = AlertHub()
+        user_id = uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa1")
+        queue = hub.subscribe(user_id)
+        last_alert_id = uuid.uuid4()
+
+        await hub.dispatch(self._alert_message(user_id, uuid.uuid4()))
+        await hub.dispatch(self._alert_message(user_id, last_alert_id))
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait().id == str(last_alert_id)
+        hub.unsubscribe(user_id, queue)
+
+    async def test_alert_hub_alert_of_respondent_without_access(self, mock_get_session):
+        hub = AlertHub()
+        user_id = uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa1")
+        queue = hub.subscribe(user_id)
+
+        await hub.dispatch(self._alert_message(user_id, uuid.uuid4(), respondent_id=str(uuid.uuid4())))
+
+        alert = queue.get_nowait()
+        assert alert.secret_id == "Anonymous"
+        assert alert.workspace
+        hub.unsubscribe(user_id, queue)
+
+    async def test_alert_hub_listener_does_not_wait_for_enrichment(self, mocker):
+        hub = AlertHub()
+        user_id = uuid.uuid4()
+        queue = hub.subscribe(user_id)
+        enriched = asyncio.Event()
+
+        async def dispatch(raw_message: dict):
+            await enriched.wait()
+
+        mocker.patch.object(hub, "dispatch", side_effect=dispatch)
+
+        hub._enqueue(self._alert_message(user_id, uuid.uuid4()))
+        hub._enqueue(self._alert_message(user_id, uuid.uuid4()))
+        await asyncio.sleep(0)
+
+        assert hub.dispatch.call_count == 1
+        enriched.set()
+        await asyncio.sleep(0)
+        assert hub.dispatch.call_count == 2
+        hub.unsubscribe(user_id, queue)
+        assert not hub._workers
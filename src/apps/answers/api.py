@@ -5,6 +5,7 @@ import uuid
 
 from fastapi import Body, Depends, Query
 from fastapi.responses import Response as FastApiResponse
+from fastapi.responses import StreamingResponse
 from pydantic import parse_obj_as
 
 from apps.activities.services import ActivityHistoryService
@@ -71,7 +72,7 @@ async def create_answer(
         service = AnswerService(session, user.id, answer_session)
         async with atomic(answer_session):
             answer = await service.create_answer(schema)
-        await service.create_report_from_answer(answer)
+    await service.notify_answer_submitted(answer, schema)
 
 
 async def create_anonymous_answer(
@@ -86,7 +87,7 @@ async def create_anonymous_answer(
         service = AnswerService(session, anonymous_respondent.id, answer_session)
         async with atomic(answer_session):
             answer = await service.create_answer(schema)
-        await service.create_report_from_answer(answer)
+    await service.notify_answer_submitted(answer, schema)
     return
 
 
@@ -386,6 +387,51 @@ async def applet_answers_export(
     )
 
 
+async def applet_answers_export_stream(
+    applet_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    query_params: QueryParams = Depends(parse_query_params(AnswerExportFilters)),
+    activities_last_version: bool = Query(False, alias="activitiesLastVersion"),
+    session=Depends(get_session),
+    answer_session=Depends(get_answer_session),
+    i18n: I18N = Depends(get_i18n),
+) -> StreamingResponse:
+    """Stream all answers of the applet as newline delimited JSON.
+    Every line is one of {"answer": ...}, {"activity": ...}
+    and the last line is {"count": <number of answers>}.
+    """
+    await AppletService(session, user.id).exist_by_id(applet_id)
+    await CheckAccessService(session, user.id).check_answers_export_access(applet_id)
+    last_activities = []
+    if activities_last_version:
+        applet = await AppletService(session, user.id).get(applet_id)
+        last_activities = await ActivityHistoryService(session, applet.id, applet.version).get_full()
+
+    async def _lines():
+        if last_activities:
+            export = PublicAnswerExport(activities=last_activities).translate(i18n)
+            for activity in export.activities:
+                yield f'{{"activity": {activity.json(by_alias=True)}}}\n'
+
+        total_answers = 0
+        chunks = AnswerService(session, user.id, answer_session).iter_export_data(
+            applet_id, query_params, activities_last_version
+        )
+        async for data in chunks:
+            total_answers += data.total_answers
+            for answer in data.answers:
+                if answer.is_manager:
+                    answer.respondent_secret_id = f"[admin account] ({answer.respondent_email})"
+            export = PublicAnswerExport.from_orm(data).translate(i18n)
+            lines = [f'{{"activity": {activity.json(by_alias=True)}}}\n' for activity in export.activities]
+            lines += [f'{{"answer": {answer.json(by_alias=True)}}}\n' for answer in export.answers]
+            yield "".join(lines)
+
+        yield f'{{"count": {total_answers}}}\n'
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
 async def applet_completed_entities(
     applet_id: uuid.UUID,
     version: str,
@@ -1,10 +1,10 @@
 import asyncio
 import datetime
 import uuid
-from typing import Collection
+from typing import AsyncIterator, Collection
 
 from pydantic import parse_obj_as
-from sqlalchemy import Text, and_, case, column, delete, func, null, or_, select, update
+from sqlalchemy import Text, and_, case, column, delete, func, null, or_, select, tuple_, update
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Query
 from sqlalchemy.sql import Values
@@ -114,15 +114,37 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
             query = query.where(AnswerSchema.respondent_id == respondent_id)
         await self._execute(query)
 
-    async def get_applet_answers(
-        self,
-        applet_id: uuid.UUID,
-        *,
-        include_assessments: bool = True,
-        page=None,
-        limit=None,
-        **filters,
-    ) -> tuple[list[RespondentAnswerData], int]:
+    async def get_ids_created_before(
+        self, applet_id: uuid.UUID, created_before: datetime.datetime, limit: int
+    ) -> list[uuid.UUID]:
+        """Returns ids of the oldest applet answers created before the date."""
+        query: Query = select(AnswerSchema.id)
+        query = query.where(
+            AnswerSchema.applet_id == applet_id,
+            AnswerSchema.created_at < created_before,
+        )
+        query = query.order_by(AnswerSchema.created_at)
+        query = query.limit(limit)
+        db_result = await self._execute(query)
+        return db_result.scalars().all()
+
+    async def count_created_before(self, applet_id: uuid.UUID, created_before: datetime.datetime) -> int:
+        query: Query = select(func.count(AnswerSchema.id))
+        query = query.where(
+            AnswerSchema.applet_id == applet_id,
+            AnswerSchema.created_at < created_before,
+        )
+        db_result = await self._execute(query)
+        return db_result.scalar()
+
+    async def delete_by_ids(self, ids: list[uuid.UUID]):
+        """Deletes answers, answer items are deleted by cascade."""
+        query: Query = delete(AnswerSchema)
+        query = query.where(AnswerSchema.id.in_(ids))
+        await self._execute(query)
+
+    @staticmethod
+    def _get_applet_answers_query(applet_id: uuid.UUID, include_assessments: bool, **filters) -> Query:
         reviewed_answer_id = case(
             (AnswerItemSchema.is_assessment.is_(True), AnswerSchema.id),
             else_=null(),
@@ -184,6 +206,18 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
         if not include_assessments:
             query = query.where(AnswerItemSchema.is_assessment.isnot(True))
 
+        return query
+
+    async def get_applet_answers(
+        self,
+        applet_id: uuid.UUID,
+        *,
+        include_assessments: bool = True,
+        page=None,
+        limit=None,
+        **filters,
+    ) -> tuple[list[RespondentAnswerData], int]:
+        query = self._get_applet_answers_query(applet_id, include_assessments, **filters)
         query_count = query.with_only_columns(func.count())
 
         query = query.order_by(AnswerItemSchema.created_at.desc())
@@ -201,6 +235,36 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
 
         return parse_obj_as(list[RespondentAnswerData], answers), total
 
+    async def get_applet_answers_chunks(
+        self,
+        applet_id: uuid.UUID,
+        *,
+        include_assessments: bool = True,
+        chunk_size: int = 1000,
+        **filters,
+    ) -> AsyncIterator[list[RespondentAnswerData]]:
+        """Iterate over all answers of the applet in the order of
+        get_applet_answers. Chunks are paginated with a keyset on
+        (created_at, answer item id), so every chunk takes the same time.
+        """
+        query = self._get_applet_answers_query(applet_id, include_assessments, **filters)
+        query = query.add_columns(AnswerItemSchema.id.label("answer_item_id"))
+        query = query.order_by(AnswerItemSchema.created_at.desc(), AnswerItemSchema.id.desc())
+        query = query.limit(chunk_size)
+
+        last_key = None
+        while True:
+            chunk_query = query
+            if last_key:
+                chunk_query = chunk_query.where(tuple_(AnswerItemSchema.created_at, AnswerItemSchema.id) < last_key)
+            res = await self._execute(chunk_query)
+            rows = res.all()
+            if rows:
+                yield parse_obj_as(list[RespondentAnswerData], rows)
+            if len(rows) < chunk_size:
+                return
+            last_key = (rows[-1].created_at, rows[-1].answer_item_id)
+
     async def get_activity_history_by_ids(self, activity_hist_ids: list[str]) -> list[ActivityHistory]:
         query: Query = (
             select(ActivityHistorySchema)
@@ -477,7 +541,12 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
         return res[0] if res else None
 
     async def get_applet_user_answer_items(
-        self, applet_id: uuid.UUID, user_id: uuid.UUID, page=None, limit=None
+        self,
+        applet_id: uuid.UUID,
+        user_id: uuid.UUID,
+        page=None,
+        limit=None,
+        after_id: uuid.UUID | None = None,
     ) -> list[UserAnswerItemData]:
         query: Query = (
             select(
@@ -496,6 +565,8 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
             )
             .order_by(AnswerItemSchema.id)
         )
+        if after_id:
+            query = query.where(AnswerItemSchema.id > after_id)
         query = paging(query, page, limit)
 
         db_result = await self._execute(query)
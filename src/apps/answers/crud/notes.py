@@ -1,7 +1,7 @@
 import uuid
 from typing import Collection, List
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Query
 from sqlalchemy.sql.functions import count
 
@@ -54,6 +54,11 @@ class AnswerNotesCRUD(BaseCRUD[AnswerNoteSchema]):
     async def delete_note_by_id(self, note_id: uuid.UUID):
         await self._delete(id=note_id)
 
+    async def delete_by_answer_ids(self, answer_ids: list[uuid.UUID]):
+        query: Query = delete(AnswerNoteSchema)
+        query = query.where(AnswerNoteSchema.answer_id.in_(answer_ids))
+        await self._execute(query)
+
     @staticmethod
     async def map_users_and_notes(
         notes: Collection[AnswerNoteSchema], users: Collection[UserSchema]
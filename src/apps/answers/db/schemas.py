@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Text, Time, Unicode
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Text, Time, Unicode
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy_utils import StringEncryptedType
 
@@ -8,8 +8,18 @@ from infrastructure.database.base import Base
 
 class AnswerSchema(Base):
     __tablename__ = "answers"
+    __table_args__ = (
+        Index("ix_answers_applet_id_created_at", "applet_id", "created_at"),
+        Index("ix_answers_applet_id_respondent_id_created_at", "applet_id", "respondent_id", "created_at"),
+        Index(
+            "ix_answers_applet_id_activity_history_id_created_at",
+            "applet_id",
+            "activity_history_id",
+            "created_at",
+        ),
+    )
 
-    applet_id = Column(UUID(as_uuid=True), index=True)
+    applet_id = Column(UUID(as_uuid=True))
     version = Column(Text())
     submit_id = Column(UUID(as_uuid=True))
     client = Column(JSONB())
@@ -35,6 +45,7 @@ class AnswerItemSchema(Base):
 
     answer_id = Column(
         ForeignKey("answers.id", ondelete="CASCADE"),
+        index=True,
     )
     respondent_id = Column(UUID(as_uuid=True), nullable=True, index=True)
     answer = Column(Text())
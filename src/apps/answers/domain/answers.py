@@ -79,6 +79,15 @@ class AnswerAlert(InternalModel):
     message: str
 
 
+class AnswerSubmitted(InternalModel):
+    answer_id: uuid.UUID
+    applet_id: uuid.UUID
+    activity_id: uuid.UUID
+    version: str
+    respondent_id: uuid.UUID | None
+    alerts: list[AnswerAlert] = Field(default_factory=list)
+
+
 class ClientMeta(InternalModel):
     app_id: str
     app_version: str
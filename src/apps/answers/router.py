@@ -11,6 +11,7 @@ from apps.answers.api import (
     applet_activity_versions_retrieve,
     applet_answer_reviews_retrieve,
     applet_answers_export,
+    applet_answers_export_stream,
     applet_completed_entities,
     applet_submit_date_list,
     applets_completed_entities,
@@ -221,6 +222,18 @@ router.get(
     },
 )(applet_answers_export)
 
+router.get(
+    "/applet/{applet_id}/data/stream",
+    description="""Streams all answers of the applet as newline delimited JSON.
+                Every line is {"answer": ...} or {"activity": ...},
+                the last line is {"count": ...}.""",
+    status_code=status.HTTP_200_OK,
+    responses={
+        **DEFAULT_OPENAPI_RESPONSE,
+        **AUTHENTICATION_ERROR_RESPONSES,
+    },
+)(applet_answers_export_stream)
+
 router.get(
     "/applet/{applet_id}/completions",
     status_code=status.HTTP_200_OK,
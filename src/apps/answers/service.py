@@ -7,7 +7,7 @@ import time
 import uuid
 from collections import defaultdict
 from json import JSONDecodeError
-from typing import List
+from typing import AsyncIterator, List
 
 import aiohttp
 import pydantic
@@ -16,6 +16,7 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from sqlalchemy.engine import Row
 
 from apps.activities.crud import ActivityHistoriesCRUD, ActivityItemHistoriesCRUD
 from apps.activities.domain import ActivityHistory
@@ -25,7 +26,6 @@ from apps.activities.services import ActivityHistoryService
 from apps.activities.services.activity_item_history import ActivityItemHistoryService
 from apps.activity_flows.crud import FlowsHistoryCRUD
 from apps.alerts.crud.alert import AlertCRUD
-from apps.alerts.db.schemas import AlertSchema
 from apps.alerts.domain import AlertMessage
 from apps.answers.crud import AnswerItemsCRUD
 from apps.answers.crud.answers import AnswersCRUD
@@ -39,6 +39,7 @@ from apps.answers.domain import (
     AnswerItemDataEncrypted,
     AnswerNoteDetail,
     AnswerReview,
+    AnswerSubmitted,
     AppletActivityAnswer,
     AppletAnswerCreate,
     AppletCompletedEntities,
@@ -46,8 +47,10 @@ from apps.answers.domain import (
     AssessmentAnswerCreate,
     Identifier,
     ReportServerResponse,
+    RespondentAnswerData,
     ReviewActivity,
     SummaryActivity,
+    UserAnswerItemData,
     Version,
 )
 from apps.answers.errors import (
@@ -63,7 +66,7 @@ from apps.answers.errors import (
     WrongAnswerGroupVersion,
     WrongRespondentForAnswerGroup,
 )
-from apps.answers.tasks import create_report
+from apps.answers.tasks import answer_submitted, create_report, send_alert_mails
 from apps.applets.crud import AppletsCRUD
 from apps.applets.domain.base import Encryption
 from apps.applets.service import AppletHistoryService
@@ -78,7 +81,10 @@ from apps.workspaces.crud.applet_access import AppletAccessCRUD
 from apps.workspaces.crud.user_applet_access import UserAppletAccessCRUD
 from apps.workspaces.domain.constants import Role
 from apps.workspaces.domain.workspace import WorkspaceRespondent
+from apps.workspaces.service.access_roles import AccessRoles
 from apps.workspaces.service.user_applet_access import UserAppletAccessService
+from config import settings
+from infrastructure.database import atomic
 from infrastructure.logger import logger
 from infrastructure.utility import RedisCache
 
@@ -191,13 +197,6 @@ class AnswerService:
         )
 
         await AnswerItemsCRUD(self.answer_session).create(item_answer)
-        await self._create_alerts(
-            answer.id,
-            answer.applet_id,
-            applet_answer.activity_id,
-            answer.version,
-            applet_answer.alerts,
-        )
         return answer
 
     async def create_report_from_answer(self, answer: AnswerSchema):
@@ -282,12 +281,13 @@ class AnswerService:
     async def _validate_applet_activity_access(self, applet_id: uuid.UUID, respondent_id: uuid.UUID):
         assert self.user_id, "User id is required"
         await AppletsCRUD(self.session).get_by_id(applet_id)
-        role = await AppletAccessCRUD(self.session).get_applets_priority_role(applet_id, self.user_id)
+        roles = AccessRoles(self.session, self.user_id)
+        role = await roles.get_priority_role(applet_id)
         if role == Role.REVIEWER:
-            access = await UserAppletAccessService(self.session, self.user_id, applet_id).get_access(Role.REVIEWER)
-            assert access is not None
+            meta = await roles.get_meta(applet_id, Role.REVIEWER)
+            assert meta is not None
 
-            if str(respondent_id) not in access.meta.get("respondents", []):
+            if str(respondent_id) not in meta.get("respondents", []):
                 raise AnswerAccessDeniedError()
 
     async def get_by_id(
@@ -534,26 +534,22 @@ class AnswerService:
         if not schema.is_reviewable:
             raise ActivityIsNotAssessment()
 
-    async def get_export_data(  # noqa: C901
-        self,
-        applet_id: uuid.UUID,
-        query_params: QueryParams,
-        skip_activities: bool = False,
-    ) -> AnswerExport:
+    async def _get_export_filters(self, applet_id: uuid.UUID, query_params: QueryParams) -> tuple[dict, bool]:
+        """Returns filters of answers the user can export
+        and whether assessments are allowed.
+        """
         assert self.user_id is not None
 
-        access = await UserAppletAccessCRUD(self.session).get_by_roles(
-            self.user_id,
-            applet_id,
-            [Role.OWNER, Role.MANAGER, Role.REVIEWER],
-        )
+        roles = AccessRoles(self.session, self.user_id)
+        role = await roles.get_by_roles(applet_id, [Role.OWNER, Role.MANAGER, Role.REVIEWER])
         assessments_allowed = False
         allowed_respondents = None
-        if not access:
+        if not role:
             allowed_respondents = [self.user_id]
-        elif access.role == Role.REVIEWER:
-            if isinstance(access.reviewer_respondents, list) and len(access.reviewer_respondents) > 0:
-                allowed_respondents = access.reviewer_respondents  # noqa: E501
+        elif role == Role.REVIEWER:
+            meta = await roles.get_meta(applet_id, Role.REVIEWER) or dict()
+            if reviewer_respondents := meta.get("respondents"):
+                allowed_respondents = [uuid.UUID(respondent_id) for respondent_id in reviewer_respondents]
             else:
                 allowed_respondents = [self.user_id]
         else:  # [Role.OWNER, Role.MANAGER]
@@ -566,30 +562,26 @@ class AnswerService:
             else:
                 filters["respondent_ids"] = allowed_respondents
 
-        repository = AnswersCRUD(self.answer_session)
-        answers, total = await repository.get_applet_answers(
-            applet_id,
-            page=query_params.page,
-            limit=query_params.limit,
-            include_assessments=assessments_allowed,
-            **filters,
-        )
-
-        if not answers:
-            return AnswerExport()
+        return filters, assessments_allowed
 
+    async def _fill_export_answers(
+        self,
+        applet_id: uuid.UUID,
+        answers: list[RespondentAnswerData],
+        user_map: dict,
+        flow_map: dict,
+    ) -> None:
+        """Set respondent and flow data of answers.
+        user_map and flow_map are filled only with missing entries,
+        so they can be shared between chunks of one export.
+        """
         respondent_ids: set[uuid.UUID] = set()
-        applet_assessment_ids = set()
-        activity_hist_ids = set()
         flow_hist_ids = set()
         for answer in answers:
-            respondent_ids.add(answer.respondent_id)  # type: ignore[arg-type]
-            if answer.reviewed_answer_id:
-                applet_assessment_ids.add(answer.applet_history_id)
-            if answer.flow_history_id:
+            if answer.respondent_id not in user_map:
+                respondent_ids.add(answer.respondent_id)  # type: ignore[arg-type]
+            if answer.flow_history_id and answer.flow_history_id not in flow_map:
                 flow_hist_ids.add(answer.flow_history_id)
-            if answer.activity_history_id:
-                activity_hist_ids.add(answer.activity_history_id)
 
         flows_coro = FlowsHistoryCRUD(self.session).get_by_id_versions(list(flow_hist_ids))
         user_map_coro = AppletAccessCRUD(self.session).get_respondent_export_data(applet_id, list(respondent_ids))
@@ -603,12 +595,13 @@ class AnswerService:
             if isinstance(res, BaseException):
                 raise res
 
-        flows, user_map = coros_result
-        flow_map = {flow.id_version: flow for flow in flows}  # type: ignore
+        flows, new_user_map = coros_result
+        flow_map.update({flow.id_version: flow for flow in flows})  # type: ignore
+        user_map.update(new_user_map)  # type: ignore
 
         for answer in answers:
             # respondent data
-            respondent = user_map[answer.respondent_id]  # type: ignore
+            respondent = user_map[answer.respondent_id]
             answer.respondent_secret_id = respondent.secret_id
             answer.respondent_email = respondent.email
             answer.is_manager = respondent.is_manager
@@ -618,20 +611,46 @@ class AnswerService:
                 if flow := flow_map.get(flow_id):
                     answer.flow_name = flow.name
 
+    async def _get_export_activities(self, activity_hist_ids: list[str]) -> list[ActivityHistoryFull]:
         repo_local = AnswersCRUD(self.session)
+        activities, items = await asyncio.gather(
+            repo_local.get_activity_history_by_ids(activity_hist_ids),
+            repo_local.get_item_history_by_activity_history(activity_hist_ids),
+        )
+
+        activity_map = {activity.id_version: ActivityHistoryFull.from_orm(activity) for activity in activities}
+        for item in items:
+            activity = activity_map.get(item.activity_id)
+            if activity:
+                activity.items.append(item)
+        return list(activity_map.values())
+
+    async def get_export_data(
+        self,
+        applet_id: uuid.UUID,
+        query_params: QueryParams,
+        skip_activities: bool = False,
+    ) -> AnswerExport:
+        filters, assessments_allowed = await self._get_export_filters(applet_id, query_params)
+
+        repository = AnswersCRUD(self.answer_session)
+        answers, total = await repository.get_applet_answers(
+            applet_id,
+            page=query_params.page,
+            limit=query_params.limit,
+            include_assessments=assessments_allowed,
+            **filters,
+        )
+
+        if not answers:
+            return AnswerExport()
+
+        await self._fill_export_answers(applet_id, answers, dict(), dict())
+
         activities_result = []
         if not skip_activities:
-            activities, items = await asyncio.gather(
-                repo_local.get_activity_history_by_ids(list(activity_hist_ids)),
-                repo_local.get_item_history_by_activity_history(list(activity_hist_ids)),
-            )
-
-            activity_map = {activity.id_version: ActivityHistoryFull.from_orm(activity) for activity in activities}
-            for item in items:
-                activity = activity_map.get(item.activity_id)
-                if activity:
-                    activity.items.append(item)
-            activities_result = list(activity_map.values())
+            activity_hist_ids = {answer.activity_history_id for answer in answers if answer.activity_history_id}
+            activities_result = await self._get_export_activities(list(activity_hist_ids))
 
         return AnswerExport(
             answers=answers,
@@ -639,6 +658,44 @@ class AnswerService:
             total_answers=total,
         )
 
+    async def iter_export_data(
+        self,
+        applet_id: uuid.UUID,
+        query_params: QueryParams,
+        skip_activities: bool = False,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[AnswerExport]:
+        """Iterate over all answers the user can export in chunks.
+        Every chunk contains only activities that were not sent
+        with previous chunks.
+        """
+        filters, assessments_allowed = await self._get_export_filters(applet_id, query_params)
+
+        user_map: dict = dict()
+        flow_map: dict = dict()
+        sent_activity_ids: set[str] = set()
+        chunks = AnswersCRUD(self.answer_session).get_applet_answers_chunks(
+            applet_id,
+            include_assessments=assessments_allowed,
+            chunk_size=chunk_size,
+            **filters,
+        )
+        async for answers in chunks:
+            await self._fill_export_answers(applet_id, answers, user_map, flow_map)
+
+            activities = []
+            if not skip_activities:
+                activity_hist_ids = {
+                    answer.activity_history_id
+                    for answer in answers
+                    if answer.activity_history_id and answer.activity_history_id not in sent_activity_ids
+                }
+                if activity_hist_ids:
+                    activities = await self._get_export_activities(list(activity_hist_ids))
+                    sent_activity_ids.update(activity_hist_ids)
+
+            yield AnswerExport(answers=answers, activities=activities, total_answers=len(answers))
+
     async def get_activity_identifiers(
         self, activity_id: uuid.UUID, respondent_id: uuid.UUID | None
     ) -> list[Identifier]:
@@ -755,10 +812,11 @@ class AnswerService:
         self, applet_id: uuid.UUID, respondent_id: uuid.UUID | None
     ) -> list[SummaryActivity]:
         assert self.user_id
-        role = await AppletAccessCRUD(self.session).get_applets_priority_role(applet_id, self.user_id)
+        roles = AccessRoles(self.session, self.user_id)
+        role = await roles.get_priority_role(applet_id)
         if role == Role.REVIEWER:
-            access = await UserAppletAccessService(self.session, self.user_id, applet_id).get_access(Role.REVIEWER)
-            respondents = access.meta.get("respondents", []) if access else []
+            meta = await roles.get_meta(applet_id, Role.REVIEWER)
+            respondents = meta.get("respondents", []) if meta else []
             if str(respondent_id) not in respondents:
                 raise AnswerAccessDeniedError()
 
@@ -789,17 +847,16 @@ class AnswerService:
         activity_id: uuid.UUID,
         version: str,
         raw_alerts: list[AnswerAlert],
-    ):
+    ) -> tuple[list[UserSchema], list[Row]]:
         if len(raw_alerts) == 0:
-            return
-        cache = RedisCache()
+            return [], []
         persons = await UserAppletAccessCRUD(self.session).get_responsible_persons(applet_id, self.user_id)
-        alert_schemas = []
+        alert_values = []
 
         for person in persons:
             for raw_alert in raw_alerts:
-                alert_schemas.append(
-                    AlertSchema(
+                alert_values.append(
+                    dict(
                         user_id=person.id,
                         respondent_id=self.user_id,
                         is_watched=False,
@@ -811,29 +868,80 @@ class AnswerService:
                         answer_id=answer_id,
                     )
                 )
-        alerts = await AlertCRUD(self.session).create_many(alert_schemas)
+        alerts = await AlertCRUD(self.session).create_many(alert_values)
+        return persons, alerts
+
+    def _alert_messages(self, alerts: list[Row]) -> list[tuple[str, dict]]:
+        return [
+            (
+                f"channel_{alert.user_id}",
+                AlertMessage(
+                    id=alert.id,
+                    respondent_id=self.user_id,
+                    applet_id=alert.applet_id,
+                    version=alert.version,
+                    message=alert.alert_message,
+                    created_at=alert.created_at,
+                    activity_id=alert.activity_id,
+                    activity_item_id=alert.activity_item_id,
+                    answer_id=alert.answer_id,
+                ).dict(),
+            )
+            for alert in alerts
+        ]
 
-        for alert in alerts:
-            channel_id = f"channel_{alert.user_id}"
-            try:
-                await cache.publish(
-                    channel_id,
-                    AlertMessage(
-                        id=alert.id,
-                        respondent_id=self.user_id,
-                        applet_id=applet_id,
-                        version=version,
-                        message=alert.alert_message,
-                        created_at=alert.created_at,
-                        activity_id=alert.activity_id,
-                        activity_item_id=alert.activity_item_id,
-                        answer_id=answer_id,
-                    ).dict(),
+    async def _publish_alerts(self, messages: list[tuple[str, dict]]):
+        try:
+            await RedisCache().publish_many(messages)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+
+    async def _schedule_alert_mails(self, persons: list[User]):
+        """Alerts to one person within the mail window are announced
+        by one email sent at the end of the window.
+        """
+        window = settings.alerts.mail_window
+        if not window:
+            await self.send_alert_mail(persons)
+            return
+
+        # Persons with a pending mail are skipped, keys are set in one round trip
+        keys = {f"alert_mail:{person.id}": person.id for person in persons}
+        is_set = await RedisCache().set_many(dict.fromkeys(keys, "1"), ex=window, nx=True)
+        user_ids = [user_id for user_id, key_is_set in zip(keys.values(), is_set) if key_is_set]
+        if user_ids:
+            await send_alert_mails.kicker().with_labels(delay=window).kiq(user_ids)
+
+    async def notify_answer_submitted(self, answer: AnswerSchema, applet_answer: AppletAnswerCreate):
+        """Enqueue side effects of the committed answer."""
+        await answer_submitted.kiq(
+            AnswerSubmitted(
+                answer_id=answer.id,
+                applet_id=answer.applet_id,
+                activity_id=applet_answer.activity_id,
+                version=answer.version,
+                respondent_id=self.user_id,
+                alerts=applet_answer.alerts,
+            )
+        )
+
+    async def handle_answer_submitted(self, event: AnswerSubmitted):
+        if event.alerts:
+            async with atomic(self.session):
+                persons, alerts = await self._create_alerts(
+                    event.answer_id,
+                    event.applet_id,
+                    event.activity_id,
+                    event.version,
+                    event.alerts,
                 )
-            except Exception as e:
-                sentry_sdk.capture_exception(e)
-                break
-        await self.send_alert_mail(persons)
+                # Rows expire on commit, keep detached copies
+                messages = self._alert_messages(alerts)
+                users = pydantic.parse_obj_as(List[User], persons)
+            await self._publish_alerts(messages)
+            await self._schedule_alert_mails(users)
+        answer = await AnswersCRUD(self.answer_session).get_by_id(event.answer_id)
+        await self.create_report_from_answer(answer)
 
     async def get_completed_answers_data(
         self, applet_id: uuid.UUID, version: str, from_date: datetime.date
@@ -870,11 +978,10 @@ class AnswerService:
         return True
 
     @staticmethod
-    async def send_alert_mail(users: List[UserSchema]):
+    async def send_alert_mail(users: List[User]):
         domain = os.environ.get("ADMIN_DOMAIN", "")
         mail_service = MailingService()
-        schemas = pydantic.parse_obj_as(List[User], users)
-        email_list = [schema.email_encrypted for schema in schemas]
+        email_list = [user.email_encrypted for user in users]
         return await mail_service.send(
             MessageSchema(
                 recipients=email_list,
@@ -910,24 +1017,62 @@ class AnswerService:
         self,
         applet_id: uuid.UUID,
         user_id: uuid.UUID,
-        page=1,
+        after_id: uuid.UUID | None = None,
         limit=1000,
         *,
         old_public_key: list,
         new_public_key: list,
         decryptor: "AnswerEncryptor",
         encryptor: "AnswerEncryptor",
-    ) -> int:
+    ) -> tuple[int, uuid.UUID | None]:
+        """Reencrypt a batch of user answer items ordered by id
+        starting after `after_id`.
+        Returns the number of processed items and the id of the last one.
+        """
         logger.debug(f'Reencryption: Start reencrypt_user_answers for "{applet_id}"')
         repository = AnswersCRUD(self.answer_session)
-        answers = await repository.get_applet_user_answer_items(applet_id, user_id, page, limit)
+        answers = await repository.get_applet_user_answer_items(applet_id, user_id, limit=limit, after_id=after_id)
         count = len(answers)
         if not count:
+            return 0, after_id
+
+        # Decryption and encryption are CPU bound, do not block the loop
+        data_to_update = await asyncio.to_thread(self._reencrypt_items, answers, old_public_key, decryptor, encryptor)
+        if data_to_update:
+            await repository.update_encrypted_fields(json.dumps(new_public_key), data_to_update)
+
+        return count, answers[-1].id
+
+    async def delete_expired_answers(
+        self, applet_id: uuid.UUID, created_before: datetime.datetime, limit: int = 1000
+    ) -> int:
+        """Delete a batch of the oldest applet answers created before
+        the date with their items, notes and alerts.
+        Returns the number of deleted answers.
+        """
+        answer_ids = await AnswersCRUD(self.answer_session).get_ids_created_before(applet_id, created_before, limit)
+        if not answer_ids:
             return 0
 
+        await AnswersCRUD(self.answer_session).delete_by_ids(answer_ids)
+        await AnswerNotesCRUD(self.session).delete_by_answer_ids(answer_ids)
+        await AlertCRUD(self.session).delete_by_answer_ids(applet_id, answer_ids)
+        return len(answer_ids)
+
+    async def count_expired_answers(self, applet_id: uuid.UUID, created_before: datetime.datetime) -> int:
+        return await AnswersCRUD(self.answer_session).count_created_before(applet_id, created_before)
+
+    @classmethod
+    def _reencrypt_items(
+        cls,
+        answers: list[UserAnswerItemData],
+        old_public_key: list,
+        decryptor: "AnswerEncryptor",
+        encryptor: "AnswerEncryptor",
+    ) -> list[AnswerItemDataEncrypted]:
         data_to_update: list[AnswerItemDataEncrypted] = []
         for answer in answers:
-            if not self._is_public_key_match(answer.id, answer.user_public_key, old_public_key):
+            if not cls._is_public_key_match(answer.id, answer.user_public_key, old_public_key):
                 continue
 
             try:
@@ -937,7 +1082,7 @@ class AnswerService:
                     encrypted_events = encryptor.encrypt(decryptor.decrypt(answer.events))
                 if answer.identifier:
                     if answer.migrated_data and answer.migrated_data.get("is_identifier_encrypted") is False:
-                        encrypted_identifier = encrypted_identifier
+                        encrypted_identifier = answer.identifier
                     else:
                         encrypted_identifier = encryptor.encrypt(decryptor.decrypt(answer.identifier))
 
@@ -956,10 +1101,7 @@ class AnswerService:
                 logger.exception(str(e))
                 continue
 
-        if data_to_update:
-            await repository.update_encrypted_fields(json.dumps(new_public_key), data_to_update)
-
-        return count
+        return data_to_update
 
     async def fill_last_activity_workspace_respondent(
         self,
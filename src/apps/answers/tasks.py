@@ -1,18 +1,32 @@
+import asyncio
 import base64
+import datetime
 import io
 import traceback
 import uuid
+from itertools import groupby
+from typing import Callable
 
+import pydantic
 import sentry_sdk
+from dateutil.relativedelta import relativedelta
 from fastapi import UploadFile
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.answers.deps.preprocess_arbitrary import get_arbitrary_info
-from apps.answers.domain import ReportServerResponse
+from apps.answers.domain import AnswerSubmitted, ReportServerResponse
+from apps.applets.crud.applets import AppletsCRUD
+from apps.job.constants import JobStatus
+from apps.job.service import JobService
 from apps.mailing.domain import MessageSchema
 from apps.mailing.services import MailingService
+from apps.users import User, UsersCRUD
+from apps.workspaces.domain.constants import DataRetention
 from broker import broker
-from infrastructure.database import session_manager
+from config import settings
+from infrastructure.database import atomic, session_manager
+from infrastructure.logger import logger
 
 # moved from previous implementation
 
@@ -67,3 +81,156 @@ async def create_report(
     except Exception as e:
         traceback.print_exception(e)
         sentry_sdk.capture_exception(e)
+
+
+@broker.task()
+async def answer_submitted(event: AnswerSubmitted):
+    """Runs side effects of a submitted answer: alerts and reports."""
+    from apps.answers.service import AnswerService
+
+    session_maker = session_manager.get_session()
+    try:
+        async with session_maker() as session:
+            arb_uri = await get_arbitrary_info(event.applet_id, session)
+            if arb_uri:
+                arb_session_maker = session_manager.get_session(arb_uri)
+                async with arb_session_maker() as arb_session:
+                    service = AnswerService(session, event.respondent_id, arb_session)
+                    await service.handle_answer_submitted(event)
+            else:
+                await AnswerService(session, event.respondent_id).handle_answer_submitted(event)
+    except Exception as e:
+        traceback.print_exception(e)
+        sentry_sdk.capture_exception(e)
+
+
+@broker.task()
+async def send_alert_mails(user_ids: list[uuid.UUID]):
+    from apps.answers.service import AnswerService
+
+    session_maker = session_manager.get_session()
+    try:
+        async with session_maker() as session:
+            users = pydantic.parse_obj_as(list[User], await UsersCRUD(session).get_by_ids(user_ids))
+        if users:
+            await AnswerService.send_alert_mail(users)
+    except Exception as e:
+        traceback.print_exception(e)
+        sentry_sdk.capture_exception(e)
+
+
+_RETENTION_DELTAS: dict[DataRetention, Callable[[int], relativedelta]] = {
+    DataRetention.DAYS: lambda period: relativedelta(days=period),
+    DataRetention.WEEKS: lambda period: relativedelta(weeks=period),
+    DataRetention.MONTHS: lambda period: relativedelta(months=period),
+    DataRetention.YEARS: lambda period: relativedelta(years=period),
+}
+
+
+def get_retention_date(now: datetime.datetime, period: int, retention_type: str) -> datetime.datetime:
+    """Returns the date answers created before are expired."""
+    return now - _RETENTION_DELTAS[DataRetention(retention_type)](period)
+
+
+async def _purge_applet_answers(
+    default_session_maker,
+    session_maker,
+    job_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    applet_id: uuid.UUID,
+    created_before: datetime.datetime,
+    dry_run: bool,
+) -> int:
+    from apps.answers.service import AnswerService
+
+    async def _run(method, *args):
+        async with default_session_maker() as session:
+            if session_maker is None:
+                async with atomic(session):
+                    return await method(AnswerService(session), *args)
+            async with session_maker() as arb_session:
+                async with atomic(session):
+                    async with atomic(arb_session):
+                        return await method(AnswerService(session, arbitrary_session=arb_session), *args)
+
+    async def _save_progress(value: int):
+        async with default_session_maker() as session:
+            async with atomic(session):
+                await JobService(session, owner_id).save_checkpoint(job_id, str(applet_id), str(value))
+
+    if dry_run:
+        count = await _run(AnswerService.count_expired_answers, applet_id, created_before)
+        await _save_progress(count)
+        return count
+
+    batch_limit = settings.task_answer_retention.batch_limit
+    purged = 0
+    while True:
+        count = await _run(AnswerService.delete_expired_answers, applet_id, created_before, batch_limit)
+        purged += count
+        await _save_progress(purged)
+        if count < batch_limit:
+            return purged
+        await asyncio.sleep(settings.task_answer_retention.batch_pause)
+
+
+async def _purge_owner_answers(default_session_maker, owner_id: uuid.UUID, applets: list[Row], dry_run: bool):
+    job_name = "purge_expired_answers"
+    now = datetime.datetime.utcnow()
+    async with default_session_maker() as session:
+        job_service = JobService(session, owner_id)
+        async with atomic(session):
+            job = await job_service.get_or_create_owned(job_name, JobStatus.in_progress)
+            if job.status != JobStatus.in_progress:
+                await job_service.change_status(job.id, JobStatus.in_progress)
+            await job_service.update_details(job.id, dict(started_at=now.isoformat(), dry_run=dry_run))
+
+    errors = []
+    for applet in applets:
+        created_before = get_retention_date(now, applet.retention_period, applet.retention_type)
+        try:
+            async with default_session_maker() as session:
+                arb_uri = await get_arbitrary_info(applet.id, session)
+            session_maker = session_manager.get_session(arb_uri) if arb_uri else None
+            count = await _purge_applet_answers(
+                default_session_maker, session_maker, job.id, owner_id, applet.id, created_before, dry_run
+            )
+            action = "expired" if dry_run else "purged"
+            logger.info(f"Answer retention {applet.id}: {count} answers {action}")
+        except Exception as e:
+            msg = f"Answer retention {applet.id}: cannot purge answers, skip"
+            logger.error(msg)
+            logger.exception(str(e))
+            errors.append(msg)
+
+    async with default_session_maker() as session:
+        async with atomic(session):
+            job_service = JobService(session, owner_id)
+            if errors:
+                await job_service.change_status(job.id, JobStatus.error, dict(errors=errors))
+            else:
+                await job_service.change_status(job.id, JobStatus.success)
+
+
+@broker.task(schedule=[{"cron": settings.task_answer_retention.cron}])
+async def purge_expired_answers(dry_run: bool | None = None):
+    """Delete answers older than the data retention of their applets.
+
+    Answers of every applet are deleted from the main or the arbitrary
+    database in batches of the oldest ones with their items, notes and
+    alerts. The number of deleted answers of every applet is stored in the
+    job of the applet owner. In the dry run expired answers are only
+    counted.
+    """
+    if dry_run is None:
+        dry_run = settings.task_answer_retention.dry_run
+
+    default_session_maker = session_manager.get_session()
+    try:
+        async with default_session_maker() as session:
+            applets = await AppletsCRUD(session).get_expiring_retentions()
+        for owner_id, owner_applets in groupby(applets, key=lambda row: row.owner_id):
+            await _purge_owner_answers(default_session_maker, owner_id, list(owner_applets), dry_run)
+    except Exception as e:
+        traceback.print_exception(e)
+        sentry_sdk.capture_exception(e)
@@ -4,6 +4,7 @@ import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.answers.tasks import answer_submitted
 from apps.users.db.schemas import UserSchema
 from apps.workspaces.domain.constants import Role
 from apps.workspaces.service.user_applet_access import UserAppletAccessService
@@ -18,3 +19,17 @@ async def user_reviewer_applet_one(user: UserSchema, session: AsyncSession, mock
         return_value={"respondents": ["7484f34a-3acc-4ee6-8a94-fd7299502fa6"]},
     )
     await srv.add_role(user.id, Role.REVIEWER)
+
+
+@pytest.fixture(autouse=True)
+def answer_submitted_inline(mocker: MockerFixture, mock_get_session):
+    """Answers are not committed in tests, so side effects of submitted
+    answers run within the request with test sessions.
+    Alert emails are sent without waiting for the mail window.
+    """
+    mocker.patch("config.settings.alerts.mail_window", 0)
+
+    async def kiq(*args, **kwargs):
+        await answer_submitted.original_func(*args, **kwargs)
+
+    return mocker.patch("apps.answers.service.answer_submitted.kiq", side_effect=kiq)
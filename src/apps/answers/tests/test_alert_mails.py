@@ -0,0 +1,43 @@
+import uuid
+
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.answers.service import AnswerService
+from apps.answers.tasks import send_alert_mails
+from apps.users import User
+from apps.users.db.schemas import UserSchema
+from infrastructure.utility import RedisCache
+
+
+async def test_alert_mails_coalesced_within_window(
+    mocker: MockerFixture, session: AsyncSession, tom: UserSchema, lucy: UserSchema
+):
+    mocker.patch("config.settings.alerts.mail_window", 60)
+    send_now = mocker.patch("apps.answers.service.AnswerService.send_alert_mail")
+    kicker = mocker.patch("apps.answers.service.send_alert_mails.kicker")
+    kiq = mocker.AsyncMock()
+    kicker.return_value.with_labels.return_value.kiq = kiq
+    set_many = mocker.spy(RedisCache, "set_many")
+    service = AnswerService(session, uuid.uuid4())
+
+    await service._schedule_alert_mails([User.from_orm(tom)])
+    await service._schedule_alert_mails([User.from_orm(tom), User.from_orm(lucy)])
+
+    send_now.assert_not_called()
+    kicker.return_value.with_labels.assert_called_with(delay=60)
+    assert kiq.await_count == 2
+    assert kiq.await_args_list[0].args == ([tom.id],)
+    assert kiq.await_args_list[1].args == ([lucy.id],)
+    # One round trip to Redis per answer
+    assert set_many.call_count == 2
+
+
+async def test_send_alert_mails_task(mocker: MockerFixture, tom: UserSchema):
+    send = mocker.patch("apps.answers.service.AnswerService.send_alert_mail")
+
+    await send_alert_mails.original_func([tom.id])
+
+    send.assert_awaited_once()
+    assert send.await_args is not None
+    assert [user.id for user in send.await_args.args[0]] == [tom.id]
@@ -0,0 +1,155 @@
+import datetime
+import uuid
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.answers.crud import AnswerItemsCRUD
+from apps.answers.crud.answers import AnswersCRUD
+from apps.answers.db.schemas import AnswerItemSchema, AnswerSchema
+from apps.shared.query_params import QueryParams
+
+LARGE_TABLES = {AnswerSchema.__tablename__, AnswerItemSchema.__tablename__}
+
+APPLET_ID = uuid.UUID("8a1a7e8c-43d1-4bd5-a2dc-5e0bd1d9e1a1")
+RESPONDENT_ID = uuid.UUID("8a1a7e8c-43d1-4bd5-a2dc-5e0bd1d9e1a2")
+ACTIVITY_HISTORY_ID = f"{uuid.UUID('8a1a7e8c-43d1-4bd5-a2dc-5e0bd1d9e1a3')}_1.0.0"
+
+
+@pytest.fixture(params=["session", "arbitrary_session"])
+async def answer_session(request) -> AsyncSession:
+    """The main and the arbitrary database seeded with answers."""
+    session = request.getfixturevalue(request.param)
+    now = datetime.datetime.utcnow()
+    for i in range(50):
+        applet_id = APPLET_ID if i % 5 == 0 else uuid.uuid4()
+        respondent_id = RESPONDENT_ID if i % 10 == 0 else uuid.uuid4()
+        created_at = now - datetime.timedelta(days=i)
+        answer = await AnswersCRUD(session).create(
+            AnswerSchema(
+                applet_id=applet_id,
+                version="1.0.0",
+                submit_id=uuid.uuid4(),
+                applet_history_id=f"{applet_id}_1.0.0",
+                activity_history_id=ACTIVITY_HISTORY_ID,
+                respondent_id=respondent_id,
+                client=dict(appId="pytest", appVersion="pytest", width=0, height=0),
+                created_at=created_at,
+            )
+        )
+        await AnswerItemsCRUD(session).create(
+            AnswerItemSchema(
+                answer_id=answer.id,
+                respondent_id=respondent_id,
+                answer="answer",
+                events="events",
+                item_ids=[],
+                identifier="identifier",
+                user_public_key="key",
+                start_datetime=created_at,
+                end_datetime=created_at,
+                scheduled_event_id=str(uuid.uuid4()),
+                local_end_date=created_at.date(),
+                local_end_time=created_at.time(),
+                is_assessment=False,
+            )
+        )
+    return session
+
+
+def _find_seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan["Node Type"] == "Seq Scan" and plan["Relation Name"] in LARGE_TABLES:
+        found.append(plan["Relation Name"])
+    for sub_plan in plan.get("Plans", []):
+        found.extend(_find_seq_scans(sub_plan))
+    return found
+
+
+async def _explain(session: AsyncSession, call: Callable[[], Awaitable]) -> list[tuple[str, dict]]:
+    """Runs the call and returns plans of its select statements."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    connection = await session.connection()
+    # Small tables are cheaper to scan, only statements which can't use
+    # an index are planned with a sequential scan
+    await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plans.append((statement, result.scalar()[0]["Plan"]))
+    return plans
+
+
+@pytest.mark.parametrize(
+    "name,call",
+    (
+        (
+            "get_applet_answers",
+            lambda session: AnswersCRUD(session).get_applet_answers(APPLET_ID, page=1, limit=10),
+        ),
+        (
+            "get_applet_user_answer_items",
+            lambda session: AnswersCRUD(session).get_applet_user_answer_items(APPLET_ID, RESPONDENT_ID, limit=10),
+        ),
+        (
+            "get_answers_by_applet_respondent",
+            lambda session: AnswersCRUD(session).get_answers_by_applet_respondent(RESPONDENT_ID, APPLET_ID),
+        ),
+        (
+            "get_respondents_answered_activities_by_applet_id",
+            lambda session: AnswersCRUD(session).get_respondents_answered_activities_by_applet_id(
+                RESPONDENT_ID, APPLET_ID, datetime.date.today()
+            ),
+        ),
+        (
+            "get_respondents_submit_dates",
+            lambda session: AnswersCRUD(session).get_respondents_submit_dates(
+                RESPONDENT_ID, APPLET_ID, datetime.date.today() - datetime.timedelta(days=7), datetime.date.today()
+            ),
+        ),
+        (
+            "get_completed_answers_data",
+            lambda session: AnswersCRUD(session).get_completed_answers_data(
+                APPLET_ID, "1.0.0", RESPONDENT_ID, datetime.date.today()
+            ),
+        ),
+        (
+            "get_latest_applet_version",
+            lambda session: AnswersCRUD(session).get_latest_applet_version(APPLET_ID),
+        ),
+        (
+            "get_ids_created_before",
+            lambda session: AnswersCRUD(session).get_ids_created_before(APPLET_ID, datetime.datetime.utcnow(), 10),
+        ),
+        (
+            "get_applet_answers_by_activity_id",
+            lambda session: AnswerItemsCRUD(session).get_applet_answers_by_activity_id(
+                APPLET_ID, [ACTIVITY_HISTORY_ID], QueryParams(filters=dict(identifiers=None, empty_identifiers=True))
+            ),
+        ),
+        (
+            "get_answer_ids",
+            lambda session: AnswerItemsCRUD(session).get_answer_ids([uuid.uuid4()]),
+        ),
+    ),
+)
+async def test_answer_queries_do_not_scan_answer_tables(answer_session: AsyncSession, name: str, call):
+    plans = await _explain(answer_session, lambda: call(answer_session))
+
+    assert plans, f"{name} runs no select"
+    for statement, plan in plans:
+        assert not _find_seq_scans(plan), f"{name} scans {_find_seq_scans(plan)}:\n{statement}"
@@ -0,0 +1,166 @@
+import datetime
+import uuid
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.answers.crud import AnswerItemsCRUD
+from apps.answers.crud.answers import AnswersCRUD
+from apps.answers.crud.notes import AnswerNotesCRUD
+from apps.answers.db.schemas import AnswerItemSchema, AnswerNoteSchema, AnswerSchema
+from apps.answers.service import AnswerService
+from apps.answers.tasks import get_retention_date, purge_expired_answers
+from apps.applets.crud import AppletsCRUD
+from apps.applets.domain.applet import AppletDataRetention
+from apps.applets.domain.applet_create_update import AppletCreate
+from apps.applets.domain.applet_full import AppletFull
+from apps.applets.service.applet import AppletService
+from apps.job.constants import JobStatus
+from apps.job.crud import JobCRUD
+from apps.themes.service import ThemeService
+from apps.users.domain import User
+from apps.workspaces.constants import StorageType
+from apps.workspaces.domain.constants import DataRetention
+from apps.workspaces.domain.workspace import WorkspaceArbitraryCreate
+from apps.workspaces.service.workspace import WorkspaceService
+
+
+@pytest.fixture
+async def applet(session: AsyncSession, tom: User, applet_minimal_data: AppletCreate) -> AppletFull:
+    await ThemeService(session, tom.id).get_or_create_default()
+    applet = await AppletService(session, tom.id).create(applet_minimal_data)
+    retention = AppletDataRetention(retention=DataRetention.DAYS, period=1)
+    await AppletsCRUD(session).set_data_retention(applet.id, retention)
+    return applet
+
+
+async def _create_answer(
+    session: AsyncSession, answer_session: AsyncSession, applet: AppletFull, days_ago: int
+) -> uuid.UUID:
+    created_at = datetime.datetime.utcnow() - datetime.timedelta(days=days_ago)
+    activity_id = applet.activities[0].id
+    answer = await AnswersCRUD(answer_session).create(
+        AnswerSchema(
+            applet_id=applet.id,
+            version=applet.version,
+            submit_id=uuid.uuid4(),
+            applet_history_id=f"{applet.id}_{applet.version}",
+            activity_history_id=f"{activity_id}_{applet.version}",
+            created_at=created_at,
+        )
+    )
+    await AnswerItemsCRUD(answer_session).create(
+        AnswerItemSchema(
+            answer_id=answer.id,
+            answer="answer",
+            start_datetime=created_at,
+            end_datetime=created_at,
+        )
+    )
+    await AnswerNotesCRUD(session).save(AnswerNoteSchema(answer_id=answer.id, activity_id=activity_id, note="note"))
+    return answer.id
+
+
+async def _purge(*sessions: AsyncSession, **kwargs):
+    # The task closes its sessions, so uncommitted test data would be lost
+    for session in sessions:
+        await session.commit()
+    await purge_expired_answers.original_func(**kwargs)
+
+
+async def _get_answer_ids(session: AsyncSession, applet: AppletFull) -> set[uuid.UUID]:
+    db_result = await session.execute(select(AnswerSchema.id).where(AnswerSchema.applet_id == applet.id))
+    return set(db_result.scalars().all())
+
+
+@pytest.mark.usefixtures("mock_get_session")
+async def test_purge_expired_answers(session: AsyncSession, tom: User, applet: AppletFull):
+    expired_id = await _create_answer(session, session, applet, days_ago=2)
+    kept_id = await _create_answer(session, session, applet, days_ago=0)
+
+    await _purge(session)
+
+    assert await _get_answer_ids(session, applet) == {kept_id}
+    assert not await AnswerItemsCRUD(session).get_answer_ids([expired_id])
+    assert not await AnswerNotesCRUD(session).get_count_by_answer_id(expired_id, applet.activities[0].id)
+    job = await JobCRUD(session).get_by_name("purge_expired_answers", tom.id)
+    assert job
+    assert job.status == JobStatus.success
+    assert job.details is not None
+    assert job.details == dict(started_at=job.details["started_at"], dry_run=False, checkpoint={str(applet.id): "1"})
+
+
+@pytest.mark.usefixtures("mock_get_session")
+async def test_purge_expired_answers__dry_run(session: AsyncSession, tom: User, applet: AppletFull):
+    expired_id = await _create_answer(session, session, applet, days_ago=2)
+
+    await _purge(session, dry_run=True)
+
+    assert await _get_answer_ids(session, applet) == {expired_id}
+    job = await JobCRUD(session).get_by_name("purge_expired_answers", tom.id)
+    assert job
+    assert job.details is not None
+    assert job.details["dry_run"] is True
+    assert job.details["checkpoint"] == {str(applet.id): "1"}
+
+
+@pytest.mark.usefixtures("mock_get_session")
+async def test_purge_expired_answers__in_batches(
+    session: AsyncSession, tom: User, applet: AppletFull, mocker: MockerFixture
+):
+    mocker.patch("config.settings.task_answer_retention.batch_limit", 1)
+    mocker.patch("config.settings.task_answer_retention.batch_pause", 0)
+    spy = mocker.spy(AnswerService, "delete_expired_answers")
+    for _ in range(3):
+        await _create_answer(session, session, applet, days_ago=2)
+
+    await _purge(session)
+
+    assert not await _get_answer_ids(session, applet)
+    assert spy.call_count == 4
+    job = await JobCRUD(session).get_by_name("purge_expired_answers", tom.id)
+    assert job
+    assert job.details is not None
+    assert job.details["checkpoint"] == {str(applet.id): "3"}
+
+
+@pytest.mark.usefixtures("mock_get_session")
+async def test_purge_expired_answers__arbitrary_server(
+    session: AsyncSession,
+    arbitrary_session: AsyncSession,
+    arbitrary_db_url: str,
+    tom: User,
+    applet: AppletFull,
+):
+    await WorkspaceService(session, tom.id).create_workspace_from_user(tom)
+    await WorkspaceService(session, tom.id).set_arbitrary_server(
+        WorkspaceArbitraryCreate(
+            database_uri=arbitrary_db_url,
+            use_arbitrary=True,
+            storage_access_key="key",
+            storage_secret_key="key",
+            storage_type=StorageType.AWS,
+            storage_region="us-east-1",
+        )
+    )
+    await _create_answer(session, arbitrary_session, applet, days_ago=2)
+    kept_id = await _create_answer(session, arbitrary_session, applet, days_ago=0)
+
+    await _purge(session, arbitrary_session)
+
+    assert await _get_answer_ids(arbitrary_session, applet) == {kept_id}
+
+
+@pytest.mark.parametrize(
+    "period,retention_type,expected",
+    (
+        (2, DataRetention.DAYS, datetime.datetime(2024, 2, 27)),
+        (1, DataRetention.WEEKS, datetime.datetime(2024, 2, 22)),
+        (1, DataRetention.MONTHS, datetime.datetime(2024, 1, 29)),
+        (1, DataRetention.YEARS, datetime.datetime(2023, 2, 28)),
+    ),
+)
+def test_get_retention_date(period: int, retention_type: DataRetention, expected: datetime.datetime):
+    assert get_retention_date(datetime.datetime(2024, 2, 29), period, retention_type) == expected
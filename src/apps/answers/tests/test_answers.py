@@ -1,10 +1,15 @@
 import datetime
 import json
+import uuid
 
 import pytest
 from sqlalchemy import select
 
+from apps.alerts.crud.alert import AlertCRUD
+from apps.answers.crud.answers import AnswersCRUD
 from apps.answers.db.schemas import AnswerSchema
+from apps.answers.domain import AnswerAlert
+from apps.answers.service import AnswerService
 from apps.mailing.services import TestMail
 from apps.shared.test import BaseTest
 from infrastructure.utility import RedisCacheTest
@@ -39,6 +44,7 @@ class TestAnswerActivityItems(BaseTest):
 
     answers_for_activity_url = "/answers/applet/{applet_id}/activities/{activity_id}/answers"
     applet_answers_export_url = "/answers/applet/{applet_id}/data"
+    applet_answers_export_stream_url = "/answers/applet/{applet_id}/data/stream"
     applet_answers_completions_url = "/answers/applet/{applet_id}/completions"
     applets_answers_completions_url = "/answers/applet/completions"
     applet_submit_dates_url = "/answers/applet/{applet_id}/dates"
@@ -51,6 +57,25 @@ class TestAnswerActivityItems(BaseTest):
     answer_note_detail_url = "/answers/applet/{applet_id}/answers/{answer_id}/activities/{activity_id}/notes/{note_id}"  # noqa: E501
     latest_report_url = "/answers/applet/{applet_id}/activities/{activity_id}/answers/{respondent_id}/latest_report"  # noqa: E501
 
+    async def test_create_alerts_in_one_statement(self, session, tom, mocker):
+        applet_id = uuid.UUID("92917a56-d586-4613-b7aa-991f2c4b15b1")
+        raw_alerts = [
+            AnswerAlert(activity_item_id="a18d3409-2c96-4a5e-a1f3-1c1c14be0011", message="first"),
+            AnswerAlert(activity_item_id="a18d3409-2c96-4a5e-a1f3-1c1c14be0014", message="second"),
+        ]
+        execute = mocker.spy(AlertCRUD, "_execute")
+
+        persons, alerts = await AnswerService(session, tom.id)._create_alerts(
+            uuid.uuid4(), applet_id, uuid.UUID("09e3dbf0-aefb-4d0e-9177-bdb321bf3611"), "1.0.0", raw_alerts
+        )
+
+        assert execute.call_count == 1
+        assert len(persons) == 2
+        assert sorted((alert.user_id, alert.alert_message) for alert in alerts) == sorted(
+            (person.id, raw_alert.message) for person in persons for raw_alert in raw_alerts
+        )
+        assert all(alert.respondent_id == tom.id for alert in alerts)
+
     async def test_answer_activity_items_create_for_respondent(self, mock_kiq_report, client, tom):
         await client.login(self.login_url, tom.email_encrypted, "Test1234!")
 
@@ -104,7 +129,7 @@ class TestAnswerActivityItems(BaseTest):
         published_values = published_values or []
         assert len(published_values) == 1
         # 2 because alert for lucy and for tom
-        assert len(RedisCacheTest()._storage) == 2
+        assert len([key for key in RedisCacheTest()._storage if key.startswith("channel_")]) == 2
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].subject == "Response alert"
         # TODO: move to the fixtures with yield
@@ -1108,6 +1133,55 @@ class TestAnswerActivityItems(BaseTest):
         data = response.json()["result"]
         assert not data["answers"]
 
+    async def test_answers_export_stream(self, mock_kiq_report, client, session, tom):
+        await client.login(self.login_url, tom.email_encrypted, "Test1234!")
+
+        applet_id = "92917a56-d586-4613-b7aa-991f2c4b15b1"
+        for submit_id in (
+            "270d86e0-2158-4d18-befd-86b3ce0122ae",
+            "270d86e0-2158-4d18-befd-86b3ce0122af",
+            "270d86e0-2158-4d18-befd-86b3ce0122b0",
+        ):
+            create_data = dict(
+                submit_id=submit_id,
+                applet_id=applet_id,
+                version="1.0.0",
+                activity_id="09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+                answer=dict(
+                    user_public_key="user key",
+                    answer=json.dumps(dict(value="2ba4bb83-ed1c-4140-a225-c2c9b4db66d2", additional_text=None)),
+                    item_ids=["a18d3409-2c96-4a5e-a1f3-1c1c14be0011", "a18d3409-2c96-4a5e-a1f3-1c1c14be0014"],
+                    scheduled_time=1690188679657,
+                    start_time=1690188679657,
+                    end_time=1690188731636,
+                ),
+                client=dict(appId="mindlogger-mobile", appVersion="0.21.48", width=819, height=1080),
+            )
+            response = await client.post(self.answer_url, data=create_data)
+            assert response.status_code == 201
+
+        response = await client.get(self.applet_answers_export_url.format(applet_id=applet_id))
+        assert response.status_code == 200, response.json()
+        expected = response.json()
+
+        response = await client.get(self.applet_answers_export_stream_url.format(applet_id=applet_id))
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        answers = [line["answer"] for line in lines if "answer" in line]
+        activities = [line["activity"] for line in lines if "activity" in line]
+
+        assert lines[-1] == {"count": 3}
+        assert answers == expected["result"]["answers"]
+        assert activities == expected["result"]["activities"]
+
+        # chunks are split by (created_at, id) and keep the order of pages
+        crud = AnswersCRUD(session)
+        paged, _ = await crud.get_applet_answers(uuid.UUID(applet_id), page=1, limit=10)
+        chunks = [chunk async for chunk in crud.get_applet_answers_chunks(uuid.UUID(applet_id), chunk_size=2)]
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert [answer.id for chunk in chunks for answer in chunk] == [answer.id for answer in paged]
+
     async def test_get_identifiers(self, mock_kiq_report, client, tom):
         await client.login(self.login_url, tom.email_encrypted, "Test1234!")
 
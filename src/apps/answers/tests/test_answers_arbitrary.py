@@ -3,6 +3,7 @@ import json
 import uuid
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query
@@ -29,6 +30,12 @@ async def assert_answer_not_exist_on_arbitrary(submit_id: str, session: AsyncSes
     assert not answer
 
 
+@pytest.fixture(autouse=True)
+def answer_submitted_arbitrary(mocker: MockerFixture, arbitrary_db_url: str):
+    """Side effects of submitted answers look for answers on the arbitrary server."""
+    mocker.patch("apps.answers.tasks.get_arbitrary_info", return_value=arbitrary_db_url)
+
+
 class TestAnswerActivityItems(BaseTest):
     fixtures = ["answers/fixtures/arbitrary_server_answers.json"]
 
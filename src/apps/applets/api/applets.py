@@ -1,9 +1,12 @@
 import asyncio
+import hashlib
+import json
 import uuid
 from copy import deepcopy
 
-from fastapi import Body, Depends
+from fastapi import Body, Depends, Header
 from firebase_admin.exceptions import FirebaseError
+from starlette import status
 from starlette.responses import Response as HTTPResponse
 
 from apps.activities.crud import ActivitiesCRUD
@@ -16,9 +19,7 @@ from apps.applets.domain import AppletFolder, AppletName, AppletUniqueName, Publ
 from apps.applets.domain.applet import (
     AppletActivitiesBaseInfo,
     AppletDataRetention,
-    AppletRetrieveResponse,
     AppletSingleLanguageDetailForPublic,
-    AppletSingleLanguageDetailPublic,
     AppletSingleLanguageInfoPublic,
 )
 from apps.applets.domain.applet_create_update import (
@@ -84,36 +85,49 @@ async def applet_list(
     )
 
 
+def _document_response(content: bytes, etag: str, if_none_match: str | None) -> HTTPResponse:
+    """Serve the serialized document as is, without validation of the
+    response model.
+    """
+    if if_none_match:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if etag in tags or "*" in tags:
+            return HTTPResponse(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return HTTPResponse(content=content, media_type="application/json", headers={"ETag": etag})
+
+
 async def applet_retrieve(
     applet_id: uuid.UUID,
     user: User = Depends(get_current_user),
     language: str = Depends(get_language),
     session=Depends(get_session),
-) -> Response[AppletSingleLanguageDetailPublic]:
+    if_none_match: str | None = Header(None),
+) -> HTTPResponse:
     async with atomic(session):
         service = AppletService(session, user.id)
         await service.exist_by_id(applet_id)
         await CheckAccessService(session, user.id).check_applet_detail_access(applet_id)
-        applet_future = service.get_single_language_by_id(applet_id, language)
+        document_future = service.get_single_language_document(applet_id, language)
         nickname_future = UserAppletAccessService(session, user.id, applet_id).get_nickname()
-        futures = await asyncio.gather(applet_future, nickname_future)
-    return AppletRetrieveResponse(
-        result=AppletSingleLanguageDetailPublic.from_orm(futures[0]),
-        respondent_meta={"nickname": futures[1]},
-    )
+        document, nickname = await asyncio.gather(document_future, nickname_future)
+    respondent_meta = json.dumps({"nickname": nickname})
+    content = b'{"result":' + document.content + b',"respondentMeta":' + respondent_meta.encode() + b"}"
+    etag = f'"{hashlib.sha1((document.etag + respondent_meta).encode()).hexdigest()}"'
+    return _document_response(content, etag, if_none_match)
 
 
 async def applet_retrieve_by_key(
     key: str,
     language: str = Depends(get_language),
     session=Depends(get_session),
-) -> Response[AppletSingleLanguageDetailForPublic]:
+    if_none_match: str | None = Header(None),
+) -> HTTPResponse:
     key_guid = convert_link_key(key)
     async with atomic(session):
         service = AppletService(session, uuid.UUID("00000000-0000-0000-0000-000000000000"))
         await service.exist_by_key(key_guid)
-        applet = await service.get_single_language_by_key(key_guid, language)
-    return Response(result=AppletSingleLanguageDetailForPublic.from_orm(applet))
+        document = await service.get_single_language_document_by_key(key_guid, language)
+    return _document_response(b'{"result":' + document.content + b"}", document.etag, if_none_match)
 
 
 async def applet_create(
@@ -143,6 +157,12 @@ async def applet_update(
         await service.exist_by_id(applet_id)
         await CheckAccessService(session, user.id).check_applet_edit_access(applet_id)
         applet = await service.update(applet_id, schema)
+    try:
+        async with atomic(session):
+            await service.warm_single_language_documents(applet_id)
+    except Exception as e:
+        # Documents are rendered on request
+        logger.exception(e)
     try:
         await service.send_notification_to_applet_respondents(
             applet_id,
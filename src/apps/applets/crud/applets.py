@@ -4,12 +4,13 @@ import uuid
 from typing import Any
 
 from sqlalchemy import and_, case, distinct, false, literal, null, or_, select, text, true, update
-from sqlalchemy.engine import Result
+from sqlalchemy.engine import Result, Row
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Query
 from sqlalchemy.sql.functions import count, func
 
 from apps.activities.db.schemas import ActivitySchema
+from apps.activity_flows.db.schemas import ActivityFlowSchema
 from apps.applets import errors
 from apps.applets.db.schemas import AppletSchema
 from apps.applets.domain import Role
@@ -22,9 +23,11 @@ from apps.shared.ordering import Ordering
 from apps.shared.paging import paging
 from apps.shared.query_params import QueryParams
 from apps.shared.searching import Searching
+from apps.themes.db.schemas import ThemeSchema
 from apps.users import UserSchema
 from apps.users.db.schemas import UserDeviceSchema
 from apps.workspaces.db.schemas import UserAppletAccessSchema
+from apps.workspaces.domain.constants import DataRetention
 from infrastructure.database.crud import BaseCRUD
 
 __all__ = ["AppletsCRUD"]
@@ -153,6 +156,33 @@ class AppletsCRUD(BaseCRUD[AppletSchema]):
 
         return db_result.scalars().first()
 
+    async def get_document_stamp(self, applet_id: uuid.UUID) -> str:
+        """Returns a stamp of rows the single language applet document is
+        built from. Any change of the applet, its theme, activities or
+        flows gives a new stamp.
+        """
+
+        def _changes(schema) -> Query:
+            query: Query = select(func.concat(count(schema.id), "/", func.max(schema.updated_at)))
+            query = query.where(schema.applet_id == applet_id)
+            return query.scalar_subquery()
+
+        query: Query = select(
+            AppletSchema.version,
+            AppletSchema.updated_at,
+            ThemeSchema.updated_at,
+            _changes(ActivitySchema),
+            _changes(ActivityFlowSchema),
+        )
+        query = query.outerjoin(ThemeSchema, ThemeSchema.id == AppletSchema.theme_id)
+        query = query.where(AppletSchema.id == applet_id)
+
+        db_result = await self._execute(query)
+        row = db_result.first()
+        if not row:
+            raise AppletNotFoundError(key="id", value=str(applet_id))
+        return ":".join(str(value) for value in row)
+
     async def get_applets_by_roles(
         self,
         user_id: uuid.UUID,
@@ -279,6 +309,34 @@ class AppletsCRUD(BaseCRUD[AppletSchema]):
         )
         await self._execute(query)
 
+    async def get_expiring_retentions(self) -> list[Row]:
+        """Returns id, owner_id, retention_period and retention_type
+        of applets which keep answers for a limited time.
+        """
+        query: Query = select(
+            AppletSchema.id,
+            UserAppletAccessSchema.owner_id,
+            AppletSchema.retention_period,
+            AppletSchema.retention_type,
+        )
+        query = query.join(
+            UserAppletAccessSchema,
+            and_(
+                UserAppletAccessSchema.applet_id == AppletSchema.id,
+                UserAppletAccessSchema.role == Role.OWNER,
+                UserAppletAccessSchema.soft_exists(),
+            ),
+        )
+        query = query.where(
+            AppletSchema.retention_period > 0,
+            AppletSchema.retention_type.in_(
+                [DataRetention.DAYS, DataRetention.WEEKS, DataRetention.MONTHS, DataRetention.YEARS]
+            ),
+        )
+        query = query.order_by(UserAppletAccessSchema.owner_id, AppletSchema.id)
+        db_result = await self._execute(query)
+        return db_result.all()
+
     async def publish_by_id(self, applet_id: uuid.UUID):
         query: Query = update(AppletSchema)
         query = query.where(AppletSchema.id == applet_id)
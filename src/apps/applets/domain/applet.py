@@ -130,6 +130,13 @@ class AppletRetrieveResponse(Response[AppletSingleLanguageDetailPublic]):
     respondent_meta: dict | None = None
 
 
+class AppletDocument(InternalModel):
+    """Serialized public applet detail with its ETag."""
+
+    content: bytes
+    etag: str
+
+
 class AppletActivitiesDetailsPublic(PublicModel):
     activities_details: list[ActivityLanguageWithItemsMobileDetailPublic] = Field(default_factory=list)
     applet_detail: AppletSingleLanguageDetailMobilePublic
@@ -1,6 +1,7 @@
 import asyncio
 import re
 import uuid
+from typing import Awaitable, Callable
 
 from apps.activities.crud import ActivitiesCRUD, ActivityItemsCRUD
 from apps.activities.domain.activity_create import ActivityCreate, ActivityItemCreate
@@ -19,7 +20,13 @@ from apps.applets.domain import (
     AppletSingleLanguageInfo,
     Role,
 )
-from apps.applets.domain.applet import Applet, AppletDataRetention
+from apps.applets.domain.applet import (
+    Applet,
+    AppletDataRetention,
+    AppletDocument,
+    AppletSingleLanguageDetailForPublic,
+    AppletSingleLanguageDetailPublic,
+)
 from apps.applets.domain.applet_create_update import AppletCreate, AppletReportConfiguration, AppletUpdate
 from apps.applets.domain.applet_duplicate import AppletDuplicate
 from apps.applets.domain.applet_full import AppletFull
@@ -33,8 +40,10 @@ from apps.applets.errors import (
     AppletsFolderAccessDenied,
 )
 from apps.applets.service.applet_history_service import AppletHistoryService
+from apps.applets.service.cache import AppletDocumentCache
 from apps.folders.crud import FolderAppletCRUD, FolderCRUD
 from apps.schedule.service import ScheduleService
+from apps.shared.domain import PublicModel
 from apps.shared.version import (
     INITIAL_VERSION,
     VERSION_DIFFERENCE_ACTIVITY,
@@ -42,6 +51,7 @@ from apps.shared.version import (
     VERSION_DIFFERENCE_MINOR,
 )
 from apps.themes.service import ThemeService
+from apps.users.cruds.user_device import UserDevicesCRUD
 from apps.users.services.user import UserService
 from apps.workspaces.errors import AppletEncryptionUpdateDenied
 from apps.workspaces.service.user_applet_access import UserAppletAccessService
@@ -53,6 +63,7 @@ __all__ = [
 ]
 
 from apps.shared.query_params import QueryParams
+from infrastructure.database import atomic
 from infrastructure.utility import FCMNotification, FirebaseMessage, FirebaseNotificationType
 
 
@@ -163,8 +174,6 @@ class AppletService:
 
         next_version = await self.get_next_version(old_applet_schema.version, update_data, applet_id)
 
-        await FlowService(self.session).remove_applet_flows(applet_id)
-        await ActivityService(self.session, self.user_id).remove_applet_activities(applet_id)
         applet = await self._update(applet_id, update_data, next_version)
         applet.activities = await ActivityService(self.session, self.user_id).update_create(
             applet_id, update_data.activities
@@ -521,6 +530,55 @@ class AppletService:
         applet.activity_flows = await FlowService(self.session).get_single_language_by_applet_id(applet.id, language)
         return applet
 
+    async def _get_document(
+        self,
+        kind: str,
+        applet_id: uuid.UUID,
+        language: str,
+        render: Callable[[], Awaitable[PublicModel]],
+    ) -> AppletDocument:
+        stamp = await AppletsCRUD(self.session).get_document_stamp(applet_id)
+        cache = AppletDocumentCache()
+        key = cache.build_key(kind, applet_id, language, stamp)
+        content = await cache.get(key)
+        if content is None:
+            document = await render()
+            content = document.json(by_alias=True).encode()
+            await cache.set(key, content)
+        return AppletDocument(content=content, etag=cache.build_etag(key))
+
+    async def get_single_language_document(self, applet_id: uuid.UUID, language: str) -> AppletDocument:
+        """Returns serialized AppletSingleLanguageDetailPublic. Documents
+        are rendered once per change of the applet and language.
+        """
+
+        async def _render():
+            applet = await self.get_single_language_by_id(applet_id, language)
+            return AppletSingleLanguageDetailPublic.from_orm(applet)
+
+        return await self._get_document("detail", applet_id, language, _render)
+
+    async def get_single_language_document_by_key(self, key: uuid.UUID, language: str) -> AppletDocument:
+        """Returns serialized AppletSingleLanguageDetailForPublic."""
+        schema = await AppletsCRUD(self.session).get_by_key(key)
+        if not schema:
+            raise AppletNotFoundError(key="key", value=str(key))
+
+        async def _render():
+            applet = await self.get_single_language_by_key(key, language)
+            return AppletSingleLanguageDetailForPublic.from_orm(applet)
+
+        return await self._get_document("public", schema.id, language, _render)
+
+    async def warm_single_language_documents(self, applet_id: uuid.UUID):
+        """Render documents in all languages of the applet description,
+        so respondents notified about a change get prepared documents.
+        """
+        schema = await AppletsCRUD(self.session).get_by_id(applet_id)
+        languages = {settings.default_language, *(schema.description or dict())}
+        for language in sorted(languages):
+            await self.get_single_language_document(applet_id, language)
+
     async def get_by_id_for_duplicate(self, applet_id: uuid.UUID) -> AppletDuplicate:
         schema = await AppletsCRUD(self.session).get_by_id(applet_id)
         theme = None
@@ -707,7 +765,7 @@ class AppletService:
             device_ids = []
         respondents_device_ids = await AppletsCRUD(self.session).get_respondents_device_ids(applet_id, respondent_ids)
         respondents_device_ids += device_ids
-        await FCMNotification().notify(
+        unregistered = await FCMNotification().notify(
             respondents_device_ids,
             FirebaseMessage(
                 title=title,
@@ -718,6 +776,9 @@ class AppletService:
                 ),
             ),
         )
+        if unregistered:
+            async with atomic(self.session):
+                await UserDevicesCRUD(self.session).remove_devices(unregistered)
 
     async def get_info_by_id(self, applet_id: uuid.UUID, language: str) -> AppletActivitiesBaseInfo:
         schema = await AppletsCRUD(self.session).get_by_id(applet_id)
@@ -0,0 +1,46 @@
+import hashlib
+import uuid
+
+from config import settings
+from infrastructure.logger import logger
+from infrastructure.utility import RedisCache
+
+__all__ = ["AppletDocumentCache"]
+
+
+class AppletDocumentCache:
+    """Serialized single language applet documents.
+
+    A document is stored under the stamp of the rows it is built from,
+    see `AppletsCRUD.get_document_stamp`. A change of the applet gives
+    a new stamp, so documents are never invalidated, documents of
+    previous stamps expire.
+
+    The example of keys:
+        __class__.__name__:<kind>:<applet_id>:<language>:<stamp hash>
+    """
+
+    def __init__(self):
+        self.redis_client = RedisCache()
+        self.default_ttl = settings.applets.document_ttl
+
+    def build_key(self, kind: str, applet_id: uuid.UUID, language: str, stamp: str) -> str:
+        stamp_hash = hashlib.sha1(stamp.encode()).hexdigest()
+        return f"{self.__class__.__name__}:{kind}:{applet_id}:{language}:{stamp_hash}"
+
+    @staticmethod
+    def build_etag(key: str) -> str:
+        return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+    async def get(self, key: str) -> bytes | None:
+        content = await self.redis_client.get(key)
+        if isinstance(content, str):
+            content = content.encode()
+        return content
+
+    async def set(self, key: str, content: bytes):
+        try:
+            await self.redis_client.set(key, content, ex=self.default_ttl)
+        except Exception as e:
+            # The document is rendered once more next time
+            logger.exception(e)
@@ -1136,6 +1136,35 @@ class TestApplet(BaseTest):
         assert len(result["activityFlows"][0]["activityIds"]) == 1
         assert len(result["activityFlows"][1]["activityIds"]) == 1
 
+    async def test_applet_detail_not_modified(self, client, tom):
+        await client.login(self.login_url, tom.email_encrypted, "Test1234!")
+        url = self.applet_detail_url.format(pk="92917a56-d586-4613-b7aa-991f2c4b15b1")
+        response = await client.get(url)
+        assert response.status_code == http.HTTPStatus.OK
+        etag = response.headers["ETag"]
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+
+        response = await client.post(
+            self.applet_report_config_url.format(pk="92917a56-d586-4613-b7aa-991f2c4b15b1"),
+            dict(report_server_ip="ipaddress", report_public_key="public key", report_recipients=[]),
+        )
+        assert response.status_code == http.HTTPStatus.OK, response.json()
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == http.HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+        assert response.json()["result"]["reportServerIp"] == "ipaddress"
+
+    async def test_public_applet_detail_not_modified(self, client):
+        url = self.public_applet_detail_url.format(key="51857e10-6c05-4fa8-a2c8-725b8c1a0aa6")
+        response = await client.get(url)
+        assert response.status_code == http.HTTPStatus.OK
+
+        response = await client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+        assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+
     async def test_creating_applet_history(self, client, tom):
         await client.login(self.login_url, tom.email_encrypted, "Test1234!")
         create_data = dict(
@@ -0,0 +1,72 @@
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.activities.crud import ActivitiesCRUD, ActivityItemsCRUD
+from apps.applets.domain.applet_create_update import AppletCreate, AppletUpdate
+from apps.applets.domain.applet_full import AppletFull
+from apps.applets.service.applet import AppletService
+from apps.shared.enums import Language
+from apps.themes.service import ThemeService
+from apps.users.domain import User
+
+
+@pytest.fixture
+async def applet(session: AsyncSession, tom: User, applet_minimal_data: AppletCreate) -> AppletFull:
+    await ThemeService(session, tom.id).get_or_create_default()
+    return await AppletService(session, tom.id).create(applet_minimal_data)
+
+
+def _update_data(applet_minimal_data: AppletCreate, applet: AppletFull) -> AppletUpdate:
+    data = AppletUpdate(**applet_minimal_data.dict(exclude_unset=True))
+    for activity, stored_activity in zip(data.activities, applet.activities):
+        activity.id = stored_activity.id
+        for item, stored_item in zip(activity.items, stored_activity.items):
+            item.id = stored_item.id
+    return data
+
+
+async def test_update__unchanged_rows_are_not_written(
+    session: AsyncSession, tom: User, applet: AppletFull, applet_minimal_data: AppletCreate, mocker: MockerFixture
+):
+    data = _update_data(applet_minimal_data, applet)
+    data.description = {Language.ENGLISH: "changed"}
+    activities_spy = mocker.spy(ActivitiesCRUD, "update_changed")
+    items_spy = mocker.spy(ActivityItemsCRUD, "update_changed")
+    create_spy = mocker.spy(ActivityItemsCRUD, "create_many")
+    delete_spy = mocker.spy(ActivityItemsCRUD, "delete_by_ids")
+
+    updated = await AppletService(session, tom.id).update(applet.id, data)
+
+    assert activities_spy.spy_return == []
+    assert items_spy.spy_return == []
+    assert create_spy.call_args.args[1] == []
+    delete_spy.assert_not_called()
+    assert updated.version == "1.1.1"
+    assert updated.activities[0].id == applet.activities[0].id
+    assert [item.id for item in updated.activities[0].items] == [item.id for item in applet.activities[0].items]
+
+
+async def test_update__changed_new_and_removed_items(
+    session: AsyncSession, tom: User, applet: AppletFull, applet_minimal_data: AppletCreate
+):
+    service = AppletService(session, tom.id)
+    data = _update_data(applet_minimal_data, applet)
+    data.activities[0].name = "changed"
+    new_item = data.activities[0].items[0].copy(update=dict(id=None, name="second"))
+    data.activities[0].items.append(new_item)
+
+    updated = await service.update(applet.id, data)
+
+    assert updated.activities[0].name == "changed"
+    first_item, second_item = updated.activities[0].items
+    assert first_item.id == applet.activities[0].items[0].id
+    assert second_item.name == "second"
+
+    data.activities[0].items = [new_item.copy(update=dict(id=second_item.id))]
+    updated = await service.update(applet.id, data)
+
+    stored_items = await ActivityItemsCRUD(session).get_by_activity_id(applet.activities[0].id)
+    assert [item.id for item in stored_items] == [second_item.id]
+    assert [item.id for item in updated.activities[0].items] == [second_item.id]
+    assert stored_items[0].order == 1
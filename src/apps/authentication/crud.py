@@ -1,5 +1,8 @@
 import datetime
 
+from sqlalchemy import cast, delete, func, select
+from sqlalchemy.dialects.postgresql import REGCLASS
+
 from apps.authentication.db.schemas import TokenBlacklistSchema
 from apps.authentication.domain.token import InternalToken, TokenPurpose
 from infrastructure.database import BaseCRUD
@@ -21,3 +24,26 @@ class TokenBlacklistCRUD(BaseCRUD):
 
     async def exists(self, token: InternalToken) -> bool:
         return await self.exist_by_key("jti", token.payload.jti)
+
+    async def get_not_expired(self) -> list[tuple[str, datetime.datetime]]:
+        query = select(TokenBlacklistSchema.jti, TokenBlacklistSchema.exp)
+        query = query.where(TokenBlacklistSchema.exp > datetime.datetime.utcnow())
+        db_result = await self._execute(query)
+        return db_result.all()
+
+    async def delete_expired(self, limit: int) -> int:
+        """Deletes a batch of expired tokens.
+        Returns the number of deleted tokens.
+        """
+        expired = select(TokenBlacklistSchema.id)
+        expired = expired.where(TokenBlacklistSchema.exp < datetime.datetime.utcnow())
+        expired = expired.limit(limit)
+        query = delete(TokenBlacklistSchema).where(TokenBlacklistSchema.id.in_(expired.scalar_subquery()))
+        db_result = await self._execute(query)
+        return db_result.rowcount
+
+    async def get_table_size(self) -> int:
+        """Returns the size of the table with its indexes in bytes."""
+        query = select(func.pg_total_relation_size(cast(TokenBlacklistSchema.__tablename__, REGCLASS)))
+        db_result = await self._execute(query)
+        return db_result.scalar()
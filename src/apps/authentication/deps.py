@@ -12,6 +12,7 @@ from apps.authentication.errors import AuthenticationError
 from apps.authentication.services import AuthenticationService
 from apps.users.cruds.user import UsersCRUD
 from apps.users.domain import User
+from apps.users.services.last_seen import last_seen_buffer
 from config import settings
 from infrastructure.database import atomic
 from infrastructure.database.deps import get_session
@@ -88,14 +89,13 @@ async def get_current_user(
     token: InternalToken = Depends(get_current_token()),
     session=Depends(get_session),
 ) -> User:
-    async with atomic(session):
-        # Check if the token is in the blacklist
-        revoked = await AuthenticationService(session).is_revoked(token)
-        if revoked:
-            raise AuthenticationError
+    # Check if the token is in the blacklist
+    revoked = await AuthenticationService(session).is_revoked(token)
+    if revoked:
+        raise AuthenticationError
 
-        user = await UsersCRUD(session).get_by_id(id_=token.payload.sub)
-        await UsersCRUD(session).update_last_seen_by_id(token.payload.sub)
+    user = await UsersCRUD(session).get_by_id(id_=token.payload.sub)
+    last_seen_buffer.touch(user.id)
 
     return user
 
@@ -2,6 +2,7 @@ import datetime
 
 from apps.authentication.crud import TokenBlacklistCRUD
 from apps.authentication.domain.token import InternalToken, TokenPurpose
+from apps.authentication.services.revocation import token_revocation_filter
 
 __all__ = ["TokensService"]
 
@@ -11,6 +12,8 @@ class TokensService:
         self.session = session
 
     async def is_revoked(self, token: InternalToken) -> bool:
+        if token_revocation_filter.is_ready and not token_revocation_filter.contains(token.payload.jti):
+            return False
         return await TokenBlacklistCRUD(self.session).exists(token)
 
     async def revoke(self, token: InternalToken, type_: TokenPurpose) -> None:
@@ -21,3 +24,4 @@ class TokensService:
             revoked = await self.is_revoked(token)
             if not revoked:
                 await TokenBlacklistCRUD(self.session).create(token, type_)
+                token_revocation_filter.publish_after_commit(self.session, token.payload.jti, token.payload.exp)
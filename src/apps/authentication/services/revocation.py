@@ -0,0 +1,151 @@
+import asyncio
+import datetime
+import json
+import time
+from contextlib import suppress
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from apps.authentication.crud import TokenBlacklistCRUD
+from config import settings
+from infrastructure.database import session_manager
+from infrastructure.logger import logger
+from infrastructure.utility import RedisCache
+
+__all__ = ["TokenRevocationFilter", "token_revocation_filter"]
+
+_REVOKED_KEY = "revoked_tokens"
+_publish_tasks: set[asyncio.Task] = set()
+
+
+class TokenRevocationFilter:
+    """In-process set of revoked and not yet expired token ids.
+
+    The set is loaded from the token blacklist and kept in sync between
+    processes with Redis pub/sub, so while the filter is ready checking
+    a token does not touch the database, only a token found in the set is
+    confirmed by the database. Revocations are published after the commit
+    of their transaction. Every `resync_interval` seconds
+    the set is reloaded from the database to recover lost messages.
+    Until the filter is ready callers have to check the database.
+    """
+
+    channel = "token_revocations"
+    reconnect_delay = 5
+
+    def __init__(self, resync_interval: int):
+        self.resync_interval = resync_interval
+        self._revoked: dict[str, int] = {}
+        # Tokens added while the filter is loaded from the database
+        self._added_during_sync: dict[str, int] | None = None
+        self._subscribed = False
+        self._synced_at: float | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def is_ready(self) -> bool:
+        return self._subscribed and self._synced_at is not None
+
+    def add(self, jti: str, exp: int) -> None:
+        self._revoked[jti] = exp
+        if self._added_during_sync is not None:
+            self._added_during_sync[jti] = exp
+
+    def contains(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    async def publish(self, jti: str, exp: int) -> None:
+        self.add(jti, exp)
+        try:
+            await RedisCache().publish(self.channel, dict(jti=jti, exp=exp))
+        except Exception as e:
+            # Other processes will get the token on the next resync.
+            logger.exception(f"Failed to publish revoked token: {e}")
+
+    def publish_after_commit(self, session, jti: str, exp: int) -> None:
+        """Publishes the token once the session transaction is committed."""
+        session.info.setdefault(_REVOKED_KEY, []).append((self, jti, exp))
+
+    async def sync(self) -> None:
+        self._added_during_sync = {}
+        try:
+            session_maker = session_manager.get_session()
+            async with session_maker() as session:
+                rows = await TokenBlacklistCRUD(session).get_not_expired()
+            revoked = {jti: int(exp.replace(tzinfo=datetime.timezone.utc).timestamp()) for jti, exp in rows}
+            # Tokens revoked while the query was running are kept.
+            revoked.update(self._added_during_sync)
+        finally:
+            self._added_during_sync = None
+        self._revoked = revoked
+        self._synced_at = time.monotonic()
+
+    async def _listen(self) -> None:
+        async for message in RedisCache().messages(self.channel):
+            if message["type"] == "subscribe":
+                # Sync only after subscribing to not miss revocations
+                # made during loading.
+                self._subscribed = True
+                await self.sync()
+            elif message["type"] == "message":
+                data = json.loads(message["data"])
+                self.add(data["jti"], data["exp"])
+
+    async def _run_listener(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except Exception as e:
+                logger.exception(f"Token revocation subscription failed: {e}")
+            self._subscribed = False
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _run_resync(self) -> None:
+        while True:
+            await asyncio.sleep(self.resync_interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                self._synced_at = None
+                logger.exception(f"Failed to sync revoked tokens: {e}")
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run_listener()),
+                asyncio.create_task(self._run_resync()),
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._subscribed = False
+        self._synced_at = None
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session):
+    revoked = session.info.pop(_REVOKED_KEY, None)
+    if not revoked:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for revocation_filter, jti, exp in revoked:
+        revocation_filter.add(jti, exp)
+        task = loop.create_task(revocation_filter.publish(jti, exp))
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_revoked(session: Session):
+    session.info.pop(_REVOKED_KEY, None)
+
+
+token_revocation_filter = TokenRevocationFilter(settings.authentication.revoked_tokens_resync_interval)
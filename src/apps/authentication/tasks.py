@@ -0,0 +1,45 @@
+import asyncio
+import time
+import traceback
+
+import sentry_sdk
+
+from apps.authentication.crud import TokenBlacklistCRUD
+from broker import broker
+from config import settings
+from infrastructure.database import atomic, session_manager
+from infrastructure.logger import logger
+
+
+@broker.task(schedule=[{"cron": settings.task_token_blacklist_compaction.cron}])
+async def compact_token_blacklist():
+    """Delete expired tokens from the token blacklist in batches.
+
+    Expired tokens are rejected by their expiration check, so keeping them
+    only grows the jti index. The number of deleted tokens, the purge
+    throughput and the table size are logged.
+    """
+    batch_limit = settings.task_token_blacklist_compaction.batch_limit
+    session_maker = session_manager.get_session()
+    deleted = 0
+    started_at = time.monotonic()
+    try:
+        while True:
+            async with session_maker() as session:
+                async with atomic(session):
+                    count = await TokenBlacklistCRUD(session).delete_expired(batch_limit)
+            deleted += count
+            if count < batch_limit:
+                break
+            await asyncio.sleep(settings.task_token_blacklist_compaction.batch_pause)
+
+        elapsed = time.monotonic() - started_at
+        async with session_maker() as session:
+            size = await TokenBlacklistCRUD(session).get_table_size()
+        logger.info(
+            f"Token blacklist compaction: {deleted} tokens deleted in {elapsed:.2f}s "
+            f"({deleted / elapsed if elapsed else 0:.0f} tokens/s), table size {size} bytes"
+        )
+    except Exception as e:
+        traceback.print_exception(e)
+        sentry_sdk.capture_exception(e)
@@ -0,0 +1,57 @@
+import time
+import uuid
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.authentication.crud import TokenBlacklistCRUD
+from apps.authentication.db.schemas import TokenBlacklistSchema
+from apps.authentication.domain.token import InternalToken, TokenPayload, TokenPurpose
+from apps.authentication.tasks import compact_token_blacklist
+from apps.users.domain import User
+
+
+async def _create_tokens(session: AsyncSession, user: User, exp: int, count: int) -> list[str]:
+    jtis = []
+    for _ in range(count):
+        token = InternalToken(payload=TokenPayload(sub=user.id, exp=exp, jti=str(uuid.uuid4())))
+        await TokenBlacklistCRUD(session).create(token, TokenPurpose.ACCESS)
+        jtis.append(token.payload.jti)
+    return jtis
+
+
+async def _get_jtis(session: AsyncSession) -> set[str]:
+    db_result = await session.execute(select(TokenBlacklistSchema.jti))
+    return set(db_result.scalars().all())
+
+
+async def test_delete_expired_tokens_in_batch(session: AsyncSession, user: User):
+    now = int(time.time())
+    await _create_tokens(session, user, now - 3600, 3)
+    active = await _create_tokens(session, user, now + 3600, 1)
+    crud = TokenBlacklistCRUD(session)
+
+    assert await crud.delete_expired(2) == 2
+    assert await crud.delete_expired(2) == 1
+    assert await crud.delete_expired(2) == 0
+    assert await _get_jtis(session) == set(active)
+    assert await crud.get_table_size() > 0
+
+
+@pytest.mark.usefixtures("mock_get_session")
+async def test_compact_token_blacklist(session: AsyncSession, user: User, mocker: MockerFixture):
+    mocker.patch("config.settings.task_token_blacklist_compaction.batch_limit", 2)
+    mocker.patch("config.settings.task_token_blacklist_compaction.batch_pause", 0)
+    spy = mocker.spy(TokenBlacklistCRUD, "delete_expired")
+    now = int(time.time())
+    await _create_tokens(session, user, now - 3600, 5)
+    active = await _create_tokens(session, user, now + 3600, 1)
+    # The task closes its sessions, so uncommitted test data would be lost
+    await session.commit()
+
+    await compact_token_blacklist.original_func()
+
+    assert await _get_jtis(session) == set(active)
+    assert spy.call_count == 3
@@ -0,0 +1,95 @@
+import datetime
+import time
+import uuid
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.authentication.crud import TokenBlacklistCRUD
+from apps.authentication.domain.token import InternalToken, TokenPayload, TokenPurpose
+from apps.authentication.services import TokensService
+from apps.authentication.services.revocation import TokenRevocationFilter
+from apps.users.domain import User
+
+
+def _token(user: User, exp: int) -> InternalToken:
+    return InternalToken(payload=TokenPayload(sub=user.id, exp=exp, jti=str(uuid.uuid4())))
+
+
+@pytest.fixture
+def revocation_filter(mocker: MockerFixture) -> TokenRevocationFilter:
+    revocation_filter = TokenRevocationFilter(resync_interval=60)
+    mocker.patch("apps.authentication.services.core.token_revocation_filter", new=revocation_filter)
+    return revocation_filter
+
+
+@pytest.mark.usefixtures("mock_get_session")
+async def test_sync_loads_not_expired_tokens(user: User, session: AsyncSession, revocation_filter):
+    now = int(time.time())
+    active = _token(user, now + 3600)
+    expired = _token(user, now - 3600)
+    crud = TokenBlacklistCRUD(session)
+    await crud.create(active, TokenPurpose.ACCESS)
+    await crud.create(expired, TokenPurpose.ACCESS)
+    revocation_filter._subscribed = True
+
+    await revocation_filter.sync()
+
+    assert revocation_filter.is_ready
+    assert revocation_filter.contains(active.payload.jti)
+    assert not revocation_filter.contains(expired.payload.jti)
+
+
+@pytest.mark.usefixtures("mock_get_session")
+async def test_sync_drops_tokens_missing_in_database(user: User, revocation_filter):
+    revocation_filter._subscribed = True
+    stale = _token(user, int(time.time()) + 3600)
+    revocation_filter.add(stale.payload.jti, stale.payload.exp)
+
+    await revocation_filter.sync()
+
+    assert not revocation_filter.contains(stale.payload.jti)
+
+
+async def test_is_revoked__ready_filter_queries_database_only_for_found_tokens(
+    user: User, session: AsyncSession, mocker: MockerFixture, revocation_filter
+):
+    revocation_filter._subscribed = True
+    revocation_filter._synced_at = time.monotonic()
+    revoked = _token(user, int(time.time()) + 3600)
+    stale = _token(user, int(time.time()) + 3600)
+    await TokenBlacklistCRUD(session).create(revoked, TokenPurpose.ACCESS)
+    revocation_filter.add(revoked.payload.jti, revoked.payload.exp)
+    revocation_filter.add(stale.payload.jti, stale.payload.exp)
+    exists = mocker.spy(TokenBlacklistCRUD, "exists")
+
+    service = TokensService(session)
+    assert not await service.is_revoked(_token(user, int(time.time()) + 3600))
+    exists.assert_not_called()
+    assert await service.is_revoked(revoked)
+    assert not await service.is_revoked(stale)
+    assert exists.call_count == 2
+
+
+async def test_revoke_adds_token_to_filter_after_commit(user: User, session: AsyncSession, revocation_filter):
+    exp = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+    token = _token(user, int(exp.replace(tzinfo=datetime.timezone.utc).timestamp()))
+
+    await TokensService(session).revoke(token, TokenPurpose.ACCESS)
+    assert not revocation_filter.contains(token.payload.jti)
+    await session.commit()
+
+    assert revocation_filter.contains(token.payload.jti)
+    assert await TokenBlacklistCRUD(session).exists(token)
+
+
+async def test_revoke_rolled_back_is_not_added_to_filter(user: User, session: AsyncSession, revocation_filter):
+    exp = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+    token = _token(user, int(exp.replace(tzinfo=datetime.timezone.utc).timestamp()))
+
+    await TokensService(session).revoke(token, TokenPurpose.ACCESS)
+    await session.rollback()
+    await session.commit()
+
+    assert not revocation_filter.contains(token.payload.jti)
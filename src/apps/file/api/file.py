@@ -36,9 +36,9 @@ from apps.shared.domain.response import Response, ResponseMulti
 from apps.shared.exception import NotFoundError
 from apps.users.domain import User
 from apps.users.services.user import UserService
-from apps.workspaces.crud.user_applet_access import UserAppletAccessCRUD
 from apps.workspaces.domain.constants import Role
 from apps.workspaces.errors import AnswerViewAccessDenied
+from apps.workspaces.service.access_roles import AccessRoles
 from apps.workspaces.service.user_access import UserAccessService
 from config import settings
 from infrastructure.database.deps import get_session
@@ -171,8 +171,7 @@ async def answer_upload(
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> Response[AnswerUploadedFile]:
-    if not await UserAppletAccessCRUD(session).get_by_roles(
-        user.id,
+    if not await AccessRoles(session, user.id).has_any_for_applet(
         applet_id,
         [Role.OWNER, Role.MANAGER, Role.REVIEWER, Role.RESPONDENT],
     ):
@@ -246,8 +245,7 @@ async def check_file_uploaded(
 ) -> ResponseMulti[FileExistenceResponse]:
     """Provides the information if the files is uploaded."""
 
-    if not await UserAppletAccessCRUD(session).get_by_roles(
-        user.id,
+    if not await AccessRoles(session, user.id).has_any_for_applet(
         applet_id,
         [Role.OWNER, Role.MANAGER, Role.REVIEWER, Role.RESPONDENT],
     ):
@@ -377,8 +375,7 @@ async def generate_presigned_answer_url(
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> Response[PresignedUrl]:
-    if not await UserAppletAccessCRUD(session).get_by_roles(
-        user.id,
+    if not await AccessRoles(session, user.id).has_any_for_applet(
         applet_id,
         [Role.OWNER, Role.MANAGER, Role.REVIEWER, Role.RESPONDENT],
     ):
@@ -1,7 +1,7 @@
-import asyncio
 import datetime
 import re
 import uuid
+from collections import defaultdict
 from logging import INFO, WARNING
 from typing import List
 
@@ -11,11 +11,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
 from apps.file.domain import LogFileExistenceResponse
-from apps.file.storage import select_storage
+from apps.file.storage import get_storage_by_info
 from apps.workspaces.db.schemas import UserAppletAccessSchema
 from apps.workspaces.domain.constants import Role
 from apps.workspaces.domain.workspace import WorkspaceArbitrary
-from apps.workspaces.service import workspace
 from apps.workspaces.service.user_access import UserAccessService
 from config import settings
 from infrastructure.dependency.cdn import get_legacy_bucket
@@ -38,20 +37,37 @@ class S3PresignService:
     check_access_to_regular_url_pattern = r"\/([0-9a-fA-F-]+)\/([0-9a-fA-F-]+)\/"
     check_access_to_legacy_url_pattern = r"\/([0-9a-fA-F]+)\/([0-9a-fA-F]+)\/"
 
+    REGULAR = "regular"
+    LEGACY = "legacy"
+
+    @classmethod
+    def _compile_patterns(cls):
+        """Compiles the patterns of a class once, on its first instance."""
+        if "_key_re" in cls.__dict__:
+            return
+        cls._key_re = re.compile(cls.key_pattern)
+        cls._legacy_file_url_re = re.compile(cls.legacy_file_url_pattern)
+        cls._regular_file_url_re = re.compile(cls.regular_file_url_pattern)
+        cls._check_access_to_regular_url_re = re.compile(cls.check_access_to_regular_url_pattern)
+        cls._check_access_to_legacy_url_re = re.compile(cls.check_access_to_legacy_url_pattern)
+
     def __init__(
         self,
         session: AsyncSession,
         user_id: uuid.UUID,
         applet_id: uuid.UUID,
         access: UserAppletAccessSchema | None,
+        arbitrary_info: WorkspaceArbitrary | None,
     ):
         self.session = session
         self.user_id = user_id
         self.applet_id = applet_id
         self.access = access
+        self.arbitrary_info = arbitrary_info
+        self._compile_patterns()
 
     async def get_regular_client(self) -> CDNClient:
-        return await select_storage(applet_id=self.applet_id, session=self.session)
+        return get_storage_by_info(self.arbitrary_info)
 
     async def get_legacy_client(self, info: WorkspaceArbitrary | None) -> CDNClient:
         if not info:
@@ -59,50 +75,59 @@ class S3PresignService:
         else:
             return await self.get_regular_client()
 
-    async def _presign(self, url: str | None):
-        if not url:
-            return
+    async def _get_client(self, client_type: str) -> CDNClient:
+        if client_type == self.LEGACY:
+            return await self.get_legacy_client(self.arbitrary_info)
+        return await self.get_regular_client()
 
+    def _classify(self, url: str) -> tuple[str, str] | None:
+        """Returns the type of the client and the key to sign the url with
+        or None if the url must be returned as is.
+        """
         if self._is_legacy_file_url_format(url):
-            if not await self._check_access_to_legacy_url(url):
-                return url
-            key = self._get_key(url)
-            wsp_service = workspace.WorkspaceService(self.session, self.user_id)
-            arbitrary_info = await wsp_service.get_arbitrary_info(self.applet_id)
-            legacy_cdn_client = await self.get_legacy_client(arbitrary_info)
-            return await legacy_cdn_client.generate_presigned_url(key)
+            if not self._check_access_to_legacy_url(url):
+                return None
+            return self.LEGACY, self._get_key(url)
         elif self._is_regular_file_url_format(url):
-            if not await self._check_access_to_regular_url(url):
-                return url
-            key = self._get_key(url)
-            client = await self.get_regular_client()
-            return await client.generate_presigned_url(key)
-        else:
-            return url
-
-    async def presign(self, urls: List[str | None]) -> List[str]:
-        c_list = []
-        for url in urls:
-            c_list.append(self._presign(url))
-        result = await asyncio.gather(*c_list)
+            if not self._check_access_to_regular_url(url):
+                return None
+            return self.REGULAR, self._get_key(url)
+        return None
+
+    async def presign(self, urls: List[str | None]) -> List[str | None]:
+        """Presign urls of the applet.
+        Storage clients are resolved once per call and every client signs
+        its keys with one batch.
+        """
+        result = list(urls)
+        keys_to_sign: dict[str, list[tuple[int, str]]] = defaultdict(list)
+        for i, url in enumerate(urls):
+            if not url:
+                continue
+            if classified := self._classify(url):
+                client_type, key = classified
+                keys_to_sign[client_type].append((i, key))
+
+        for client_type, indexed_keys in keys_to_sign.items():
+            client = await self._get_client(client_type)
+            signed_urls = await client.generate_presigned_urls([key for _, key in indexed_keys])
+            for (i, _), signed_url in zip(indexed_keys, signed_urls):
+                result[i] = signed_url
         return result
 
     def _get_key(self, url):
-        pattern = self.key_pattern
-        result = re.sub(pattern, "", url)
-        return result
+        return self._key_re.sub("", url)
 
     def _is_legacy_file_url_format(self, url):
-        match = re.search(self.legacy_file_url_pattern, url)
+        match = self._legacy_file_url_re.search(url)
         return bool(match)
 
     def _is_regular_file_url_format(self, url):
-        match = re.search(self.regular_file_url_pattern, url)
+        match = self._regular_file_url_re.search(url)
         return bool(match)
 
-    async def _check_access_to_regular_url(self, url):
-        pattern = self.check_access_to_regular_url_pattern
-        match = re.search(pattern, url)
+    def _check_access_to_regular_url(self, url):
+        match = self._check_access_to_regular_url_re.search(url)
         user_id, applet_id = match.group(1), match.group(2)
 
         if self.user_id == user_id:
@@ -117,9 +142,8 @@ class S3PresignService:
             return True
         return False
 
-    async def _check_access_to_legacy_url(self, url):
-        pattern = self.check_access_to_legacy_url_pattern
-        match = re.search(pattern, url)
+    def _check_access_to_legacy_url(self, url):
+        match = self._check_access_to_legacy_url_re.search(url)
         if not match:
             return False
         applet_id = mongoid_to_uuid(match.group(2))
@@ -137,18 +161,15 @@ class GCPPresignService(S3PresignService):
         r"gs:\/\/[a-zA-Z0-9.-]+\/[a-zA-Z0-9-]+\/[a-zA-Z0-9-]+\/[a-f0-9-]+\/[a-f0-9-]+\/[a-zA-Z0-9-]+"  # noqa
     )
 
-    async def _presign(self, url: str | None):
-        regular_cdn_client = await select_storage(applet_id=self.applet_id, session=self.session)
-
+    def _classify(self, url: str) -> tuple[str, str] | None:
         if self._is_legacy_file_url_format(url):
-            if not await self._check_access_to_legacy_url(url):
-                return url
+            if not self._check_access_to_legacy_url(url):
+                return None
         elif self._is_regular_file_url_format(url):
-            if not await self._check_access_to_regular_url(url):
-                return url
+            if not self._check_access_to_regular_url(url):
+                return None
 
-        key = self._get_key(url)
-        return await regular_cdn_client.generate_presigned_url(key)
+        return self.REGULAR, self._get_key(url)
 
 
 class AzurePresignService(GCPPresignService):
@@ -156,13 +177,13 @@ class AzurePresignService(GCPPresignService):
     check_access_to_regular_url_pattern = r"\/([0-9a-fA-F-]+)\/([0-9a-fA-F-]+)"
 
     async def __call__(self, url):
-        regular_cdn_client = await select_storage(applet_id=self.applet_id, session=self.session)
+        regular_cdn_client = await self.get_regular_client()
         if self._is_legacy_file_url_format(url):
-            if not await self._check_access_to_legacy_url(url):
+            if not self._check_access_to_legacy_url(url):
                 return url
             key = self._get_legacy_key(url)
         elif self._is_regular_file_url_format(url):
-            if not await self._check_access_to_regular_url(url):
+            if not self._check_access_to_regular_url(url):
                 return url
             key = self._get_regular_key(url)
         else:
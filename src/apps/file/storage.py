@@ -3,6 +3,7 @@ import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.workspaces.constants import StorageType
+from apps.workspaces.domain.workspace import WorkspaceArbitrary
 from apps.workspaces.service import workspace
 from config import settings
 from infrastructure.utility.cdn_arbitrary import ArbitraryAzureCdnClient, ArbitraryGCPCdnClient, ArbitraryS3CdnClient
@@ -16,6 +17,11 @@ async def select_storage(
 ):
     service = workspace.WorkspaceService(session, uuid.uuid4())
     info = await service.get_arbitrary_info(applet_id)
+    return get_storage_by_info(info)
+
+
+def get_storage_by_info(info: WorkspaceArbitrary | None):
+    """Returns a client of the arbitrary storage or of the default one."""
     if not info:
         config_cdn = CdnConfig(
             endpoint_url=settings.cdn.endpoint_url,
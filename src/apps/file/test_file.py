@@ -1,3 +1,4 @@
+import asyncio
 import http
 import io
 import uuid
@@ -9,16 +10,18 @@ from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query
 
+import apps.file.services
 from apps.file.enums import FileScopeEnum
-from apps.file.services import LogFileService
+from apps.file.services import LogFileService, S3PresignService
 from apps.shared.test import BaseTest
 from apps.shared.test.client import TestClient
 from apps.users.domain import User
 from apps.workspaces.constants import StorageType
-from apps.workspaces.db.schemas import UserWorkspaceSchema
+from apps.workspaces.db.schemas import UserAppletAccessSchema, UserWorkspaceSchema
+from apps.workspaces.domain.constants import Role
 from apps.workspaces.errors import AnswerViewAccessDenied
 from config import settings
-from infrastructure.utility.cdn_client import CDNClient
+from infrastructure.utility.cdn_client import CDNClient, CDNExecutor
 from infrastructure.utility.cdn_config import CdnConfig
 
 
@@ -227,3 +230,48 @@ class TestAnswerActivityItems(BaseTest):
             ),
         ).key(device_tom, file_name)
         assert key == expected_key
+
+
+def test_cdn_clients_are_shared_by_credentials():
+    config = CdnConfig(region="region", bucket="bucket", secret_key="secret_key", access_key="access_key")
+    other_bucket = CdnConfig(region="region", bucket="other", secret_key="secret_key", access_key="access_key")
+    other_key = CdnConfig(region="region", bucket="bucket", secret_key="other_key", access_key="access_key")
+
+    client = CDNClient(config, "env").client
+
+    assert CDNClient(other_bucket, "env").client is client
+    assert CDNClient(other_key, "env").client is not client
+
+
+async def test_cdn_executor_runs_blocking_calls():
+    executor = CDNExecutor(max_workers=2)
+
+    results = await asyncio.gather(*(executor.run(pow, i, 2) for i in range(5)))
+
+    assert results == [0, 1, 4, 9, 16]
+    assert executor.stats["submitted"] == 5
+    assert executor.stats["in_flight"] == 0
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(divmod, 1, 0)
+    assert executor.stats["failed"] == 1
+    executor.shutdown()
+
+
+async def test_presign_resolves_storage_once(mocker: MockerFixture):
+    applet_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    access = UserAppletAccessSchema(role=Role.OWNER, meta={})
+    service = S3PresignService(mocker.MagicMock(), user_id, applet_id, access, None)
+    get_storage = mocker.spy(apps.file.services, "get_storage_by_info")
+    own_urls = [f"s3://bucket/mindlogger/answer/{uuid.uuid4()}/{applet_id}/file{i}" for i in range(3)]
+    foreign_url = f"s3://bucket/mindlogger/answer/{uuid.uuid4()}/{uuid.uuid4()}/file"
+
+    result = await service.presign([None, "https://example.com/image.png", *own_urls, foreign_url])
+
+    assert result[:2] == [None, "https://example.com/image.png"]
+    for url, signed_url in zip(own_urls, result[2:5]):
+        assert signed_url is not None
+        assert signed_url != url
+        assert url.removeprefix("s3://bucket/") in signed_url
+    assert result[5] == foreign_url
+    get_storage.assert_called_once_with(None)
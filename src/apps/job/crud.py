@@ -1,6 +1,7 @@
 import uuid
 
-from sqlalchemy import select, update
+from sqlalchemy import Text, case, cast, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 
 from apps.job.db.schemas import JobSchema
 from apps.job.domain import Job, JobCreate
@@ -37,3 +38,32 @@ class JobCRUD(BaseCRUD[JobSchema]):
         job_schema = db_result.first()
 
         return Job.from_orm(job_schema)
+
+    @staticmethod
+    def _as_object(value):
+        # None is stored as JSON null
+        return case((func.jsonb_typeof(value) == "object", value), else_=func.jsonb_build_object())
+
+    @classmethod
+    def merged_details(cls, details: dict):
+        """SQL expression of stored details updated with given keys."""
+        return cls._as_object(JobSchema.details).op("||")(cast(details, JSONB))
+
+    async def save_checkpoint(self, id_: uuid.UUID, key: str, value: str) -> None:
+        """Set details["checkpoint"][key] to the value.
+        The update is done in place, so concurrent checkpoints
+        of different keys do not override each other.
+        """
+        checkpoint = self._as_object(JobSchema.details["checkpoint"]).op("||")(
+            func.jsonb_build_object(cast(key, Text), cast(value, Text))
+        )
+        query = (
+            update(JobSchema)
+            .where(JobSchema.id == id_)
+            .values(
+                details=self._as_object(JobSchema.details).op("||")(
+                    func.jsonb_build_object(cast("checkpoint", Text), checkpoint)
+                )
+            )
+        )
+        await self._execute(query)
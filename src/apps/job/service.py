@@ -40,7 +40,14 @@ class JobService:
         return True
 
     async def change_status(self, id_: uuid.UUID, status: JobStatus, details: dict | None = None) -> Job:
+        """Change the job status, given details are merged into stored ones."""
         data: dict[str, Any] = dict(status=status)
         if details:
-            data["details"] = details
+            data["details"] = JobCRUD.merged_details(details)
         return await JobCRUD(self.session).update(id_, **data)
+
+    async def update_details(self, id_: uuid.UUID, details: dict | None) -> Job:
+        return await JobCRUD(self.session).update(id_, details=details)
+
+    async def save_checkpoint(self, id_: uuid.UUID, key: str, value: str) -> None:
+        await JobCRUD(self.session).save_checkpoint(id_, key, value)
@@ -49,3 +49,14 @@ async def test_get_job_by_name__job_does_not_exist_with_creator_id(
     crud = JobCRUD(session)
     j = await crud.get_by_name(job.name, uuid_zero)
     assert j is None
+
+
+async def test_save_checkpoint__keeps_other_details(job: JobSchema, session: AsyncSession):
+    crud = JobCRUD(session)
+    await crud.update(job.id, details=dict(run_id="run"))
+    await crud.save_checkpoint(job.id, "first", "1")
+    await crud.save_checkpoint(job.id, "second", "2")
+    await crud.save_checkpoint(job.id, "first", "done")
+    j = await crud.get_by_name(job.name, job.creator_id)
+    assert j
+    assert j.details == dict(run_id="run", checkpoint=dict(first="done", second="2"))
@@ -85,3 +85,10 @@ async def test_get_or_create_owned__get_existing_job(session: AsyncSession, job:
     srv = JobService(session, job.creator_id)
     j = await srv.get_or_create_owned(job.name)
     assert j.id == job.id
+
+
+async def test_change_status__details_are_merged(job: JobSchema, session: AsyncSession) -> None:
+    srv = JobService(session, job.creator_id)
+    await srv.update_details(job.id, dict(run_id="run"))
+    job_updated = await srv.change_status(job.id, JobStatus.error, details=dict(errors=["error"]))
+    assert job_updated.details == dict(run_id="run", errors=["error"])
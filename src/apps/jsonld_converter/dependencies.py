@@ -1,23 +1,37 @@
+from functools import lru_cache
 from typing import Callable
 
-from cachetools import LRUCache
 from fastapi import Depends
 from pyld import ContextResolver
-from pyld.jsonld import requests_document_loader
 
 from apps.jsonld_converter.service import JsonLDModelConverter, ModelJsonLDConverter
+from apps.jsonld_converter.service.loader import CachedDocumentLoader, SharedContextCache
 from config import settings
 
 
+@lru_cache
 def get_document_loader() -> Callable:
-    return requests_document_loader()
+    return CachedDocumentLoader(
+        cache_dir=settings.jsonld_converter.document_cache_dir,
+        offline=settings.jsonld_converter.offline,
+        cache_size=settings.jsonld_converter.document_cache_size,
+        ttl=settings.jsonld_converter.document_cache_ttl,
+        max_connections=settings.jsonld_converter.max_connections,
+        timeout=settings.jsonld_converter.request_timeout,
+    )
+
+
+@lru_cache
+def _get_resolved_context_cache() -> SharedContextCache:
+    return SharedContextCache(maxsize=settings.jsonld_converter.context_cache_size)
 
 
 def get_context_resolver(
     document_loader: Callable = Depends(get_document_loader),
 ) -> ContextResolver:
-    _resolved_context_cache: LRUCache = LRUCache(maxsize=100)
-    return ContextResolver(_resolved_context_cache, document_loader)
+    # The resolver keeps contexts of one conversion, resolved static
+    # contexts are shared by all resolvers
+    return ContextResolver(_get_resolved_context_cache(), document_loader)
 
 
 def get_jsonld_model_converter(
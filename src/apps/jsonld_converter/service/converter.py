@@ -37,8 +37,8 @@ class JsonLDModelConverter(ContainsNestedMixin):
     Converters json-ld document to internal model
 
     :example:
-        document_loader = requests_document_loader()  # sync loader
-        _resolved_context_cache = LRUCache(maxsize=100)
+        document_loader = CachedDocumentLoader()  # sync loader
+        _resolved_context_cache = SharedContextCache(maxsize=100)
         context_resolver = ContextResolver(
             _resolved_context_cache, document_loader
         )
@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import string
+import threading
+import urllib.parse as urllib_parse
+from pathlib import Path
+
+import requests
+from cachetools import LRUCache, TTLCache
+from pyld.jsonld import LINK_HEADER_REL, JsonLdError, parse_link_header
+from requests.adapters import HTTPAdapter
+
+from infrastructure.logger import logger
+
+__all__ = ["CachedDocumentLoader", "SharedContextCache"]
+
+_ACCEPT = "application/ld+json, application/json"
+
+
+class SharedContextCache(LRUCache):
+    """Resolved contexts shared by context resolvers of all conversions.
+
+    pyld resolves contexts in worker threads, so access is serialized.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize=maxsize)
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+
+    def get(self, key, default=None):
+        with self._lock:
+            return super().get(key, default)
+
+
+class CachedDocumentLoader:
+    """pyld document loader shared by all conversions of the process.
+
+    Loaded documents are kept in memory and, if cache_dir is set, on disk
+    keyed by URL. After ttl a document is revalidated with its ETag. In
+    offline mode documents are served from cache_dir only. Every URL is
+    fetched by one thread at a time, at most max_connections documents
+    are fetched at the same time.
+
+    Documents are loaded as static, so contexts resolved from them are
+    kept in the shared context cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        offline: bool = False,
+        cache_size: int = 1000,
+        ttl: int = 3600,
+        max_connections: int = 8,
+        timeout: int = 30,
+    ):
+        if offline and not cache_dir:
+            raise ValueError("Offline document loader requires the cache directory")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.offline = offline
+        self.timeout = timeout
+        self._entries: TTLCache = TTLCache(maxsize=cache_size, ttl=ttl)
+        self._lock = threading.Lock()
+        self._url_locks: dict[str, threading.Lock] = {}
+        self._connections = threading.BoundedSemaphore(max_connections)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_connections)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
+    def __call__(self, url: str, options: dict | None = None) -> dict:
+        try:
+            entry = self._get_entry(url, (options or {}).get("headers"))
+        except JsonLdError:
+            raise
+        except Exception as e:
+            raise JsonLdError(
+                "Could not retrieve a JSON-LD document from the URL.",
+                "jsonld.LoadDocumentError",
+                {"url": url},
+                code="loading document failed",
+                cause=e,
+            )
+        return {
+            "contentType": entry["content_type"],
+            "contextUrl": entry["context_url"],
+            "documentUrl": entry["document_url"],
+            # pyld changes loaded contexts in place
+            "document": json.loads(entry["content"]),
+            "tag": "static",
+        }
+
+    def _get_entry(self, url: str, headers: dict | None) -> dict:
+        with self._lock:
+            if (entry := self._entries.get(url)) is not None:
+                return entry
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+
+        with url_lock:
+            try:
+                with self._lock:
+                    if (entry := self._entries.get(url)) is not None:
+                        return entry
+                entry = self._load(url, headers)
+                with self._lock:
+                    self._entries[url] = entry
+            finally:
+                with self._lock:
+                    self._url_locks.pop(url, None)
+        return entry
+
+    def _load(self, url: str, headers: dict | None) -> dict:
+        self._validate_url(url)
+        stored = self._read(url)
+        if self.offline:
+            if stored is None:
+                raise JsonLdError(
+                    "URL could not be dereferenced; the document is missing in the offline cache.",
+                    "jsonld.LoadDocumentError",
+                    {"url": url},
+                    code="loading document failed",
+                )
+            return stored
+
+        headers = dict(headers or {"Accept": _ACCEPT})
+        if stored and stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        try:
+            with self._connections:
+                response = self._http.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            if stored is None:
+                raise
+            logger.warning(f"Document {url} is served from the cache: {e}")
+            return stored
+
+        if response.status_code == 304 and stored is not None:
+            return stored
+        response.raise_for_status()
+        entry = self._build_entry(url, response)
+        self._write(url, entry)
+        return entry
+
+    @staticmethod
+    def _validate_url(url: str):
+        pieces = urllib_parse.urlparse(url)
+        if (
+            not all([pieces.scheme, pieces.netloc])
+            or pieces.scheme not in ["http", "https"]
+            or set(pieces.netloc) > set(string.ascii_letters + string.digits + "-.:")
+        ):
+            raise JsonLdError(
+                'URL could not be dereferenced; only "http" and "https" URLs are supported.',
+                "jsonld.InvalidUrl",
+                {"url": url},
+                code="loading document failed",
+            )
+
+    @staticmethod
+    def _build_entry(url: str, response: requests.Response) -> dict:
+        content_type = response.headers.get("content-type") or "application/octet-stream"
+        context_url = None
+        link_header = response.headers.get("link")
+        if link_header and content_type != "application/ld+json":
+            linked_context = parse_link_header(link_header).get(LINK_HEADER_REL)
+            # only 1 related link header permitted
+            if isinstance(linked_context, list):
+                raise JsonLdError(
+                    "URL could not be dereferenced, it has more than one associated HTTP Link Header.",
+                    "jsonld.LoadDocumentError",
+                    {"url": url},
+                    code="multiple context link headers",
+                )
+            if linked_context:
+                context_url = linked_context["target"]
+        content = response.text
+        # Fail before the broken document is cached
+        json.loads(content)
+        return dict(
+            url=url,
+            etag=response.headers.get("etag"),
+            content_type=content_type,
+            context_url=context_url,
+            document_url=response.url,
+            content=content,
+        )
+
+    def _get_path(self, url: str) -> Path | None:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _read(self, url: str) -> dict | None:
+        path = self._get_path(url)
+        if not path or not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cached document {url} can't be read: {e}")
+            return None
+        return entry if entry.get("url") == url else None
+
+    def _write(self, url: str, entry: dict):
+        path = self._get_path(url)
+        if not path:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # The document is loaded once more next time
+            logger.warning(f"Document {url} can't be cached: {e}")
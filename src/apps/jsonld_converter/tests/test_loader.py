@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from pyld.jsonld import JsonLdError
+from pytest_mock import MockerFixture
+
+from apps.jsonld_converter.service.loader import CachedDocumentLoader
+
+URL = "https://raw.githubusercontent.com/ChildMindInstitute/reproschema-context/master/context.json"
+DOCUMENT = {"@context": {"schema": "http://schema.org/"}}
+
+
+def _response(mocker: MockerFixture, status_code: int = 200, etag: str = '"v1"'):
+    return mocker.Mock(
+        status_code=status_code,
+        text=json.dumps(DOCUMENT),
+        url=URL,
+        headers={"content-type": "application/json", "etag": etag},
+    )
+
+
+def test_document_is_fetched_once(mocker: MockerFixture, tmp_path):
+    get = mocker.patch("requests.Session.get", return_value=_response(mocker))
+    loader = CachedDocumentLoader(cache_dir=str(tmp_path))
+
+    first = loader(URL)
+    first["document"]["@context"].clear()
+    second = loader(URL)
+
+    assert get.call_count == 1
+    assert second["document"] == DOCUMENT
+    assert second["documentUrl"] == URL
+
+
+def test_expired_document_is_revalidated_with_etag(mocker: MockerFixture, tmp_path):
+    get = mocker.patch("requests.Session.get", return_value=_response(mocker))
+    CachedDocumentLoader(cache_dir=str(tmp_path))(URL)
+
+    get.return_value = _response(mocker, status_code=304)
+    loaded = CachedDocumentLoader(cache_dir=str(tmp_path))(URL)
+
+    assert get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert loaded["document"] == DOCUMENT
+
+
+def test_offline_loader_serves_cache_directory(mocker: MockerFixture, tmp_path):
+    mocker.patch("requests.Session.get", return_value=_response(mocker))
+    CachedDocumentLoader(cache_dir=str(tmp_path))(URL)
+    get = mocker.patch("requests.Session.get")
+    loader = CachedDocumentLoader(cache_dir=str(tmp_path), offline=True)
+
+    assert loader(URL)["document"] == DOCUMENT
+    with pytest.raises(JsonLdError):
+        loader(f"{URL}?missing")
+    get.assert_not_called()
@@ -1,6 +1,7 @@
+import re
 import uuid
 
-from sqlalchemy import Unicode, or_, select
+from sqlalchemy import false, func, literal_column, select
 from sqlalchemy.orm import Query
 
 from apps.applets.db.schemas import AppletHistorySchema
@@ -30,17 +31,26 @@ class LibraryCRUD(BaseCRUD[LibrarySchema]):
         schema = await self._get("applet_id_version", applet_id_version)
         return schema
 
+    @staticmethod
+    def _search_query(search: str):
+        """Every word of the search matches a word prefix of keywords."""
+        words = re.findall(r"\w+", search)
+        if not words:
+            return None
+        return func.to_tsquery(literal_column("'simple'"), " & ".join(f"{word}:*" for word in words))
+
+    @staticmethod
+    def _filter_by_search(query: Query, ts_query) -> Query:
+        if ts_query is None:
+            return query.where(false())
+        return query.where(LibrarySchema.search_tsv.op("@@")(ts_query))
+
     async def get_all_library_count(self, query_params: QueryParams) -> int:
-        query: Query = select(LibrarySchema.id)
+        query: Query = select(func.count(LibrarySchema.id))
         if query_params.search:
-            query = query.where(
-                or_(
-                    LibrarySchema.search_keywords.cast(Unicode()).ilike(f"%{query_params.search}%"),
-                    LibrarySchema.keywords.cast(Unicode()).ilike(f"%{query_params.search}%"),
-                )
-            )
-        results = await self._execute(query)
-        return len(results.all())
+            query = self._filter_by_search(query, self._search_query(query_params.search))
+        result = await self._execute(query)
+        return result.scalar()
 
     async def get_all_library_items(
         self,
@@ -61,11 +71,11 @@ class LibraryCRUD(BaseCRUD[LibrarySchema]):
             LibrarySchema.applet_id_version == AppletHistorySchema.id_version,
         )
         if query_params.search:
-            query = query.where(
-                or_(
-                    LibrarySchema.search_keywords.cast(Unicode()).ilike(f"%{query_params.search}%"),
-                    LibrarySchema.keywords.cast(Unicode()).ilike(f"%{query_params.search}%"),
-                )
+            ts_query = self._search_query(query_params.search)
+            query = self._filter_by_search(query, ts_query)
+            query = query.order_by(
+                func.ts_rank(LibrarySchema.search_tsv, ts_query).desc(),
+                LibrarySchema.created_at.desc(),
             )
         query = paging(query, query_params.page, query_params.limit)
 
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, ForeignKey, String
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy import Column, Computed, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 
 from infrastructure.database import Base
 
@@ -13,6 +13,19 @@ class LibrarySchema(Base):
     )
     keywords = Column(ARRAY(String))
     search_keywords = Column(ARRAY(String))
+    # Keywords of the author rank higher than words of the applet content
+    search_tsv = Column(
+        TSVECTOR(),
+        Computed(
+            "setweight(to_tsvector('simple', "
+            "coalesce(immutable_array_to_string(keywords, ' '), '')), 'A') || "
+            "setweight(to_tsvector('simple', "
+            "coalesce(immutable_array_to_string(search_keywords, ' '), '')), 'B')",
+            persisted=True,
+        ),
+    )
+
+    __table_args__ = (Index("ix_library_search_tsv", search_tsv, postgresql_using="gin"),)
 
 
 class CartSchema(Base):
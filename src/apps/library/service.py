@@ -3,6 +3,7 @@ import json
 import uuid
 from typing import List
 
+from cachetools import LRUCache
 from pydantic import parse_obj_as
 
 from apps.activities.crud import ActivityHistoriesCRUD, ActivityItemHistoriesCRUD
@@ -38,6 +39,9 @@ from config import settings
 
 
 class LibraryService:
+    # applet_id_version -> (activities, flows), shared versions never change
+    _rendered: LRUCache = LRUCache(maxsize=settings.library.cache_size)
+
     def __init__(self, session):
         self.session = session
 
@@ -110,9 +114,7 @@ class LibraryService:
         """Get all applets for library."""
 
         library_items = await LibraryCRUD(self.session).get_all_library_items(query_params)
-
-        for library_item in library_items:
-            library_item = await self._get_full_library_item(library_item)
+        await self._hydrate_library_items(library_items)
 
         return [
             PublicLibraryItem(
@@ -134,21 +136,60 @@ class LibraryService:
         )
 
     async def _get_full_library_item(self, library_item: LibraryItem) -> LibraryItem:
-        activities = await ActivityHistoriesCRUD(session=self.session).retrieve_by_applet_version(
-            library_item.applet_id_version
-        )
-        library_item_activities = []
-        activity_id_key_maps = dict()
-        activity_id_versions = [activity.id_version for activity in activities]
+        await self._hydrate_library_items([library_item])
+        return library_item
+
+    async def _hydrate_library_items(self, library_items: list[LibraryItem]):
+        """Fill activities and flows of library items.
+
+        Histories of all versions missing in the cache are loaded with
+        four queries in total, whatever the number of items.
+        """
+        id_versions = list(dict.fromkeys(item.applet_id_version for item in library_items))
+        # Inserting missing versions may evict the found ones from the shared cache
+        found: dict[str, tuple[list[LibraryItemActivity], list[LibraryItemFlow]]] = dict()
+        missing = []
+        for id_version in id_versions:
+            cached = self._rendered.get(id_version)
+            if cached is None:
+                missing.append(id_version)
+            else:
+                found[id_version] = cached
+        if missing:
+            rendered = await self._render_applet_versions(missing)
+            for id_version in missing:
+                found[id_version] = rendered.get(id_version, ([], []))
+                self._rendered[id_version] = found[id_version]
+
+        for library_item in library_items:
+            activities, flows = found[library_item.applet_id_version]
+            # Cached models are shared between requests
+            library_item.activities = [activity.copy(deep=True) for activity in activities]
+            library_item.activity_flows = [flow.copy(deep=True) for flow in flows]
+
+    async def _render_applet_versions(
+        self, id_versions: list[str]
+    ) -> dict[str, tuple[list[LibraryItemActivity], list[LibraryItemFlow]]]:
+        activities = await ActivityHistoriesCRUD(self.session).retrieve_by_applet_versions(id_versions)
         all_activity_items = await ActivityItemHistoriesCRUD(self.session).get_by_activity_id_versions(
-            activity_id_versions
+            [activity.id_version for activity in activities]
         )
         activity_items_map: dict[str, list[ActivityItemHistorySchema]] = dict()
         for activity_item in all_activity_items:
             activity_items_map.setdefault(f"{activity_item.activity_id}", []).append(activity_item)
 
+        flows = await FlowsHistoryCRUD(self.session).retrieve_by_applet_versions(id_versions)
+        all_flow_items = await FlowItemHistoriesCRUD(self.session).get_by_flow_ids([flow.id_version for flow in flows])
+        flow_items_map: dict[str, list[ActivityFlowItemHistorySchema]] = dict()
+        for flow_item in all_flow_items:
+            flow_items_map.setdefault(f"{flow_item.activity_flow_id}", []).append(flow_item)
+
+        rendered: dict[str, tuple[list[LibraryItemActivity], list[LibraryItemFlow]]] = {
+            id_version: ([], []) for id_version in id_versions
+        }
+        activity_id_key_maps = dict()
         for activity in activities:
-            activity_items = activity_items_map[activity.id_version]
+            activity_items = activity_items_map.get(activity.id_version, [])
             activity_id_key_maps[activity.id_version] = uuid.uuid4()
             items = [
                 LibraryItemActivityItem(
@@ -163,7 +204,7 @@ class LibraryService:
                 )
                 for item in activity_items
             ]
-            library_item_activities.append(
+            rendered[activity.applet_id][0].append(
                 LibraryItemActivity(
                     key=activity_id_key_maps[activity.id_version],
                     name=activity.name,
@@ -182,20 +223,10 @@ class LibraryService:
                     items=items,
                 )
             )
-        library_item.activities = library_item_activities
-
-        flows = await FlowsHistoryCRUD(session=self.session).retrieve_by_applet_version(library_item.applet_id_version)
-        flow_id_versions = [flow.id_version for flow in flows]
-        all_flow_items = await FlowItemHistoriesCRUD(self.session).get_by_flow_ids(flow_id_versions)
-        flow_items_map: dict[str, list[ActivityFlowItemHistorySchema]] = dict()
-        for flow_item in all_flow_items:
-            flow_items_map.setdefault(f"{flow_item.activity_flow_id}", []).append(flow_item)
-
-        library_item_flows = []
 
         for flow in flows:
-            flow_items = flow_items_map[flow.id_version]
-            library_item_flows.append(
+            flow_items = flow_items_map.get(flow.id_version, [])
+            rendered[flow.applet_id][1].append(
                 LibraryItemFlow(
                     name=flow.name,
                     description=flow.description,
@@ -210,8 +241,7 @@ class LibraryService:
                     ],
                 )
             )
-        library_item.activity_flows = library_item_flows
-        return library_item
+        return rendered
 
     def _get_response_value_options(self, response_values):
         if response_values:
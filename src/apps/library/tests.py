@@ -2,13 +2,17 @@ import http
 import uuid
 
 import pytest
+from cachetools import LRUCache
+from pytest_mock import MockerFixture
 
+from apps.activities.crud import ActivityHistoriesCRUD
 from apps.library.errors import (
     AppletNameExistsError,
     AppletVersionDoesNotExistError,
     AppletVersionExistsError,
     LibraryItemDoesNotExistError,
 )
+from apps.library.service import LibraryService
 from apps.shared.test import BaseTest
 
 APPLET_IN_LABRARY_NAME = "Applet 2"
@@ -17,6 +21,13 @@ ID_DOES_NOT_EXIST = "00000000-0000-0000-0000-000000000000"
 ACTIVITY_KEY = "577dbbda-3afc-4962-842b-8d8d11588bfe"
 
 
+@pytest.fixture(autouse=True)
+def clear_rendered_library_items():
+    # Tests roll back applet versions, so one version can differ between tests
+    yield
+    LibraryService._rendered.clear()
+
+
 @pytest.fixture
 def applet_data():
     return dict(
@@ -103,6 +114,31 @@ class TestLibrary(BaseTest):
         result = response.json()["result"]
         assert result["keywords"] == ["test", "test2"]
 
+    @pytest.mark.parametrize(
+        "search_term,expected",
+        (
+            ("depr", 1),
+            ("DEPRESSION screen", 1),
+            ("phq", 1),
+            ("depression anxiety", 0),
+            ("%", 0),
+        ),
+    )
+    async def test_library_get_all_full_text_search(self, client, search_term, expected):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        data = dict(
+            applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            keywords=["Depression", "screening"],
+            name="PHQ2",
+        )
+        response = await client.post(self.library_url, data=data)
+        assert response.status_code == http.HTTPStatus.CREATED, response.json()
+
+        response = await client.get(self.library_url, query={"search": search_term})
+        assert response.status_code == http.HTTPStatus.OK, response.json()
+        assert response.json()["count"] == expected
+        assert len(response.json()["result"]) == expected
+
     async def test_library_check_name(self, client):
         await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
 
@@ -333,6 +369,39 @@ class TestLibrary(BaseTest):
         assert applet["image"] == "image_url"
         assert len(applet["activities"]) == 2
 
+    async def test_library_list_rendered_once_per_version(self, client, mocker: MockerFixture):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        response = await client.post(
+            self.library_url,
+            data=dict(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1", keywords=[], name="PHQ2"),
+        )
+        assert response.status_code == http.HTTPStatus.CREATED, response.json()
+        retrieve = mocker.spy(ActivityHistoriesCRUD, "retrieve_by_applet_versions")
+
+        response = await client.get(self.library_url)
+        assert response.status_code == http.HTTPStatus.OK, response.json()
+        first = response.json()["result"]
+        response = await client.get(self.library_url)
+        assert response.status_code == http.HTTPStatus.OK, response.json()
+
+        assert retrieve.call_count == 1
+        assert len(retrieve.call_args.args[1]) == len(first)
+        assert response.json()["result"] == first
+
+    async def test_library_list_more_versions_than_cache_size(self, client, mocker: MockerFixture):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        response = await client.post(
+            self.library_url,
+            data=dict(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1", keywords=[], name="PHQ2"),
+        )
+        assert response.status_code == http.HTTPStatus.CREATED, response.json()
+        mocker.patch.object(LibraryService, "_rendered", LRUCache(maxsize=1))
+
+        for _ in range(2):
+            response = await client.get(self.library_url)
+            assert response.status_code == http.HTTPStatus.OK, response.json()
+            assert len(response.json()["result"]) == 2
+
     async def test_library_slider_values(self, client):
         await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
         response = await client.post(
@@ -1,9 +1,12 @@
+import hashlib
 import uuid
 from copy import deepcopy
 from datetime import date, timedelta
 
-from fastapi import Body, Depends
+from fastapi import Body, Depends, Header
 from firebase_admin.exceptions import FirebaseError
+from starlette import status
+from starlette.responses import Response as HTTPResponse
 
 from apps.answers.errors import UserDoesNotHavePermissionError
 from apps.applets.crud import AppletsCRUD, UserAppletAccessCRUD
@@ -252,15 +255,36 @@ async def schedule_delete_by_user(
         logger.exception(e)
 
 
+def _is_not_modified(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags or "*" in tags
+
+
 async def schedule_get_all_by_user(
+    response: HTTPResponse,
     user: User = Depends(get_current_user),
     session=Depends(get_session),
-) -> ResponseMulti[PublicEventByUser]:
+    if_none_match: str | None = Header(None),
+) -> ResponseMulti[PublicEventByUser] | HTTPResponse:
     """Get all schedules for a user."""
     async with atomic(session):
-        schedules = await ScheduleService(session).get_events_by_user(user_id=user.id)
-        count = await ScheduleService(session).count_events_by_user(user_id=user.id)
-    return ResponseMulti(result=schedules, count=count)
+        applets = await AppletsCRUD(session).get_applets_by_roles(
+            user_id=user.id,
+            roles=Role.as_list(),
+            query_params=QueryParams(),
+        )
+        snapshots = await ScheduleService(session).get_events_snapshots_by_user(
+            user_id=user.id, applet_ids=[applet.id for applet in applets]
+        )
+    count = sum(len(snapshot.schedule.events or []) for snapshot in snapshots)
+    etag_source = ",".join([str(count), *(snapshot.etag for snapshot in snapshots)])
+    etag = f'"{hashlib.sha1(etag_source.encode()).hexdigest()}"'
+    if _is_not_modified(etag, if_none_match):
+        return HTTPResponse(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return ResponseMulti(result=[snapshot.schedule for snapshot in snapshots], count=count)
 
 
 async def schedule_get_all_by_respondent_user(
@@ -300,14 +324,21 @@ async def schedule_get_all_by_respondent_user(
 
 async def schedule_get_by_user(
     applet_id: uuid.UUID,
+    response: HTTPResponse,
     user: User = Depends(get_current_user),
     session=Depends(get_session),
-) -> Response[PublicEventByUser]:
+    if_none_match: str | None = Header(None),
+) -> Response[PublicEventByUser] | HTTPResponse:
     """Get all schedules for a respondent per applet id."""
     async with atomic(session):
         await AppletService(session, user.id).exist_by_id(applet_id)
-        schedules = await ScheduleService(session).get_events_by_user_and_applet(user_id=user.id, applet_id=applet_id)
-    return Response(result=schedules)
+        snapshot = await ScheduleService(session).get_events_snapshot_by_user_and_applet(
+            user_id=user.id, applet_id=applet_id
+        )
+    if _is_not_modified(snapshot.etag, if_none_match):
+        return HTTPResponse(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": snapshot.etag})
+    response.headers["ETag"] = snapshot.etag
+    return Response(result=snapshot.schedule)
 
 
 async def schedule_remove_individual_calendar(
@@ -1,6 +1,7 @@
 import uuid
 from datetime import date
 
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError, MultipleResultsFound
 from sqlalchemy.orm import Query
 from sqlalchemy.sql import and_, delete, distinct, func, or_, select
@@ -63,6 +64,9 @@ class EventCRUD(BaseCRUD[EventSchema]):
         event: Event = Event.from_orm(instance)
         return event
 
+    async def insert_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
+
     async def get_by_id(self, pk: uuid.UUID) -> Event:
         """Return event instance."""
         query: Query = select(self.schema_class)
@@ -316,6 +320,28 @@ class EventCRUD(BaseCRUD[EventSchema]):
         query = query.where(EventSchema.id.in_(ids))
         await self._execute(query)
 
+    async def get_targets_by_applet_id(self, applet_id: uuid.UUID) -> list[Row]:
+        """Return ids, periodicity type, activity or flow and respondent
+        of applet events.
+        """
+        query: Query = select(
+            EventSchema.id,
+            EventSchema.periodicity_id,
+            PeriodicitySchema.type,
+            ActivityEventsSchema.activity_id,
+            FlowEventsSchema.flow_id,
+            UserEventsSchema.user_id,
+        )
+        query = query.join(PeriodicitySchema, PeriodicitySchema.id == EventSchema.periodicity_id)
+        query = query.join(ActivityEventsSchema, ActivityEventsSchema.event_id == EventSchema.id, isouter=True)
+        query = query.join(FlowEventsSchema, FlowEventsSchema.event_id == EventSchema.id, isouter=True)
+        query = query.join(UserEventsSchema, UserEventsSchema.event_id == EventSchema.id, isouter=True)
+        query = query.where(EventSchema.applet_id == applet_id)
+        query = query.where(EventSchema.is_deleted == False)  # noqa: E712
+
+        result = await self._execute(query)
+        return result.all()
+
     async def get_all_by_applet_and_activity(
         self,
         applet_id: uuid.UUID,
@@ -642,6 +668,10 @@ class EventCRUD(BaseCRUD[EventSchema]):
 
     async def count_general_events_by_user(self, applet_id: uuid.UUID, user_id: uuid.UUID) -> int:
         """Count general events by applet_id and user_id"""
+        return await self.count_general_events_by_applets_and_user([applet_id], user_id)
+
+    async def count_general_events_by_applets_and_user(self, applet_ids: list[uuid.UUID], user_id: uuid.UUID) -> int:
+        """Count general events by applet_ids and user_id"""
         flow_ids = (
             select(distinct(FlowEventsSchema.flow_id))
             .select_from(FlowEventsSchema)
@@ -654,7 +684,7 @@ class EventCRUD(BaseCRUD[EventSchema]):
                 EventSchema.id == FlowEventsSchema.event_id,
             )
             .where(UserEventsSchema.user_id == user_id)
-            .where(EventSchema.applet_id == applet_id)
+            .where(EventSchema.applet_id.in_(applet_ids))
         )
         activity_ids = (
             select(distinct(ActivityEventsSchema.activity_id))
@@ -668,7 +698,7 @@ class EventCRUD(BaseCRUD[EventSchema]):
                 EventSchema.id == ActivityEventsSchema.event_id,
             )
             .where(UserEventsSchema.user_id == user_id)
-            .where(EventSchema.applet_id == applet_id)
+            .where(EventSchema.applet_id.in_(applet_ids))
         )
 
         query: Query = select(
@@ -691,7 +721,7 @@ class EventCRUD(BaseCRUD[EventSchema]):
             isouter=True,
         )
 
-        query = query.where(EventSchema.applet_id == applet_id)
+        query = query.where(EventSchema.applet_id.in_(applet_ids))
         query = query.where(EventSchema.is_deleted == False)  # noqa: E712
         query = query.where(
             or_(
@@ -712,6 +742,10 @@ class EventCRUD(BaseCRUD[EventSchema]):
 
     async def count_individual_events_by_user(self, applet_id: uuid.UUID, user_id: uuid.UUID) -> int:
         """Count individual events by applet_id and user_id"""
+        return await self.count_individual_events_by_applets_and_user([applet_id], user_id)
+
+    async def count_individual_events_by_applets_and_user(self, applet_ids: list[uuid.UUID], user_id: uuid.UUID) -> int:
+        """Count individual events by applet_ids and user_id"""
 
         query: Query = select(func.count(EventSchema.id))
         query = query.join(
@@ -722,7 +756,7 @@ class EventCRUD(BaseCRUD[EventSchema]):
             ),
         )
 
-        query = query.where(EventSchema.applet_id == applet_id)
+        query = query.where(EventSchema.applet_id.in_(applet_ids))
         query = query.where(EventSchema.is_deleted == False)  # noqa: E712
         db_result = await self._execute(query)
         return db_result.scalar()
@@ -785,6 +819,9 @@ class UserEventsCRUD(BaseCRUD[UserEventsSchema]):
         user_event: UserEvent = UserEvent.from_orm(instance)
         return user_event
 
+    async def insert_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
+
     async def get_by_event_id(self, event_id: uuid.UUID) -> uuid.UUID | None:
         """Return user event instances."""
         query: Query = select(distinct(UserEventsSchema.user_id))
@@ -827,6 +864,9 @@ class ActivityEventsCRUD(BaseCRUD[ActivityEventsSchema]):
         activity_event: ActivityEvent = ActivityEvent.from_orm(instance)
         return activity_event
 
+    async def insert_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
+
     async def get_by_event_id(self, event_id: uuid.UUID) -> uuid.UUID | None:
         """Return activity event instances."""
         query: Query = select(ActivityEventsSchema.activity_id)
@@ -971,6 +1011,9 @@ class FlowEventsCRUD(BaseCRUD[FlowEventsSchema]):
         flow_event: FlowEvent = FlowEvent.from_orm(instance)
         return flow_event
 
+    async def insert_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
+
     async def get_by_event_id(self, event_id: uuid.UUID) -> uuid.UUID | None:
         """Return flow event instances."""
         query: Query = select(FlowEventsSchema.flow_id)
@@ -1,5 +1,6 @@
 import uuid
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Query
 from sqlalchemy.sql import delete, select, update
 
@@ -23,6 +24,9 @@ class NotificationCRUD(BaseCRUD[NotificationSchema]):
         result = await self._create_many(notifications)
         return [NotificationSetting.from_orm(notification) for notification in result]
 
+    async def insert_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
+
     async def get_all_by_event_id(self, event_id: uuid.UUID) -> list[NotificationSetting]:
         """Return all notifications by event id."""
 
@@ -66,6 +70,9 @@ class ReminderCRUD(BaseCRUD[ReminderSchema]):
         db_reminder = await self._create(ReminderSchema(**reminder.dict()))
         return ReminderSetting.from_orm(db_reminder)
 
+    async def insert_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
+
     async def get_by_event_id(self, event_id: uuid.UUID) -> ReminderSchema:
         """Return all reminders by event id."""
 
@@ -1,6 +1,7 @@
 import uuid
 
 from sqlalchemy import delete
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Query
 
 from apps.schedule.db.schemas import PeriodicitySchema
@@ -21,6 +22,9 @@ class PeriodicityCRUD(BaseCRUD[PeriodicitySchema]):
         periodicity: Periodicity = Periodicity.from_orm(instance)
         return periodicity
 
+    async def insert_many(self, values: list[dict]) -> list[Row]:
+        return await self._insert_many(values)
+
     async def get_by_id(self, pk: uuid.UUID) -> Periodicity:
         """Return periodicity instance."""
 
@@ -1,6 +1,7 @@
 import uuid
 
 from apps.schedule.domain.schedule.base import BaseEvent, BaseNotificationSetting, BasePeriodicity, BaseReminderSetting
+from apps.schedule.domain.schedule.public import PublicEventByUser
 from apps.shared.domain import InternalModel
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     "NotificationSetting",
     "ReminderSettingCreate",
     "ReminderSetting",
+    "ScheduleSnapshot",
     # "Notification",
 ]
 
@@ -100,3 +102,8 @@ class EventFull(InternalModel, BaseEvent):
     user_id: uuid.UUID | None = None
     activity_id: uuid.UUID | None = None
     flow_id: uuid.UUID | None = None
+
+
+class ScheduleSnapshot(InternalModel):
+    etag: str
+    schedule: PublicEventByUser
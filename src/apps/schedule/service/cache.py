@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+import json
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from apps.schedule.domain.schedule.internal import ScheduleSnapshot
+from apps.schedule.domain.schedule.public import PublicEventByUser
+from config import settings
+from infrastructure.cache import BaseCacheService
+from infrastructure.cache.domain import CacheEntry
+from infrastructure.logger import logger
+
+__all__ = ["ScheduleSnapshotCache", "invalidate_schedule_snapshots"]
+
+_INVALIDATED_KEY = "invalidated_schedule_snapshots"
+_invalidation_tasks: set[asyncio.Task] = set()
+
+
+class ScheduleSnapshotCache(BaseCacheService[ScheduleSnapshot]):
+    """Cache of respondent schedules per (user, applet).
+
+    Every applet schedule and every individual schedule of a user in an
+    applet has a version. Snapshot keys contain both versions, so a write
+    invalidates snapshots by replacing a version instead of looking for
+    the keys of all respondents.
+
+    The example of keys:
+        __class__.__name__:version:<applet_id>
+        __class__.__name__:version:<applet_id>:<user_id>
+        __class__.__name__:<applet_id>:<user_id>:<applet version>:<user version>
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.default_ttl = settings.schedule.snapshot_ttl
+
+    @staticmethod
+    def build_etag(schedule: PublicEventByUser) -> str:
+        return f'"{hashlib.sha1(schedule.json().encode()).hexdigest()}"'
+
+    def _build_version_key(self, applet_id: uuid.UUID, user_id: uuid.UUID | None = None) -> str:
+        if user_id:
+            return self._build_key(f"version:{applet_id}:{user_id}")
+        return self._build_key(f"version:{applet_id}")
+
+    async def get_versions(self, user_id: uuid.UUID, applet_ids: list[uuid.UUID]) -> dict[uuid.UUID, str]:
+        """Return {applet_id: "<applet version>:<user version>"}.
+        Missing versions are created, a new version never matches
+        snapshots that were stored before.
+        """
+        keys = []
+        for applet_id in applet_ids:
+            keys.append(self._build_version_key(applet_id))
+            keys.append(self._build_version_key(applet_id, user_id))
+        values = await self.redis_client.mget(keys) if keys else []
+        if len(values) != len(keys):
+            # The cache is unavailable
+            values = [None] * len(keys)
+
+        versions = dict(zip(keys, values))
+        created = {key: uuid.uuid4().hex for key, value in versions.items() if value is None}
+        if created:
+            is_set = await self.redis_client.set_many(created, ex=self.default_ttl, nx=True)
+            versions.update(created)
+            # Concurrent requests have created these versions first
+            existing = [key for key, key_is_set in zip(created, is_set) if not key_is_set]
+            if existing:
+                stored = await self.redis_client.mget(existing)
+                versions.update({key: value for key, value in zip(existing, stored) if value is not None})
+        versions = {key: value.decode() if isinstance(value, bytes) else value for key, value in versions.items()}
+
+        return {
+            applet_id: f"{versions[keys[2 * i]]}:{versions[keys[2 * i + 1]]}" for i, applet_id in enumerate(applet_ids)
+        }
+
+    def build_key(self, user_id: uuid.UUID, applet_id: uuid.UUID, version: str) -> str:
+        return f"{applet_id}:{user_id}:{version}"
+
+    async def get(self, user_id: uuid.UUID, applet_id: uuid.UUID, version: str) -> CacheEntry[ScheduleSnapshot]:
+        cache_record: dict = await self._get(self.build_key(user_id, applet_id, version))
+
+        return CacheEntry[ScheduleSnapshot](**cache_record)
+
+    async def get_many(self, user_id: uuid.UUID, versions: dict[uuid.UUID, str]) -> dict[uuid.UUID, ScheduleSnapshot]:
+        """Return snapshots that are in the cache for given versions."""
+        if not versions:
+            return dict()
+        applet_ids = list(versions.keys())
+        keys = [self._build_key(self.build_key(user_id, applet_id, versions[applet_id])) for applet_id in applet_ids]
+        results = await self.redis_client.mget(keys)
+        if len(results) != len(keys):
+            return dict()
+
+        return {
+            applet_id: CacheEntry[ScheduleSnapshot](**json.loads(result)).instance
+            for applet_id, result in zip(applet_ids, results)
+            if result
+        }
+
+    async def invalidate(self, applet_id: uuid.UUID, user_id: uuid.UUID | None = None):
+        """Drop snapshots of the applet schedule for all respondents or
+        of the individual schedule of a respondent.
+        """
+        await self.redis_client.set(
+            self._build_version_key(applet_id, user_id),
+            uuid.uuid4().hex,
+            ex=self.default_ttl,
+        )
+
+
+async def invalidate_schedule_snapshots(session, applet_id: uuid.UUID, user_id: uuid.UUID | None = None):
+    """Invalidate snapshots changed within the session transaction.
+
+    Snapshots are invalidated right away and once more after the commit:
+    a snapshot built by a concurrent request from the data read before
+    the commit must not outlive the transaction.
+    """
+    invalidated: set = session.info.setdefault(_INVALIDATED_KEY, set())
+    if (applet_id, user_id) in invalidated:
+        return
+    invalidated.add((applet_id, user_id))
+    await ScheduleSnapshotCache().invalidate(applet_id, user_id)
+
+
+async def _invalidate_many(invalidated: set):
+    cache = ScheduleSnapshotCache()
+    for applet_id, user_id in invalidated:
+        try:
+            await cache.invalidate(applet_id, user_id)
+        except Exception as e:
+            logger.exception(e)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session):
+    invalidated = session.info.pop(_INVALIDATED_KEY, None)
+    if not invalidated:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_invalidate_many(invalidated))
+    _invalidation_tasks.add(task)
+    task.add_done_callback(_invalidation_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_invalidated(session: Session):
+    session.info.pop(_INVALIDATED_KEY, None)
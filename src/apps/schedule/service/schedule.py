@@ -1,6 +1,9 @@
 import asyncio
+import itertools
 import uuid
+from collections import defaultdict
 from datetime import date
+from typing import Iterable
 
 from apps.activities.crud import ActivitiesCRUD
 from apps.activity_flows.crud import FlowsCRUD
@@ -23,6 +26,7 @@ from apps.schedule.domain.schedule.internal import (
     Periodicity,
     ReminderSetting,
     ReminderSettingCreate,
+    ScheduleSnapshot,
     UserEventCreate,
 )
 from apps.schedule.domain.schedule.public import (
@@ -49,6 +53,7 @@ from apps.schedule.errors import (
     EventAlwaysAvailableExistsError,
     ScheduleNotFoundError,
 )
+from apps.schedule.service.cache import ScheduleSnapshotCache, invalidate_schedule_snapshots
 from apps.shared.query_params import QueryParams
 from apps.users.cruds.user import UsersCRUD
 from apps.users.errors import UserNotFound
@@ -62,112 +67,163 @@ class ScheduleService:
         self.session = session
 
     async def create_schedule(self, schedule: EventRequest, applet_id: uuid.UUID) -> PublicEvent:
-        # Validate schedule data before saving
-        await self._validate_schedule(applet_id=applet_id, schedule=schedule)
+        events = await self.create_schedules([schedule], applet_id)
+        return events[0]
 
-        # Delete all events of this activity or flow
-        # if new periodicity type is "always"
+    async def create_schedules(
+        self,
+        schedules: list[EventRequest],
+        applet_id: uuid.UUID,
+        replace_always_available: bool = False,
+    ) -> list[PublicEvent]:
+        """Create events as if they were created one by one.
+
+        An always available event replaces all events of its activity or
+        flow for the same respondent, any other event replaces always
+        available ones. The whole batch is validated up front, replaced
+        events are deleted at once and every table is written with one
+        statement. Returns created events which are not replaced within
+        the batch.
+        """
+        if not schedules:
+            return []
+        await self._validate_schedules(applet_id=applet_id, schedules=schedules)
+
+        existing: dict[tuple, list] = defaultdict(list)
+        for row in await EventCRUD(self.session).get_targets_by_applet_id(applet_id):
+            existing[(row.activity_id or row.flow_id, row.user_id)].append(row)
+
+        replaced: list = []
+        created: dict[tuple, list[tuple[int, EventRequest]]] = defaultdict(list)
+        for index, schedule in enumerate(schedules):
+            target = (schedule.activity_id or schedule.flow_id, schedule.respondent_id)
+            if schedule.periodicity.type == PeriodicityType.ALWAYS:
+                always_available_exists = any(row.type == PeriodicityType.ALWAYS for row in existing[target]) or any(
+                    created_schedule.periodicity.type == PeriodicityType.ALWAYS
+                    for _, created_schedule in created[target]
+                )
+                if always_available_exists and not replace_always_available:
+                    raise EventAlwaysAvailableExistsError
+                # delete all events of this activity or flow
+                replaced.extend(existing.pop(target, []))
+                created[target] = [(index, schedule)]
+            else:
+                # delete alwaysAvailable events of this activity or flow
+                replaced.extend(row for row in existing[target] if row.type == PeriodicityType.ALWAYS)
+                existing[target] = [row for row in existing[target] if row.type != PeriodicityType.ALWAYS]
+                created[target] = [
+                    (created_index, created_schedule)
+                    for created_index, created_schedule in created[target]
+                    if created_schedule.periodicity.type != PeriodicityType.ALWAYS
+                ]
+                created[target].append((index, schedule))
 
-        if schedule.periodicity.type == PeriodicityType.ALWAYS:
-            # check if there is any AlwaysAvailable event, if yes, raise error
-            await self._validate_existing_alwaysavailable(
-                applet_id=applet_id,
-                activity_id=schedule.activity_id,
-                flow_id=schedule.flow_id,
-                respondent_id=schedule.respondent_id,
+        if replaced:
+            await self._delete_by_ids(
+                event_ids=[row.id for row in replaced],
+                periodicity_ids=[row.periodicity_id for row in replaced],
             )
-
-        # delete alwaysAvailable events of this activity or flow,
-        # if new event type is not AA
-        # else, delete all types
-        await self._delete_by_activity_or_flow(
-            applet_id=applet_id,
-            activity_id=schedule.activity_id,
-            flow_id=schedule.flow_id,
-            respondent_id=schedule.respondent_id,
-            only_always_available=(schedule.periodicity.type != PeriodicityType.ALWAYS),
-        )
-
-        # Create periodicity
-        periodicity: Periodicity = await PeriodicityCRUD(self.session).save(schedule.periodicity)
-
-        # Create event
-        event: Event = await EventCRUD(self.session).save(
-            EventCreate(
+        for respondent_id in dict.fromkeys(schedule.respondent_id for schedule in schedules):
+            await invalidate_schedule_snapshots(self.session, applet_id, respondent_id)
+
+        to_create = sorted(itertools.chain.from_iterable(created.values()), key=lambda item: item[0])
+        return await self._insert_schedules(applet_id, [schedule for _, schedule in to_create])
+
+    async def _insert_schedules(self, applet_id: uuid.UUID, schedules: list[EventRequest]) -> list[PublicEvent]:
+        """Write events with one statement per table."""
+        periodicity_values: list[dict] = []
+        event_values: list[dict] = []
+        user_event_values: list[dict] = []
+        activity_event_values: list[dict] = []
+        flow_event_values: list[dict] = []
+        notification_values: list[dict] = []
+        reminder_values: list[dict] = []
+        event_ids: list[uuid.UUID] = []
+        for schedule in schedules:
+            periodicity_id, event_id = uuid.uuid4(), uuid.uuid4()
+            event_ids.append(event_id)
+            periodicity_values.append(dict(id=periodicity_id, **schedule.periodicity.dict()))
+            event = EventCreate(
                 start_time=schedule.start_time,
                 end_time=schedule.end_time,
                 access_before_schedule=schedule.access_before_schedule,
                 one_time_completion=schedule.one_time_completion,
                 timer=schedule.timer,
                 timer_type=schedule.timer_type,
-                periodicity_id=periodicity.id,
+                periodicity_id=periodicity_id,
                 applet_id=applet_id,
             )
-        )
-
-        # Create event-user
-        if schedule.respondent_id:
-            await UserEventsCRUD(self.session).save(UserEventCreate(event_id=event.id, user_id=schedule.respondent_id))
-        # Create event-activity or event-flow
-        if schedule.activity_id:
-            await ActivityEventsCRUD(self.session).save(
-                ActivityEventCreate(event_id=event.id, activity_id=schedule.activity_id)
-            )
-        else:
-            await FlowEventsCRUD(self.session).save(FlowEventCreate(event_id=event.id, flow_id=schedule.flow_id))
-
-        # Create notification and reminder
-        if schedule.notification:
-            notifications = None
-            reminder = None
-
-            if schedule.notification.notifications:
-                notification_create = []
-                for notification in schedule.notification.notifications:
-                    notification_create.append(
-                        NotificationSchema(
-                            event_id=event.id,
-                            from_time=notification.from_time,
-                            to_time=notification.to_time,
-                            at_time=notification.at_time,
-                            trigger_type=notification.trigger_type,
-                            order=notification.order,
-                        )
+            event_values.append(dict(id=event_id, **event.dict()))
+            if schedule.respondent_id:
+                user_event_values.append(UserEventCreate(event_id=event_id, user_id=schedule.respondent_id).dict())
+            if schedule.activity_id:
+                activity_event_values.append(
+                    ActivityEventCreate(event_id=event_id, activity_id=schedule.activity_id).dict()
+                )
+            else:
+                flow_event_values.append(FlowEventCreate(event_id=event_id, flow_id=schedule.flow_id).dict())
+            if not schedule.notification:
+                continue
+            for notification in schedule.notification.notifications or []:
+                notification_values.append(
+                    dict(
+                        event_id=event_id,
+                        from_time=notification.from_time,
+                        to_time=notification.to_time,
+                        at_time=notification.at_time,
+                        trigger_type=notification.trigger_type,
+                        order=notification.order,
                     )
-                notifications = await NotificationCRUD(self.session).create_many(notification_create)
-
+                )
             if schedule.notification.reminder:
-                reminder = await ReminderCRUD(self.session).create(
+                reminder_values.append(
                     ReminderSettingCreate(
-                        event_id=event.id,
-                        activity_incomplete=schedule.notification.reminder.activity_incomplete,  # noqa: E501
-                        reminder_time=schedule.notification.reminder.reminder_time,  # noqa: E501
-                    )
+                        event_id=event_id,
+                        activity_incomplete=schedule.notification.reminder.activity_incomplete,
+                        reminder_time=schedule.notification.reminder.reminder_time,
+                    ).dict()
                 )
-            notification_public = PublicNotification(
-                notifications=[
-                    PublicNotificationSetting(
-                        **notification.dict(),
-                    )
-                    for notification in notifications
-                ]
-                if notifications
-                else None,
-                reminder=PublicReminderSetting(
-                    **reminder.dict(),
+
+        periodicity_rows = await PeriodicityCRUD(self.session).insert_many(periodicity_values)
+        periodicities = {row.id: Periodicity.from_orm(row) for row in periodicity_rows}
+        events = {row.id: Event.from_orm(row) for row in await EventCRUD(self.session).insert_many(event_values)}
+        await UserEventsCRUD(self.session).insert_many(user_event_values)
+        await ActivityEventsCRUD(self.session).insert_many(activity_event_values)
+        await FlowEventsCRUD(self.session).insert_many(flow_event_values)
+        notifications: dict[uuid.UUID, list[NotificationSetting]] = defaultdict(list)
+        for row in await NotificationCRUD(self.session).insert_many(notification_values):
+            notifications[row.event_id].append(NotificationSetting.from_orm(row))
+        reminders = {
+            row.event_id: ReminderSetting.from_orm(row)
+            for row in await ReminderCRUD(self.session).insert_many(reminder_values)
+        }
+
+        public_events = []
+        for event_id, schedule in zip(event_ids, schedules):
+            event = events[event_id]
+            notification_public = None
+            if schedule.notification:
+                event_notifications = notifications.get(event_id)
+                reminder = reminders.get(event_id)
+                notification_public = PublicNotification(
+                    notifications=[
+                        PublicNotificationSetting(**notification.dict()) for notification in event_notifications
+                    ]
+                    if event_notifications
+                    else None,
+                    reminder=PublicReminderSetting(**reminder.dict()) if reminder else None,
+                )
+            public_events.append(
+                PublicEvent(
+                    **event.dict(),
+                    periodicity=PublicPeriodicity(**periodicities[event.periodicity_id].dict()),
+                    respondent_id=schedule.respondent_id,
+                    activity_id=schedule.activity_id,
+                    flow_id=schedule.flow_id,
+                    notification=notification_public,
                 )
-                if reminder
-                else None,
             )
-
-        return PublicEvent(
-            **event.dict(),
-            periodicity=PublicPeriodicity(**periodicity.dict()),
-            respondent_id=schedule.respondent_id,
-            activity_id=schedule.activity_id,
-            flow_id=schedule.flow_id,
-            notification=notification_public if schedule.notification else None,
-        )
+        return public_events
 
     async def get_schedule_by_id(self, schedule_id: uuid.UUID, applet_id: uuid.UUID) -> PublicEvent:
         # Check if applet exists
@@ -251,13 +307,17 @@ class ScheduleService:
                 )
             )
 
+        event_ids = {full_event.id for full_event in full_events}
+        notifications_map = await NotificationCRUD(self.session).get_all_by_event_ids(event_ids)
+        reminders_map = await ReminderCRUD(self.session).get_by_event_ids(event_ids)
+
         events = PublicEventByUser(
             applet_id=applet_id,
             events=[
                 self._convert_to_dto(
                     event=full_event,
-                    notifications=await NotificationCRUD(self.session).get_all_by_event_id(full_event.id),
-                    reminder=await ReminderCRUD(self.session).get_by_event_id(full_event.id),
+                    notifications=notifications_map.get(full_event.id),
+                    reminder=reminders_map.get(full_event.id),
                 )
                 for full_event in full_events
             ],
@@ -281,14 +341,11 @@ class ScheduleService:
         activity_ids = await ActivityEventsCRUD(self.session).get_by_event_ids(event_ids)
         flow_ids = await FlowEventsCRUD(self.session).get_by_event_ids(event_ids)
 
+        await invalidate_schedule_snapshots(self.session, applet_id)
         await self._delete_by_ids(event_ids, periodicity_ids)
 
         # Create default events for activities and flows
-        for activity_id in activity_ids:
-            await self._create_default_event(applet_id=applet_id, activity_id=activity_id, is_activity=True)
-
-        for flow_id in flow_ids:
-            await self._create_default_event(applet_id=applet_id, activity_id=flow_id, is_activity=False)
+        await self.create_schedules(self._build_default_events(activity_ids, flow_ids), applet_id)
 
     async def delete_schedule_by_id(self, schedule_id: uuid.UUID, applet_id: uuid.UUID) -> uuid.UUID | None:
         # Check if applet exists
@@ -302,6 +359,8 @@ class ScheduleService:
         activity_id = await ActivityEventsCRUD(self.session).get_by_event_id(event_id=schedule_id)
         flow_id = await FlowEventsCRUD(self.session).get_by_event_id(event_id=schedule_id)
 
+        await invalidate_schedule_snapshots(self.session, applet_id, respondent_id)
+
         # Delete event-user, event-activity, event-flow
         await self._delete_by_ids(event_ids=[schedule_id], periodicity_ids=[periodicity_id])
         # Create default event for activity or flow if another event doesn't exist # noqa: E501
@@ -344,6 +403,7 @@ class ScheduleService:
         flow_id = await FlowEventsCRUD(self.session).get_by_event_id(event_id=schedule_id)
         respondent_id = await UserEventsCRUD(self.session).get_by_event_id(event_id=schedule_id)
         periodicity: Periodicity = await PeriodicityCRUD(self.session).get_by_id(event.periodicity_id)
+        await invalidate_schedule_snapshots(self.session, applet_id, respondent_id)
 
         # Delete all events of this activity or flow
         # if new periodicity type is "always" and old periodicity type is not "always" # noqa: E501
@@ -430,31 +490,34 @@ class ScheduleService:
             notification=notification_public,
         )
 
-    async def _validate_schedule(self, applet_id: uuid.UUID, schedule: EventRequest) -> None:
-        """Validate schedule before saving it to the database."""
+    async def _validate_schedules(self, applet_id: uuid.UUID, schedules: list[EventRequest]) -> None:
+        """Validate schedules before saving them to the database."""
         # Check if applet exists
         await self._validate_applet(applet_id=applet_id)
 
-        # Check if user has access to applet
-        if schedule.respondent_id:
-            user_applet_access = await UserAppletAccessCRUD(self.session).get_by_applet_and_user_as_respondent(
-                applet_id=applet_id, user_id=schedule.respondent_id
-            )  # noqa: E501
-            if not user_applet_access:
+        # Check if users have access to applet
+        respondent_ids = {schedule.respondent_id for schedule in schedules if schedule.respondent_id}
+        if respondent_ids:
+            applet_respondent_ids = await UserAppletAccessCRUD(self.session).get_respondent_ids_by_applet(
+                applet_id, list(respondent_ids)
+            )
+            if respondent_ids - set(applet_respondent_ids):
                 raise AccessDeniedToApplet()
 
-        # Check if activity or flow exists inside applet
-        activity_or_flow = None
-        if schedule.activity_id:
-            activity_or_flow = await ActivitiesCRUD(self.session).get_by_applet_id_and_activity_id(
-                applet_id=applet_id, activity_id=schedule.activity_id
-            )
-        if schedule.flow_id:
-            activity_or_flow = await FlowsCRUD(self.session).get_by_applet_id_and_flow_id(
-                applet_id=applet_id, flow_id=schedule.flow_id
-            )
-        if not activity_or_flow:
-            raise ActivityOrFlowNotFoundError()
+        # Check if activities or flows exist inside applet
+        activity_ids: set[uuid.UUID] = set()
+        flow_ids: set[uuid.UUID] = set()
+        if any(schedule.activity_id for schedule in schedules):
+            activity_ids = set(await ActivitiesCRUD(self.session).get_ids_by_applet_id(applet_id))
+        if any(schedule.flow_id for schedule in schedules):
+            flow_ids = set(await FlowsCRUD(self.session).get_ids_by_applet_id(applet_id))
+        for schedule in schedules:
+            if schedule.flow_id:
+                exists = schedule.flow_id in flow_ids
+            else:
+                exists = schedule.activity_id in activity_ids
+            if not exists:
+                raise ActivityOrFlowNotFoundError()
 
     async def count_schedules(self, applet_id: uuid.UUID) -> PublicEventCount:
         # Check if applet exists
@@ -494,24 +557,28 @@ class ScheduleService:
         periodicity_ids = [event_schema.periodicity.id for event_schema in event_schemas]
         if not event_ids:
             raise ScheduleNotFoundError()
+        await invalidate_schedule_snapshots(self.session, applet_id, user_id)
         await self._delete_by_ids(
             event_ids,
             periodicity_ids,
             user_id,
         )
         # Create AA events for all activities and flows
-        await self.create_default_schedules(
-            applet_id=applet_id,
-            activity_ids=list(activity_ids),
-            is_activity=True,
-            respondent_id=user_id,
-        )
-        await self.create_default_schedules(
-            applet_id=applet_id,
-            activity_ids=list(flow_ids),
-            is_activity=False,
-            respondent_id=user_id,
-        )
+        await self.create_schedules(self._build_default_events(activity_ids, flow_ids, user_id), applet_id)
+
+    @staticmethod
+    def _build_default_events(
+        activity_ids: Iterable[uuid.UUID],
+        flow_ids: Iterable[uuid.UUID],
+        respondent_id: uuid.UUID | None = None,
+    ) -> list[EventRequest]:
+        """Build default events for activities and flows."""
+        events = []
+        for activity_id in activity_ids:
+            events.append(EventRequest(**DefaultEvent(activity_id=activity_id, respondent_id=respondent_id).dict()))
+        for flow_id in flow_ids:
+            events.append(EventRequest(**DefaultEvent(flow_id=flow_id, respondent_id=respondent_id).dict()))
+        return events
 
     async def _create_default_event(
         self,
@@ -521,16 +588,12 @@ class ScheduleService:
         respondent_id: uuid.UUID | None = None,
     ) -> None:
         """Create default schedules for applet."""
-        default_event = DefaultEvent()
-        if is_activity:
-            default_event.activity_id = activity_id
-        else:
-            default_event.flow_id = activity_id
-
-        default_event.respondent_id = respondent_id
-
-        # Create default event
-        await self.create_schedule(applet_id=applet_id, schedule=EventRequest(**default_event.dict()))
+        await self.create_default_schedules(
+            applet_id=applet_id,
+            activity_ids=[activity_id],
+            is_activity=is_activity,
+            respondent_id=respondent_id,
+        )
 
     async def _delete_by_activity_or_flow(
         self,
@@ -594,6 +657,7 @@ class ScheduleService:
         events = await EventCRUD(self.session).get_all_by_activity_flow_ids(applet_id, activity_ids, True)
         event_ids = [event.id for event in events]
         periodicity_ids = [event.periodicity_id for event in events]
+        await invalidate_schedule_snapshots(self.session, applet_id)
         await self._delete_by_ids(event_ids, periodicity_ids)
 
     async def delete_by_flow_ids(self, applet_id: uuid.UUID, flow_ids: list[uuid.UUID]) -> None:
@@ -601,6 +665,7 @@ class ScheduleService:
         events = await EventCRUD(self.session).get_all_by_activity_flow_ids(applet_id, flow_ids, False)
         event_ids = [event.id for event in events]
         periodicity_ids = [event.periodicity_id for event in events]
+        await invalidate_schedule_snapshots(self.session, applet_id)
         await self._delete_by_ids(event_ids, periodicity_ids)
 
     async def create_default_schedules(
@@ -611,13 +676,11 @@ class ScheduleService:
         respondent_id: uuid.UUID | None = None,
     ) -> None:
         """Create default schedules for applet."""
-        for activity_id in activity_ids:
-            await self._create_default_event(
-                applet_id=applet_id,
-                activity_id=activity_id,
-                is_activity=is_activity,
-                respondent_id=respondent_id,
-            )
+        if is_activity:
+            schedules = self._build_default_events(activity_ids, [], respondent_id)
+        else:
+            schedules = self._build_default_events([], activity_ids, respondent_id)
+        await self.create_schedules(schedules, applet_id)
 
     async def get_events_by_user(self, user_id: uuid.UUID) -> list[PublicEventByUser]:
         """Get all events for user in applets that user is respondent."""
@@ -627,32 +690,36 @@ class ScheduleService:
             query_params=QueryParams(),
         )
         applet_ids = [applet.id for applet in applets]
-        events = []
+        snapshots = await self.get_events_snapshots_by_user(user_id, applet_ids)
 
-        for applet_id in applet_ids:
-            user_events: list = await EventCRUD(self.session).get_all_by_applet_and_user(
-                applet_id=applet_id,
-                user_id=user_id,
-            )
-            general_events: list = await EventCRUD(self.session).get_general_events_by_user(
-                applet_id=applet_id, user_id=user_id
-            )
-            all_events = user_events + general_events
-            events.append(
-                PublicEventByUser(
-                    applet_id=applet_id,
-                    events=[
-                        self._convert_to_dto(
-                            event=event,
-                            notifications=await NotificationCRUD(self.session).get_all_by_event_id(event.id),
-                            reminder=await ReminderCRUD(self.session).get_by_event_id(event.id),
-                        )
-                        for event in all_events
-                    ],
+        return [snapshot.schedule for snapshot in snapshots]
+
+    async def get_events_snapshots_by_user(
+        self,
+        user_id: uuid.UUID,
+        applet_ids: list[uuid.UUID],
+    ) -> list[ScheduleSnapshot]:
+        """Get events of user per applet from the cache.
+        Events of applets that are not cached are loaded with one batch.
+        """
+        cache = ScheduleSnapshotCache()
+        versions = await cache.get_versions(user_id, applet_ids)
+        snapshots = await cache.get_many(user_id, versions)
+
+        missing_applet_ids = [applet_id for applet_id in applet_ids if applet_id not in snapshots]
+        if missing_applet_ids:
+            events_map = await self._get_events_by_applets_and_user(user_id, missing_applet_ids)
+            for applet_id in missing_applet_ids:
+                schedule = PublicEventByUser(applet_id=applet_id, events=events_map.get(applet_id, []))
+                snapshots[applet_id] = ScheduleSnapshot(etag=cache.build_etag(schedule), schedule=schedule)
+            await asyncio.gather(
+                *(
+                    cache.set(cache.build_key(user_id, applet_id, versions[applet_id]), snapshots[applet_id])
+                    for applet_id in missing_applet_ids
                 )
             )
 
-        return events
+        return [snapshots[applet_id] for applet_id in applet_ids]
 
     async def get_upcoming_events_by_user(
         self,
@@ -662,6 +729,23 @@ class ScheduleService:
         max_start_date: date | None = None,
     ) -> list[PublicEventByUser]:
         """Get all events for user in applets that user is respondent."""
+        events_map = await self._get_events_by_applets_and_user(user_id, applet_ids, min_end_date, max_start_date)
+
+        return [PublicEventByUser(applet_id=applet_id, events=events) for applet_id, events in events_map.items()]
+
+    async def _get_events_by_applets_and_user(
+        self,
+        user_id: uuid.UUID,
+        applet_ids: list[uuid.UUID],
+        min_end_date: date | None = None,
+        max_start_date: date | None = None,
+    ) -> dict[uuid.UUID, list[ScheduleEventDto]]:
+        """Get individual and general events of user for many applets
+        with a constant number of queries.
+        Return {applet_id: [ScheduleEventDto]} only for applets with events.
+        """
+        if not applet_ids:
+            return dict()
         user_events_map, user_event_ids = await EventCRUD(self.session).get_all_by_applets_and_user(
             applet_ids=applet_ids,
             user_id=user_id,
@@ -677,27 +761,23 @@ class ScheduleService:
         full_events_map = self._sum_applets_events_map(user_events_map, general_events_map)
 
         event_ids = user_event_ids | general_event_ids
+        if not event_ids:
+            return dict()
         notifications_map_c = NotificationCRUD(self.session).get_all_by_event_ids(event_ids)
         reminders_map_c = ReminderCRUD(self.session).get_by_event_ids(event_ids)
         notifications_map, reminders_map = await asyncio.gather(notifications_map_c, reminders_map_c)
 
-        events: list[PublicEventByUser] = []
-        for applet_id, all_events in full_events_map.items():
-            events.append(
-                PublicEventByUser(
-                    applet_id=applet_id,
-                    events=[
-                        self._convert_to_dto(
-                            event=event,
-                            notifications=notifications_map.get(event.id),
-                            reminder=reminders_map.get(event.id),
-                        )
-                        for event in all_events
-                    ],
+        return {
+            applet_id: [
+                self._convert_to_dto(
+                    event=event,
+                    notifications=notifications_map.get(event.id),
+                    reminder=reminders_map.get(event.id),
                 )
-            )
-
-        return events
+                for event in all_events
+            ]
+            for applet_id, all_events in full_events_map.items()
+        }
 
     @staticmethod
     def _sum_applets_events_map(m1: dict, m2: dict):
@@ -804,6 +884,13 @@ class ScheduleService:
 
     async def get_events_by_user_and_applet(self, user_id: uuid.UUID, applet_id: uuid.UUID) -> PublicEventByUser:
         """Get all events for user in applet."""
+        snapshot = await self.get_events_snapshot_by_user_and_applet(user_id, applet_id)
+        return snapshot.schedule
+
+    async def get_events_snapshot_by_user_and_applet(
+        self, user_id: uuid.UUID, applet_id: uuid.UUID
+    ) -> ScheduleSnapshot:
+        """Get all events for user in applet with the ETag of them."""
 
         # Check if applet exists
         await self._validate_applet(applet_id=applet_id)
@@ -817,26 +904,8 @@ class ScheduleService:
         ):
             raise AccessDeniedToApplet()
 
-        user_events = await EventCRUD(self.session).get_all_by_applet_and_user(
-            applet_id=applet_id,
-            user_id=user_id,
-        )
-
-        general_events = await EventCRUD(self.session).get_general_events_by_user(applet_id=applet_id, user_id=user_id)
-
-        events = PublicEventByUser(
-            applet_id=applet_id,
-            events=[
-                self._convert_to_dto(
-                    event=event,
-                    notifications=await NotificationCRUD(self.session).get_all_by_event_id(event.id),
-                    reminder=await ReminderCRUD(self.session).get_by_event_id(event.id),
-                )
-                for event in (user_events + general_events)
-            ],
-        )
-
-        return events
+        [snapshot] = await self.get_events_snapshots_by_user(user_id, [applet_id])
+        return snapshot
 
     async def count_events_by_user(self, user_id: uuid.UUID) -> int:
         """Count all events for user in applets that user is respondent."""
@@ -846,20 +915,17 @@ class ScheduleService:
             query_params=QueryParams(),
         )
         applet_ids = [applet.id for applet in applets]
-        count = 0
-
-        for applet_id in applet_ids:
-            count_user_events = await EventCRUD(self.session).count_individual_events_by_user(
-                applet_id=applet_id, user_id=user_id
-            )
-
-            count_general_events = await EventCRUD(self.session).count_general_events_by_user(
-                applet_id=applet_id, user_id=user_id
-            )
+        if not applet_ids:
+            return 0
 
-            count += count_general_events + count_user_events
+        count_user_events = await EventCRUD(self.session).count_individual_events_by_applets_and_user(
+            applet_ids=applet_ids, user_id=user_id
+        )
+        count_general_events = await EventCRUD(self.session).count_general_events_by_applets_and_user(
+            applet_ids=applet_ids, user_id=user_id
+        )
 
-        return count
+        return count_general_events + count_user_events
 
     async def _get_notifications_and_reminder(self, event_id: uuid.UUID) -> PublicNotification | None:
         """Get notifications and reminder for event."""
@@ -902,32 +968,6 @@ class ScheduleService:
         if not user_exist:
             raise UserNotFound(message=f"No such user with id={user_id}.")
 
-    async def _validate_existing_alwaysavailable(
-        self,
-        applet_id: uuid.UUID,
-        activity_id: uuid.UUID | None,
-        flow_id: uuid.UUID | None,
-        respondent_id: uuid.UUID | None,
-    ):
-        event_schemas = []
-
-        if activity_id:
-            event_schemas = await EventCRUD(self.session).get_all_by_applet_and_activity(
-                applet_id,
-                activity_id,
-                respondent_id,
-                True,
-            )
-        elif flow_id:
-            event_schemas = await EventCRUD(self.session).get_all_by_applet_and_flow(
-                applet_id,
-                flow_id,
-                respondent_id,
-                True,
-            )
-        if event_schemas:
-            raise EventAlwaysAvailableExistsError
-
     async def remove_individual_calendar(self, user_id: uuid.UUID, applet_id: uuid.UUID) -> None:
         """Remove individual calendar for user in applet."""
         # Check if applet exists
@@ -943,6 +983,7 @@ class ScheduleService:
         if not event_ids:
             raise ScheduleNotFoundError()
 
+        await invalidate_schedule_snapshots(self.session, applet_id, user_id)
         await self._delete_by_ids(
             event_ids,
             periodicity_ids,
@@ -951,49 +992,21 @@ class ScheduleService:
 
     async def import_schedule(self, schedules: list[EventRequest], applet_id: uuid.UUID) -> list[PublicEvent]:
         """Import schedule."""
-        events = []
-        for schedule in schedules:
-            if schedule.periodicity.type == PeriodicityType.ALWAYS:
-                # delete alwaysAvailable events of this activity or flow,
-                # if new event type is AA
-                await self._delete_by_activity_or_flow(
-                    applet_id=applet_id,
-                    activity_id=schedule.activity_id,
-                    flow_id=schedule.flow_id,
-                    respondent_id=schedule.respondent_id,
-                    only_always_available=True,
-                )
-            event = await self.create_schedule(applet_id=applet_id, schedule=schedule)
-            events.append(event)
-
-        return events
+        # alwaysAvailable events of imported activities and flows are replaced
+        return await self.create_schedules(schedules, applet_id, replace_always_available=True)
 
     async def create_schedule_individual(self, applet_id: uuid.UUID, respondent_id: uuid.UUID) -> list[PublicEvent]:
         """Create individual schedule for a user for the first time"""
         # get list of activity ids
-        activity_ids = []
         activities = await ActivitiesCRUD(self.session).get_by_applet_id(applet_id, is_reviewable=False)
         activity_ids = [activity.id for activity in activities if not activity.is_hidden]
 
         # get list of flow ids
-        flow_ids = []
         flows = await FlowsCRUD(self.session).get_by_applet_id(applet_id)
         flow_ids = [flow.id for flow in flows if not flow.is_hidden]
 
         # create default events
-        await self.create_default_schedules(
-            applet_id=applet_id,
-            activity_ids=activity_ids,
-            is_activity=True,
-            respondent_id=respondent_id,
-        )
-
-        await self.create_default_schedules(
-            applet_id=applet_id,
-            activity_ids=flow_ids,
-            is_activity=False,
-            respondent_id=respondent_id,
-        )
+        await self.create_schedules(self._build_default_events(activity_ids, flow_ids, respondent_id), applet_id)
 
         # get all events for user
         return await self.get_all_schedules(
@@ -1,4 +1,10 @@
+import uuid
+
+from apps.schedule.crud.events import EventCRUD
+from apps.schedule.service import ScheduleService
+from apps.schedule.service.cache import ScheduleSnapshotCache
 from apps.shared.test import BaseTest
+from infrastructure.database.crud import BaseCRUD
 
 
 class TestSchedule(BaseTest):
@@ -577,6 +583,7 @@ class TestSchedule(BaseTest):
 
         assert response.status_code == 200
         assert response.json()["count"] == 6
+        assert sum(len(applet["events"]) for applet in response.json()["result"]) == 6
 
     async def test_respondent_schedules_get_user_two_weeks(self, client):
         await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
@@ -655,6 +662,97 @@ class TestSchedule(BaseTest):
         )
         assert response.status_code == 200
 
+    async def test_schedule_get_user_by_applet_not_modified(self, client, mocker):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        url = self.schedule_detail_user_url.format(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1")
+        load_events = mocker.spy(ScheduleService, "_get_events_by_applets_and_user")
+
+        response = await client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert not response.content
+
+        response = await client.get(url, headers={"If-None-Match": '"outdated"'})
+        assert response.status_code == 200
+        assert response.headers["ETag"] == etag
+        # Events are loaded from the database only for the first request
+        load_events.assert_called_once()
+
+    async def test_schedule_get_user_by_applet_invalidated_by_individual_changes(self, client):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        applet_id = "92917a56-d586-4613-b7aa-991f2c4b15b1"
+        respondent_id = "7484f34a-3acc-4ee6-8a94-fd7299502fa1"
+        url = self.schedule_detail_user_url.format(applet_id=applet_id)
+
+        response = await client.get(url)
+        etag = response.headers["ETag"]
+
+        create_data = {
+            "start_time": "08:00:00",
+            "end_time": "09:00:00",
+            "access_before_schedule": True,
+            "one_time_completion": True,
+            "timer": None,
+            "timer_type": "NOT_SET",
+            "periodicity": {
+                "type": "MONTHLY",
+                "start_date": "2021-09-01",
+                "end_date": "2021-09-01",
+                "selected_date": "2023-09-01",
+            },
+            "respondent_id": respondent_id,
+            "activity_id": None,
+            "flow_id": "3013dfb1-9202-4577-80f2-ba7450fb5831",
+        }
+        response = await client.post(self.schedule_url.format(applet_id=applet_id), data=create_data)
+        event_id = response.json()["result"]["id"]
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert event_id in {event["id"] for event in response.json()["result"]["events"]}
+        etag = response.headers["ETag"]
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = await client.delete(self.remove_ind_url.format(applet_id=applet_id, respondent_id=respondent_id))
+        assert response.status_code == 204
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert event_id not in {event["id"] for event in response.json()["result"]["events"]}
+
+    async def test_schedules_get_user_all_not_modified_without_event_queries(self, client, mocker):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        response = await client.get(self.schedule_user_url)
+        etag = response.headers["ETag"]
+        event_queries = mocker.spy(EventCRUD, "_execute")
+
+        response = await client.get(self.schedule_user_url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        event_queries.assert_not_called()
+
+    async def test_schedules_get_user_all_invalidated_by_applet_changes(self, client):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+
+        response = await client.get(self.schedule_user_url)
+        etag = response.headers["ETag"]
+
+        response = await client.get(self.schedule_user_url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = await client.delete(self.schedule_url.format(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"))
+        assert response.status_code == 204
+
+        response = await client.get(self.schedule_user_url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     async def test_schedule_remove_individual(self, client):
         await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
 
@@ -767,6 +865,130 @@ class TestSchedule(BaseTest):
         assert len(events) == 2
         assert events[0]["respondentId"] == create_data[0]["respondent_id"]
 
+    async def test_schedule_import__events_replaced_in_order(self, client, lucy):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        activity_id = "09e3dbf0-aefb-4d0e-9177-bdb321bf3611"
+
+        def event(periodicity_type: str, notifications: list | None = None) -> dict:
+            return {
+                "start_time": "08:00:00",
+                "end_time": "09:00:00",
+                "access_before_schedule": True,
+                "one_time_completion": True,
+                "timer": "00:00:00",
+                "timer_type": "NOT_SET",
+                "periodicity": {
+                    "type": periodicity_type,
+                    "start_date": "2021-09-01",
+                    "end_date": "2023-09-01",
+                    "selected_date": "2023-01-01",
+                },
+                "respondent_id": str(lucy.id),
+                "activity_id": activity_id,
+                "flow_id": None,
+                "notification": {
+                    "notifications": notifications,
+                    "reminder": None,
+                }
+                if notifications
+                else None,
+            }
+
+        notifications = [
+            {"trigger_type": "FIXED", "at_time": "08:30:00"},
+            {"trigger_type": "FIXED", "at_time": "08:40:00"},
+        ]
+        # The second always available event replaces the daily and the
+        # first one, the weekly and the monthly events replace it.
+        create_data = [
+            event("ALWAYS"),
+            event("DAILY"),
+            event("ALWAYS"),
+            event("WEEKLY", notifications),
+            event("MONTHLY"),
+        ]
+
+        response = await client.post(
+            self.schedule_import_url.format(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"),
+            data=create_data,
+        )
+
+        assert response.status_code == 201, response.json()
+        events = response.json()["result"]
+        assert [event["periodicity"]["type"] for event in events] == ["WEEKLY", "MONTHLY"]
+        assert [item["atTime"] for item in events[0]["notification"]["notifications"]] == ["08:30:00", "08:40:00"]
+        assert events[1]["notification"] is None
+
+        response = await client.get(
+            self.schedule_url.format(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"),
+            dict(respondentId=str(lucy.id)),
+        )
+        saved = [event for event in response.json()["result"] if event["activityId"] == activity_id]
+        assert sorted(event["id"] for event in saved) == sorted(event["id"] for event in events)
+
+    async def test_schedule_import__one_statement_per_table(self, client, lucy, mocker):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        create_data = [
+            {
+                "start_time": "08:00:00",
+                "end_time": "09:00:00",
+                "access_before_schedule": True,
+                "one_time_completion": True,
+                "timer": "00:00:00",
+                "timer_type": "NOT_SET",
+                "periodicity": {
+                    "type": periodicity_type,
+                    "start_date": "2021-09-01",
+                    "end_date": "2023-09-01",
+                    "selected_date": "2023-01-01",
+                },
+                "respondent_id": str(lucy.id),
+                "activity_id": "09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+                "flow_id": None,
+                "notification": {
+                    "notifications": [{"trigger_type": "FIXED", "at_time": "08:30:00"}],
+                    "reminder": {"activity_incomplete": 1, "reminder_time": "08:40:00"},
+                },
+            }
+            for periodicity_type in ("DAILY", "WEEKLY", "MONTHLY")
+        ]
+        insert_many = mocker.spy(BaseCRUD, "_insert_many")
+
+        response = await client.post(
+            self.schedule_import_url.format(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"),
+            data=create_data,
+        )
+
+        assert response.status_code == 201, response.json()
+        assert len(response.json()["result"]) == 3
+        tables = [call.args[0].schema_class.__tablename__ for call in insert_many.call_args_list]
+        assert len(tables) == len(set(tables)) == 7
+        assert all(len(call.args[1]) == 3 for call in insert_many.call_args_list if call.args[1])
+
+    async def test_schedule_import__not_respondent(self, client):
+        await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
+        create_data = [
+            {
+                "start_time": "08:00:00",
+                "end_time": "09:00:00",
+                "access_before_schedule": True,
+                "one_time_completion": True,
+                "timer": "00:00:00",
+                "timer_type": "NOT_SET",
+                "periodicity": {"type": "ALWAYS"},
+                "respondent_id": str(uuid.uuid4()),
+                "activity_id": "09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+                "flow_id": None,
+            },
+        ]
+
+        response = await client.post(
+            self.schedule_import_url.format(applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"),
+            data=create_data,
+        )
+
+        assert response.status_code == 403, response.json()
+
     async def test_schedule_create_individual(self, client, lucy):
         await client.login(self.login_url, "tom@mindlogger.com", "Test1234!")
         response = await client.post(
@@ -780,3 +1002,15 @@ class TestSchedule(BaseTest):
         events = response.json()["result"]
         assert len(events) == 3
         assert events[0]["respondentId"] == str(lucy.id)
+
+    async def test_schedule_cache_keeps_version_created_concurrently(self, mocker):
+        cache = ScheduleSnapshotCache()
+        user_id, applet_id = uuid.uuid4(), uuid.uuid4()
+        versions = await cache.get_versions(user_id, [applet_id])
+
+        # Another request has read the versions before they were created
+        keys = [cache._build_version_key(applet_id), cache._build_version_key(applet_id, user_id)]
+        stored = await cache.redis_client.mget(keys)
+        mocker.patch.object(cache.redis_client, "mget", side_effect=[[None, None], stored])
+
+        assert await cache.get_versions(user_id, [applet_id]) == versions
@@ -13,6 +13,12 @@ class ResponseMulti(PublicModel, GenericModel, Generic[_BaseModel]):
     count: int = 0
 
 
+class CursorResponseMulti(ResponseMulti[_BaseModel], Generic[_BaseModel]):
+    """Multiple result with the cursor of the next page."""
+
+    cursor: str | None = None
+
+
 class Response(PublicModel, GenericModel, Generic[_BaseModel]):
     """Generic response model that consist only one result."""
 
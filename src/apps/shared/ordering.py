@@ -1,4 +1,5 @@
 from sqlalchemy import Column, asc, desc
+from sqlalchemy.sql.elements import ColumnElement
 
 __all__ = ["Ordering"]
 
@@ -63,3 +64,15 @@ class Ordering:
             return None
 
         return self.actions[sign](self.fields[field])
+
+    def get_keyset(self, *args) -> list[tuple[ColumnElement, bool]]:
+        """Returns (expression, descending) of known fields for keyset paging."""
+        keys = []
+        for value in args:
+            if not value:
+                continue
+            descending = value.startswith("-")
+            field = value.lstrip("+-")
+            if field in self.fields:
+                keys.append((self.fields[field], descending))
+        return keys
@@ -1,9 +1,26 @@
-from typing import List, Optional
+import base64
+import datetime
+import hashlib
+import hmac
+import json
+import uuid
+from gettext import gettext as _
+from typing import Any, List, Optional, Sequence
 
+from sqlalchemy import and_, literal, or_
 from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
 
+from apps.shared.exception import ValidationError
 from config import settings
 
+# Sort expression and whether it is sorted descending
+KeysetField = tuple[ColumnElement, bool]
+
+
+class InvalidCursorError(ValidationError):
+    message = _("Invalid cursor.")
+
 
 def check_limitation(func):
     def inner(query: Query, page=1, limit=10):
@@ -33,3 +50,91 @@ def paging_list(items: Optional[List], page=1, limit=10) -> list:
     start = (page - 1) * limit
     end = start + limit
     return items[start:end]
+
+
+def _dump_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"d": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    return value
+
+
+def _load_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "d" in value:
+            return datetime.datetime.fromisoformat(value["d"])
+        return uuid.UUID(value["u"])
+    return value
+
+
+def _sign_cursor(payload: bytes) -> str:
+    digest = hmac.new(settings.secrets.key, payload, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def encode_cursor(values: Sequence[Any], total: int | None = None, ordering: Sequence[str] = ()) -> str:
+    """Opaque token of the sort key of the last row of a page.
+    The total count of the first page is carried along, so following
+    pages do not count rows again. The token is signed and bound to the
+    ordering of the page.
+    """
+    payload = dict(v=[_dump_cursor_value(value) for value in values], t=total, o=list(ordering))
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    token = base64.urlsafe_b64encode(data).decode().rstrip("=")
+    return f"{token}.{_sign_cursor(data)}"
+
+
+def decode_cursor(cursor: str, ordering: Sequence[str] = ()) -> tuple[list, int | None]:
+    """Returns sort key values and the total count of the cursor.
+    Raises InvalidCursorError for a changed cursor or a cursor of
+    another ordering.
+    """
+    try:
+        token, signature = cursor.split(".")
+        data = _b64decode(token)
+        if not hmac.compare_digest(signature, _sign_cursor(data)):
+            raise InvalidCursorError()
+        payload = json.loads(data)
+        values = [_load_cursor_value(value) for value in payload["v"]]
+        total = payload["t"]
+        cursor_ordering = payload["o"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError() from e
+    if cursor_ordering != list(ordering):
+        raise InvalidCursorError()
+    if total is not None and not isinstance(total, int):
+        raise InvalidCursorError()
+    return values, total
+
+
+def keyset_paging(
+    query: Query,
+    keys: list[KeysetField],
+    after: list | None = None,
+    limit=10,
+    having: bool = False,
+) -> Query:
+    """Orders the query by keys and returns `limit` rows following the
+    `after` key values, instead of skipping rows with OFFSET.
+    The last key must be unique, key values can't be NULL.
+    Use having=True for keys with aggregate functions.
+    """
+    if after is not None:
+        if len(after) != len(keys):
+            raise InvalidCursorError()
+        values = [literal(value) for value in after]
+        conditions = []
+        for i, (expression, descending) in enumerate(keys):
+            previous_equal = [keys[j][0] == values[j] for j in range(i)]
+            following = expression < values[i] if descending else expression > values[i]
+            conditions.append(and_(*previous_equal, following))
+        condition = or_(*conditions)
+        query = query.having(condition) if having else query.where(condition)
+
+    query = query.order_by(*(expression.desc() if descending else expression.asc() for expression, descending in keys))
+    return query.limit(min(limit, settings.service.result_limit))
@@ -19,6 +19,15 @@ class BaseQueryParams(InternalModel):
     ordering: str | None
 
 
+class CursorQueryParams(BaseQueryParams):
+    """
+    Query parameters of lists with keyset pagination,
+    cursor of the previous page is used instead of the page number
+    """
+
+    cursor: str | None
+
+
 class QueryParams(InternalModel):
     """
     Class to group query parameters into single format
@@ -29,6 +38,7 @@ class QueryParams(InternalModel):
     page: int = Field(gt=0, default=1)
     limit: int = Field(gt=0, default=10, le=settings.service.result_limit)
     ordering: list[str] = Field(default_factory=list)
+    cursor: str | None
 
 
 def parse_query_params(query_param_class):
@@ -48,6 +58,8 @@ def parse_query_params(query_param_class):
                 grouped_query_params.page = val
             elif key == "limit":
                 grouped_query_params.limit = val
+            elif key == "cursor":
+                grouped_query_params.cursor = val
             elif key == "ordering":
                 grouped_query_params.ordering = list(map(_camelcase_to_snakecase, val.split(",")))
             else:
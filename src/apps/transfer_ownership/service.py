@@ -13,6 +13,7 @@ from apps.transfer_ownership.errors import TransferEmailError
 from apps.users import UsersCRUD
 from apps.users.domain import User
 from apps.workspaces.db.schemas import UserAppletAccessSchema
+from apps.workspaces.service.routing import invalidate_arbitrary_routing
 from config import settings
 
 
@@ -139,6 +140,8 @@ class TransferService:
         await UserAppletAccessCRUD(self.session).change_owner_of_applet_accesses(
             new_owner=self._user.id, applet_id=applet_id
         )
+        # the applet is routed to servers of the new owner workspace
+        await invalidate_arbitrary_routing(self.session)
 
     def _generate_transfer_url(self) -> str:
         domain = settings.service.urls.frontend.web_base
@@ -2,7 +2,8 @@ import datetime
 import uuid
 from typing import Any, Collection, List
 
-from sqlalchemy import false, select, true, update
+from sqlalchemy import DateTime, column, false, select, true, update, values
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Query
 
@@ -93,6 +94,22 @@ class UsersCRUD(BaseCRUD[UserSchema]):
         query = query.values(last_seen_at=datetime.datetime.utcnow())
         await self._execute(query)
 
+    async def update_last_seen_by_ids(self, last_seen: dict[uuid.UUID, datetime.datetime]) -> None:
+        """Update last_seen_at of many users with one
+        UPDATE ... FROM (VALUES ...) statement.
+        """
+        if not last_seen:
+            return
+        last_seen_values = values(
+            column("id", UUID(as_uuid=True)),
+            column("last_seen_at", DateTime()),
+            name="last_seen",
+        ).data(list(last_seen.items()))
+        query = update(UserSchema)
+        query = query.where(UserSchema.id == last_seen_values.c.id)
+        query = query.values(last_seen_at=last_seen_values.c.last_seen_at)
+        await self._execute(query)
+
     async def exist_by_id(self, id_: uuid.UUID) -> bool:
         query = select(UserSchema)
         query = query.where(UserSchema.id == id_)
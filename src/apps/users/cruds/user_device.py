@@ -1,5 +1,7 @@
 import uuid
 
+from sqlalchemy import delete
+
 from apps.users.db.schemas import UserDeviceSchema
 from infrastructure.database.crud import BaseCRUD
 
@@ -14,3 +16,8 @@ class UserDevicesCRUD(BaseCRUD[UserDeviceSchema]):
 
     async def remove_device(self, user_id: uuid.UUID, device_id: str) -> None:
         await self._delete(user_id=user_id, device_id=device_id)
+
+    async def remove_devices(self, device_ids: list[str]) -> None:
+        """Remove devices of all users, e.g. unregistered in FCM."""
+        query = delete(UserDeviceSchema).where(UserDeviceSchema.device_id.in_(device_ids))
+        await self._execute(query)
@@ -0,0 +1,64 @@
+import asyncio
+import datetime
+import uuid
+from contextlib import suppress
+
+from apps.users.cruds.user import UsersCRUD
+from config import settings
+from infrastructure.database import atomic, session_manager
+from infrastructure.logger import logger
+
+__all__ = ["LastSeenBuffer", "last_seen_buffer"]
+
+
+class LastSeenBuffer:
+    """Write-behind buffer for users' last_seen_at.
+
+    Authenticated requests only record the timestamp in memory, the
+    latest value per user is written to the database with one bulk
+    update every `flush_interval` seconds and on shutdown.
+    """
+
+    def __init__(self, flush_interval: int):
+        self.flush_interval = flush_interval
+        self._last_seen: dict[uuid.UUID, datetime.datetime] = {}
+        self._task: asyncio.Task | None = None
+
+    def touch(self, user_id: uuid.UUID) -> None:
+        self._last_seen[user_id] = datetime.datetime.utcnow()
+
+    async def flush(self) -> None:
+        if not self._last_seen:
+            return
+        last_seen, self._last_seen = self._last_seen, {}
+        try:
+            session_maker = session_manager.get_session()
+            async with session_maker() as session:
+                async with atomic(session):
+                    await UsersCRUD(session).update_last_seen_by_ids(last_seen)
+        except Exception as e:
+            # Keep timestamps for the next flush unless newer ones
+            # were recorded in the meantime.
+            for user_id, seen_at in last_seen.items():
+                self._last_seen.setdefault(user_id, seen_at)
+            logger.exception(f"Failed to flush last seen of {len(last_seen)} users: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+
+last_seen_buffer = LastSeenBuffer(settings.authentication.last_seen_flush_interval)
@@ -1,16 +1,83 @@
+import asyncio
 import json
+import uuid
 from json import JSONDecodeError
 
 from apps.answers.service import AnswerEncryptor, AnswerService
 from apps.job.constants import JobStatus
+from apps.job.domain import Job
 from apps.job.service import JobService
 from apps.shared.encryption import generate_dh_aes_key, generate_dh_public_key, generate_dh_user_private_key
+from apps.workspaces.domain.workspace import AnswerDbApplet
 from apps.workspaces.service.workspace import WorkspaceService
 from broker import broker
 from config import settings
 from infrastructure.database import atomic, session_manager
 from infrastructure.logger import logger
 
+# Checkpoint value of fully reencrypted applets
+CHECKPOINT_DONE = "done"
+
+
+async def _reencrypt_applet_answers(
+    session_maker,
+    default_session_maker,
+    job: Job,
+    user_id: uuid.UUID,
+    applet: AnswerDbApplet,
+    old_private_key: list,
+    new_private_key: list,
+    after_id: uuid.UUID | None = None,
+) -> bool:
+    try:
+        prime = json.loads(applet.encryption.prime)
+        base = json.loads(applet.encryption.base)
+        applet_pub_key = json.loads(applet.encryption.public_key)
+    except JSONDecodeError as e:
+        logger.error(f"Reencryption {user_id}: Wrong applet {applet.applet_id} encryption format, skip")
+        logger.exception(str(e))
+        return True
+
+    old_public_key = generate_dh_public_key(old_private_key, prime, base)
+    new_public_key = generate_dh_public_key(new_private_key, prime, base)
+    old_aes_key = generate_dh_aes_key(old_private_key, applet_pub_key, prime)
+    new_aes_key = generate_dh_aes_key(new_private_key, applet_pub_key, prime)
+
+    batch_limit = settings.task_answer_encryption.batch_limit
+    try:
+        while True:
+            async with session_maker() as session:
+                async with atomic(session):
+                    service = AnswerService(session)
+                    count, after_id = await service.reencrypt_user_answers(
+                        applet.applet_id,
+                        user_id,
+                        after_id=after_id,
+                        limit=batch_limit,
+                        old_public_key=old_public_key,
+                        new_public_key=new_public_key,
+                        encryptor=AnswerEncryptor(bytes(new_aes_key)),
+                        decryptor=AnswerEncryptor(bytes(old_aes_key)),
+                    )
+            done = count < batch_limit
+            # The batch is committed, a retry continues after it
+            async with default_session_maker() as session:
+                async with atomic(session):
+                    checkpoint = CHECKPOINT_DONE if done else str(after_id)
+                    await JobService(session, user_id).save_checkpoint(job.id, str(applet.applet_id), checkpoint)
+            if done:
+                return True
+
+    except Exception as e:
+        msg = f"Reencryption {user_id}: cannot process applet " f"{applet.applet_id}, skip"
+        logger.error(msg)
+        logger.exception(str(e))
+        async with default_session_maker() as session:
+            async with atomic(session):
+                details = dict(errors=[msg, str(e)])
+                await JobService(session, user_id).change_status(job.id, JobStatus.error, details)
+        return False
+
 
 @broker.task
 async def reencrypt_answers(
@@ -20,16 +87,20 @@ async def reencrypt_answers(
     new_password,
     retries: int | None = None,
     retry_timeout: int = settings.task_answer_encryption.retry_timeout,
+    run_id: str | None = None,
 ):
+    """Reencrypt all user answers with keys of the new password.
+
+    Applets are processed concurrently. Progress of every applet is stored
+    in the job details as a checkpoint of the run, so a retry of the same
+    run continues after the last committed batch.
+    """
     job_name = "reencrypt_answers"
     logger.info(f"Reencryption {user_id}: reencrypt_answers start")
 
     old_private_key = generate_dh_user_private_key(user_id, email, old_password)
     new_private_key = generate_dh_user_private_key(user_id, email, new_password)
 
-    batch_limit = settings.task_answer_encryption.batch_limit
-    success = True
-
     default_session_maker = session_manager.get_session()
     async with default_session_maker() as session:
         job_service = JobService(session, user_id)
@@ -38,58 +109,44 @@ async def reencrypt_answers(
             if job.status != JobStatus.in_progress:
                 await job_service.change_status(job.id, JobStatus.in_progress)
 
+            checkpoint: dict[str, str] = dict()
+            if run_id and job.details and job.details.get("run_id") == run_id:
+                checkpoint = job.details.get("checkpoint") or dict()
+            else:
+                run_id = run_id or uuid.uuid4().hex
+                await job_service.update_details(job.id, dict(run_id=run_id))
+
         db_applets = await WorkspaceService(session, user_id).get_user_answer_db_info()
 
+    semaphore = asyncio.Semaphore(settings.task_answer_encryption.max_concurrency)
+
+    async def _process(session_maker, applet: AnswerDbApplet) -> bool:
+        applet_checkpoint = checkpoint.get(str(applet.applet_id))
+        if applet_checkpoint == CHECKPOINT_DONE:
+            return True
+        after_id = uuid.UUID(applet_checkpoint) if applet_checkpoint else None
+        async with semaphore:
+            return await _reencrypt_applet_answers(
+                session_maker,
+                default_session_maker,
+                job,
+                user_id,
+                applet,
+                old_private_key,
+                new_private_key,
+                after_id,
+            )
+
+    coros = []
     for db_applet_data in db_applets:
         session_maker = default_session_maker
         if arb_uri := db_applet_data.database_uri:
             session_maker = session_manager.get_session(arb_uri)
-
         for applet in db_applet_data.applets:
-            try:
-                prime = json.loads(applet.encryption.prime)
-                base = json.loads(applet.encryption.base)
-                applet_pub_key = json.loads(applet.encryption.public_key)
-            except JSONDecodeError as e:
-                logger.error(f"Reencryption {user_id}: Wrong applet {applet.applet_id} encryption format, skip")
-                logger.exception(str(e))
-                continue
-
-            old_public_key = generate_dh_public_key(old_private_key, prime, base)
-            new_public_key = generate_dh_public_key(new_private_key, prime, base)
-            old_aes_key = generate_dh_aes_key(old_private_key, applet_pub_key, prime)
-            new_aes_key = generate_dh_aes_key(new_private_key, applet_pub_key, prime)
-
-            page = 1
-            try:
-                while True:
-                    async with session_maker() as session:
-                        async with atomic(session):
-                            service = AnswerService(session)
-                            count = await service.reencrypt_user_answers(
-                                applet.applet_id,
-                                user_id,
-                                page=page,
-                                limit=batch_limit,
-                                old_public_key=old_public_key,
-                                new_public_key=new_public_key,
-                                encryptor=AnswerEncryptor(bytes(new_aes_key)),
-                                decryptor=AnswerEncryptor(bytes(old_aes_key)),
-                            )
-                            if count < batch_limit:
-                                break
-                            page += 1
-
-            except Exception as e:
-                msg = f"Reencryption {user_id}: cannot process applet " f"{applet.applet_id}, skip"
-                logger.error(msg)
-                logger.exception(str(e))
-                async with default_session_maker() as session:
-                    async with atomic(session):
-                        details = dict(errors=[msg, str(e)])
-                        await JobService(session, user_id).change_status(job.id, JobStatus.error, details)
-                success = False
-                continue
+            coros.append(_process(session_maker, applet))
+
+    results = await asyncio.gather(*coros)
+    success = all(results)
 
     # Update job status, schedule retry
     async with default_session_maker() as session:
@@ -112,5 +169,6 @@ async def reencrypt_answers(
                             new_password,
                             retries=retries,
                             retry_timeout=retry_timeout,
+                            run_id=run_id,
                         )
                     )
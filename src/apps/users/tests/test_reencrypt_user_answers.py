@@ -353,3 +353,82 @@ async def test_reencrypt_answers_arbitrary(
         0
     ].answer
     assert answer_before != answer_after
+
+
+async def test_reencrypt_answers_in_batches(
+    session: AsyncSession,
+    tom: User,
+    tom_create: UserCreate,
+    mocker: MockerFixture,
+    job_model: Job,
+    applet: AppletFull,
+    answer: AnswerSchema,
+    answer_second: AnswerSchema,
+):
+    act_id_version = f"{applet.activities[0].id}_{applet.version}"
+    answer_ids = (answer.id, answer_second.id)
+    answers_before = [
+        (await AnswerItemsCRUD(session).get_by_answer_and_activity(answer_id, [act_id_version]))[0].answer
+        for answer_id in answer_ids
+    ]
+    mocker.patch("config.settings.task_answer_encryption.batch_limit", 1)
+    mocker.patch("apps.job.service.JobService.get_or_create_owned", return_value=job_model)
+    mocker.patch("apps.job.crud.JobCRUD.update")
+    spy = mocker.spy(JobService, "save_checkpoint")
+    task = await reencrypt_answers.kiq(tom.id, tom.email_encrypted, tom_create.password, "new-pass", retries=0)
+    await task.wait_result()
+    # two batches with one item and the last empty batch
+    assert spy.await_count == 3
+    spy.assert_awaited_with(ANY, job_model.id, str(applet.id), "done")
+    answers_after = [
+        (await AnswerItemsCRUD(session).get_by_answer_and_activity(answer_id, [act_id_version]))[0].answer
+        for answer_id in answer_ids
+    ]
+    for before, after in zip(answers_before, answers_after):
+        assert before != after
+
+
+async def test_reencrypt_answers_retry_continues_from_checkpoint(
+    session: AsyncSession,
+    tom: User,
+    tom_create: UserCreate,
+    mocker: MockerFixture,
+    job_model: Job,
+    applet: AppletFull,
+    answer: AnswerSchema,
+):
+    answer_id = answer.id
+    act_id_version = f"{applet.activities[0].id}_{applet.version}"
+    answer_before = (await AnswerItemsCRUD(session).get_by_answer_and_activity(answer_id, [act_id_version]))[0].answer
+    job_model.details = dict(run_id="run", checkpoint={str(applet.id): "done"})
+    mocker.patch("apps.job.service.JobService.get_or_create_owned", return_value=job_model)
+    mocker.patch("apps.job.crud.JobCRUD.update")
+    spy = mocker.spy(AnswerService, "reencrypt_user_answers")
+    task = await reencrypt_answers.kiq(
+        tom.id, tom.email_encrypted, tom_create.password, "new-pass", retries=0, run_id="run"
+    )
+    await task.wait_result()
+    spy.assert_not_awaited()
+    answer_after = (await AnswerItemsCRUD(session).get_by_answer_and_activity(answer_id, [act_id_version]))[0].answer
+    assert answer_before == answer_after
+
+
+async def test_reencrypt_answers_new_run_ignores_checkpoint(
+    session: AsyncSession,
+    tom: User,
+    tom_create: UserCreate,
+    mocker: MockerFixture,
+    job_model: Job,
+    applet: AppletFull,
+    answer: AnswerSchema,
+):
+    answer_id = answer.id
+    act_id_version = f"{applet.activities[0].id}_{applet.version}"
+    answer_before = (await AnswerItemsCRUD(session).get_by_answer_and_activity(answer_id, [act_id_version]))[0].answer
+    job_model.details = dict(run_id="previous", checkpoint={str(applet.id): "done"})
+    mocker.patch("apps.job.service.JobService.get_or_create_owned", return_value=job_model)
+    mocker.patch("apps.job.crud.JobCRUD.update")
+    task = await reencrypt_answers.kiq(tom.id, tom.email_encrypted, tom_create.password, "new-pass", retries=0)
+    await task.wait_result()
+    answer_after = (await AnswerItemsCRUD(session).get_by_answer_and_activity(answer_id, [act_id_version]))[0].answer
+    assert answer_before != answer_after
@@ -0,0 +1,35 @@
+import datetime
+from typing import cast
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.users.cruds.user import UsersCRUD
+from apps.users.db.schemas import UserSchema
+from apps.users.domain import User
+from apps.users.services.last_seen import LastSeenBuffer
+
+pytestmark = pytest.mark.usefixtures("mock_get_session")
+
+
+async def test_flush_last_seen(faketime, user: User, session: AsyncSession):
+    buffer = LastSeenBuffer(flush_interval=60)
+    buffer.touch(user.id)
+    await buffer.flush()
+    user_db = await UsersCRUD(session)._get("id", user.id)
+    user_db = cast(UserSchema, user_db)
+    assert user_db.last_seen_at == faketime.current_utc
+
+
+async def test_flush_last_seen__latest_timestamp_is_kept(
+    faketime, mocker: MockerFixture, user: User, session: AsyncSession
+):
+    buffer = LastSeenBuffer(flush_interval=60)
+    buffer.touch(user.id)
+    mocker.patch.object(faketime, "current_utc", faketime.current_utc + datetime.timedelta(minutes=1))
+    buffer.touch(user.id)
+    await buffer.stop()
+    user_db = await UsersCRUD(session)._get("id", user.id)
+    user_db = cast(UserSchema, user_db)
+    assert user_db.last_seen_at == faketime.current_utc
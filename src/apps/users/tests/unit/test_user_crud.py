@@ -1,3 +1,4 @@
+import datetime
 import uuid
 from typing import cast
 
@@ -147,6 +148,17 @@ async def test_update_last_seet_at(
     assert updated.last_seen_at == faketime.current_utc
 
 
+async def test_update_last_seen_by_ids(user: User, tom: User, session: AsyncSession):
+    crud = UsersCRUD(session)
+    user_seen_at = datetime.datetime(2024, 1, 1, 10, 0, 0)
+    tom_seen_at = datetime.datetime(2024, 1, 2, 10, 0, 0)
+    await crud.update_last_seen_by_ids({user.id: user_seen_at, tom.id: tom_seen_at})
+    await session.commit()
+    users = await crud.get_by_ids([user.id, tom.id])
+    last_seen = {u.id: u.last_seen_at for u in users}
+    assert last_seen == {user.id: user_seen_at, tom.id: tom_seen_at}
+
+
 async def test_user_exists_by_id(user: User, session: AsyncSession):
     crud = UsersCRUD(session)
     result = await crud.exist_by_id(user.id)
@@ -45,3 +45,10 @@ async def test_add_user_device_previous_device_is_removed(
     crud = UserDevicesCRUD(session)
     count = await crud.count(user_id=user.id)
     assert count == 1
+
+
+async def test_remove_devices(device_user: UserDeviceSchema, session: AsyncSession, user_device_id: str):
+    crud = UserDevicesCRUD(session)
+    await crud.remove_devices([user_device_id, "unknown"])
+    device = await crud._get("device_id", user_device_id)
+    assert not device
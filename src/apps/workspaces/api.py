@@ -10,7 +10,7 @@ from apps.applets.filters import AppletQueryParams
 from apps.applets.service import AppletService
 from apps.authentication.deps import get_current_user
 from apps.invitations.services import InvitationsService
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import CursorResponseMulti, Response, ResponseMulti
 from apps.shared.query_params import BaseQueryParams, QueryParams, parse_query_params
 from apps.users.domain import User
 from apps.users.services.user import UserService
@@ -33,7 +33,7 @@ from apps.workspaces.domain.workspace import (
     WorkspacePrioritizedRole,
     WorkspaceSearchAppletPublic,
 )
-from apps.workspaces.filters import WorkspaceUsersQueryParams
+from apps.workspaces.filters import WorkspaceRespondentsQueryParams, WorkspaceUsersQueryParams
 from apps.workspaces.service.check_access import CheckAccessService
 from apps.workspaces.service.user_access import UserAccessService
 from apps.workspaces.service.user_applet_access import UserAppletAccessService
@@ -236,40 +236,40 @@ async def applet_remove_respondent_access(
 async def workspace_respondents_list(
     owner_id: uuid.UUID,
     user: User = Depends(get_current_user),
-    query_params: QueryParams = Depends(parse_query_params(WorkspaceUsersQueryParams)),
+    query_params: QueryParams = Depends(parse_query_params(WorkspaceRespondentsQueryParams)),
     session=Depends(get_session),
     answer_session=Depends(get_answer_session_by_owner_id),
-) -> ResponseMulti[PublicWorkspaceRespondent]:
+) -> CursorResponseMulti[PublicWorkspaceRespondent]:
     service = WorkspaceService(session, user.id)
     await service.exists_by_owner_id(owner_id)
 
     await CheckAccessService(session, user.id).check_workspace_respondent_list_access(owner_id)
 
-    data, total = await service.get_workspace_respondents(owner_id, None, deepcopy(query_params))
+    data, total, cursor = await service.get_workspace_respondents(owner_id, None, deepcopy(query_params))
     respondents = await AnswerService(
         session=session, arbitrary_session=answer_session
     ).fill_last_activity_workspace_respondent(data)
-    return ResponseMulti(result=respondents, count=total)
+    return CursorResponseMulti(result=respondents, count=total, cursor=cursor)
 
 
 async def workspace_applet_respondents_list(
     owner_id: uuid.UUID,
     applet_id: uuid.UUID,
     user: User = Depends(get_current_user),
-    query_params: QueryParams = Depends(parse_query_params(WorkspaceUsersQueryParams)),
+    query_params: QueryParams = Depends(parse_query_params(WorkspaceRespondentsQueryParams)),
     session=Depends(get_session),
     answer_session=Depends(get_answer_session_by_owner_id),
-) -> ResponseMulti[PublicWorkspaceRespondent]:
+) -> CursorResponseMulti[PublicWorkspaceRespondent]:
     service = WorkspaceService(session, user.id)
     await service.exists_by_owner_id(owner_id)
 
     await CheckAccessService(session, user.id).check_applet_respondent_list_access(applet_id)
 
-    data, total = await service.get_workspace_respondents(owner_id, applet_id, deepcopy(query_params))
+    data, total, cursor = await service.get_workspace_respondents(owner_id, applet_id, deepcopy(query_params))
     respondents = await AnswerService(
         session=session, arbitrary_session=answer_session
     ).fill_last_activity_workspace_respondent(data, applet_id)
-    return ResponseMulti(result=respondents, count=total)
+    return CursorResponseMulti(result=respondents, count=total, cursor=cursor)
 
 
 async def workspace_managers_list(
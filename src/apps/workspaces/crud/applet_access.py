@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import JSON, and_, case, exists, func, or_, select, text
+from sqlalchemy import JSON, and_, case, distinct, exists, func, or_, select, text
 from sqlalchemy.orm import Query
 
 from apps.users import UserSchema
@@ -42,6 +42,24 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         db_result = await self._execute(select(query))
         return db_result.scalars().first()
 
+    async def get_user_applet_roles(self, applet_id: uuid.UUID, user_id: uuid.UUID) -> dict[Role, dict]:
+        query: Query = select(UserAppletAccessSchema.role, UserAppletAccessSchema.meta)
+        query = query.where(UserAppletAccessSchema.soft_exists())
+        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
+        query = query.where(UserAppletAccessSchema.user_id == user_id)
+
+        db_result = await self._execute(query)
+        return {Role(role): meta or dict() for role, meta in db_result.all()}
+
+    async def get_user_workspace_roles(self, owner_id: uuid.UUID, user_id: uuid.UUID) -> set[Role]:
+        query: Query = select(distinct(UserAppletAccessSchema.role))
+        query = query.where(UserAppletAccessSchema.soft_exists())
+        query = query.where(UserAppletAccessSchema.owner_id == owner_id)
+        query = query.where(UserAppletAccessSchema.user_id == user_id)
+
+        db_result = await self._execute(query)
+        return {Role(role) for role in db_result.scalars().all()}
+
     async def check_export_access(
         self,
         applet_id: uuid.UUID,
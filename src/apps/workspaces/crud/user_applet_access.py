@@ -7,7 +7,7 @@ from asyncpg.exceptions import UniqueViolationError
 from pydantic import parse_obj_as
 from sqlalchemy import Unicode, and_, any_, case, distinct, exists, func, literal_column, or_, select, text, update
 from sqlalchemy.dialects.postgresql import ARRAY, UUID, aggregate_order_by, insert
-from sqlalchemy.engine import Result
+from sqlalchemy.engine import Result, Row
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Query
 from sqlalchemy.sql.functions import count
@@ -18,7 +18,7 @@ from apps.schedule.db.schemas import EventSchema, UserEventsSchema
 from apps.shared.encryption import get_key
 from apps.shared.filtering import FilterField, Filtering
 from apps.shared.ordering import Ordering
-from apps.shared.paging import paging
+from apps.shared.paging import decode_cursor, encode_cursor, keyset_paging, paging
 from apps.shared.query_params import QueryParams
 from apps.shared.searching import Searching
 from apps.users import UserSchema
@@ -40,7 +40,7 @@ class _AppletUsersFilter(Filtering):
 class _WorkspaceRespondentOrdering(Ordering):
     is_pinned = Ordering.Clause(literal_column("is_pinned"))
     secret_ids = Ordering.Clause(literal_column("secret_ids"))
-    created_at = Ordering.Clause(func.min(UserAppletAccessSchema.created_at))
+    created_at = Ordering.Clause(literal_column("created_at"))
     # last_seen = Ordering.Clause(
     #     func.coalesce(UserSchema.last_seen_at, UserSchema.created_at)
     # )
@@ -203,7 +203,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
 
         return result
 
-    async def upsert_user_applet_access_list(self, schemas: list[UserAppletAccessSchema]):
+    async def upsert_user_applet_access_list(self, schemas: list[UserAppletAccessSchema]) -> list[Row]:
         values_list = [
             {
                 "invitor_id": schema.invitor_id,
@@ -217,44 +217,16 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
             }
             for schema in schemas
         ]
-
-        stmt = insert(UserAppletAccessSchema).values(values_list)
-        stmt = stmt.on_conflict_do_update(
+        return await self._insert_many(
+            values_list,
             index_elements=[
                 UserAppletAccessSchema.user_id,
                 UserAppletAccessSchema.applet_id,
                 UserAppletAccessSchema.role,
             ],
-            set_={
-                "invitor_id": stmt.excluded.invitor_id,
-                "owner_id": stmt.excluded.owner_id,
-                "user_id": stmt.excluded.user_id,
-                "applet_id": stmt.excluded.applet_id,
-                "role": stmt.excluded.role,
-                "is_deleted": stmt.excluded.is_deleted,
-                "meta": stmt.excluded.meta,
-                "nickname": stmt.excluded.nickname,
-            },
-        )
-
-        await self._execute(stmt)
-
-        return await self.get_user_applet_access_list(schemas)
-
-    async def get_user_applet_access_list(self, schemas: list[UserAppletAccessSchema]):
-        user_ids = [schema.user_id for schema in schemas]
-        applet_ids = [schema.applet_id for schema in schemas]
-        roles = [schema.role for schema in schemas]
-
-        query = select(UserAppletAccessSchema).where(
-            (UserAppletAccessSchema.user_id.in_(user_ids))
-            & (UserAppletAccessSchema.applet_id.in_(applet_ids))
-            & (UserAppletAccessSchema.role.in_(roles))
+            update_columns=["invitor_id", "owner_id", "is_deleted", "meta", "nickname"],
         )
 
-        result = await self._execute(query)
-        return result.fetchall()
-
     async def get(self, user_id: uuid.UUID, applet_id: uuid.UUID, role: str) -> UserAppletAccessSchema | None:
         query: Query = select(UserAppletAccessSchema)
         query = query.where(UserAppletAccessSchema.soft_exists())
@@ -297,6 +269,16 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         result = await self._execute(query)
         return result.scalars().first()
 
+    async def get_respondent_ids_by_applet(self, applet_id: uuid.UUID, user_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """Return ids of users from the list who are respondents of the applet."""
+        query: Query = select(distinct(UserAppletAccessSchema.user_id))
+        query = query.where(UserAppletAccessSchema.soft_exists())
+        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
+        query = query.where(UserAppletAccessSchema.user_id.in_(user_ids))
+        query = query.where(UserAppletAccessSchema.role == Role.RESPONDENT)
+        result = await self._execute(query)
+        return result.scalars().all()
+
     async def get_user_roles_to_applet(self, user_id: uuid.UUID, applet_id: uuid.UUID) -> list[str]:
         query: Query = select(distinct(UserAppletAccessSchema.role))
         query = query.where(UserAppletAccessSchema.soft_exists())
@@ -343,7 +325,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         owner_id: uuid.UUID,
         applet_id: uuid.UUID | None,
         query_params: QueryParams,
-    ) -> Tuple[list[WorkspaceRespondent], int]:
+    ) -> Tuple[list[WorkspaceRespondent], int, str | None]:
         schedule_exists = (
             select(UserEventsSchema)
             .join(EventSchema, EventSchema.id == UserEventsSchema.event_id)
@@ -416,6 +398,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
                     )
                 ).label("secret_ids"),
                 is_pinned.label("is_pinned"),
+                func.min(UserAppletAccessSchema.created_at).label("created_at"),
                 func.array_agg(
                     func.json_build_object(
                         text("'applet_id'"),
@@ -464,20 +447,35 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         if query_params.search:
             query = query.having(_WorkspaceRespondentSearch().get_clauses(query_params.search))
 
-        coro_total = self._execute(select(count()).select_from(query.with_only_columns(UserSchema.id).subquery()))
+        keys = _WorkspaceRespondentOrdering().get_keyset(*query_params.ordering)
+        keys.append((literal_column("id"), False))
+        after, cursor_total = None, None
+        if query_params.cursor:
+            after, cursor_total = decode_cursor(query_params.cursor, query_params.ordering)
 
-        if query_params.ordering:
-            query = query.order_by(*_WorkspaceRespondentOrdering().get_clauses(*query_params.ordering))
-        query = paging(query, query_params.page, query_params.limit)
+        query_total = select(count()).select_from(query.with_only_columns(UserSchema.id).subquery())
 
-        coro_data = self._execute(query)
+        if after is None:
+            query = query.order_by(*(key.desc() if descending else key.asc() for key, descending in keys))
+            query = paging(query, query_params.page, query_params.limit)
+        else:
+            # Output columns of the grouped query can't be compared in HAVING
+            query = keyset_paging(select(query.subquery()), keys, after, query_params.limit)
 
-        res_data, res_total = await asyncio.gather(coro_data, coro_total)
+        if cursor_total is None:
+            res_data, res_total = await asyncio.gather(self._execute(query), self._execute(query_total))
+            total: int = res_total.scalar()
+        else:
+            res_data = await self._execute(query)
+            total = cursor_total
+        rows = res_data.all()
 
-        data = parse_obj_as(list[WorkspaceRespondent], res_data.all())
-        total = res_total.scalar()
+        cursor = None
+        if len(rows) == query_params.limit:
+            cursor = encode_cursor([rows[-1]._mapping[key.name] for key, _ in keys], total, query_params.ordering)
 
-        return data, total
+        data = parse_obj_as(list[WorkspaceRespondent], rows)
+        return data, total, cursor
 
     async def get_workspace_managers(
         self,
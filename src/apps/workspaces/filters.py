@@ -1,7 +1,11 @@
-from apps.shared.query_params import BaseQueryParams
+from apps.shared.query_params import BaseQueryParams, CursorQueryParams
 from apps.workspaces.domain.constants import Role
 
 
 class WorkspaceUsersQueryParams(BaseQueryParams):
     role: Role | None
     ordering = "-isPinned,-createdAt"
+
+
+class WorkspaceRespondentsQueryParams(WorkspaceUsersQueryParams, CursorQueryParams):
+    pass
@@ -7,7 +7,7 @@ from apps.applets.api import applet_create
 from apps.applets.domain.applet_full import PublicAppletFull
 from apps.applets.domain.applets import public_detail
 from apps.applets.router import router as applet_router
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import CursorResponseMulti, Response, ResponseMulti
 from apps.shared.domain.response import AUTHENTICATION_ERROR_RESPONSES, DEFAULT_OPENAPI_RESPONSE
 from apps.shared.response import EmptyResponse
 from apps.workspaces.api import (
@@ -164,9 +164,9 @@ router.post(
 router.get(
     "/{owner_id}/respondents",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseMulti[PublicWorkspaceRespondent],
+    response_model=CursorResponseMulti[PublicWorkspaceRespondent],
     responses={
-        status.HTTP_200_OK: {"model": ResponseMulti[PublicWorkspaceRespondent]},
+        status.HTTP_200_OK: {"model": CursorResponseMulti[PublicWorkspaceRespondent]},
         **DEFAULT_OPENAPI_RESPONSE,
         **AUTHENTICATION_ERROR_RESPONSES,
     },
@@ -175,9 +175,9 @@ router.get(
 router.get(
     "/{owner_id}/applets/{applet_id}/respondents",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseMulti[PublicWorkspaceRespondent],
+    response_model=CursorResponseMulti[PublicWorkspaceRespondent],
     responses={
-        status.HTTP_200_OK: {"model": ResponseMulti[PublicWorkspaceRespondent]},
+        status.HTTP_200_OK: {"model": CursorResponseMulti[PublicWorkspaceRespondent]},
         **DEFAULT_OPENAPI_RESPONSE,
         **AUTHENTICATION_ERROR_RESPONSES,
     },
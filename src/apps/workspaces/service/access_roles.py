@@ -0,0 +1,106 @@
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from apps.workspaces.crud.applet_access import AppletAccessCRUD
+from apps.workspaces.db.schemas import UserAppletAccessSchema
+from apps.workspaces.domain.constants import Role
+
+__all__ = ["AccessRoles"]
+
+_MEMO_KEY = "access_roles"
+_PRIORITY = [
+    Role.OWNER,
+    Role.MANAGER,
+    Role.COORDINATOR,
+    Role.EDITOR,
+    Role.REVIEWER,
+    Role.RESPONDENT,
+    Role.SUPER_ADMIN,
+]
+
+
+class AccessRoles:
+    """Roles of the user resolved once per session.
+
+    All roles of the user for an applet or a workspace are loaded with one
+    query and memoized in the session, so access checks of one request
+    share them. The memo is dropped when user applet accesses are changed
+    through the session and when the transaction ends.
+    """
+
+    def __init__(self, session, user_id: uuid.UUID):
+        self.session = session
+        self.user_id = user_id
+
+    @property
+    def _memo(self) -> dict:
+        return self.session.info.setdefault(_MEMO_KEY, dict())
+
+    async def for_applet(self, applet_id: uuid.UUID) -> dict[Role, dict]:
+        """Returns meta of every role of the user in the applet."""
+        key = ("applet", self.user_id, applet_id)
+        if (roles := self._memo.get(key)) is not None:
+            return roles
+
+        roles = await AppletAccessCRUD(self.session).get_user_applet_roles(applet_id, self.user_id)
+        self._memo[key] = roles
+        return roles
+
+    async def for_workspace(self, owner_id: uuid.UUID) -> set[Role]:
+        key = ("workspace", self.user_id, owner_id)
+        if (roles := self._memo.get(key)) is not None:
+            return roles
+
+        roles = await AppletAccessCRUD(self.session).get_user_workspace_roles(owner_id, self.user_id)
+        self._memo[key] = roles
+        return roles
+
+    async def has_any_for_applet(self, applet_id: uuid.UUID, roles: list[Role] | None = None) -> bool:
+        if roles is None:
+            roles = Role.as_list()
+        applet_roles = await self.for_applet(applet_id)
+        return any(role in applet_roles for role in roles)
+
+    async def has_any_for_workspace(self, owner_id: uuid.UUID, roles: list[Role] | None = None) -> bool:
+        if roles is None:
+            roles = Role.managers()
+        workspace_roles = await self.for_workspace(owner_id)
+        return any(role in workspace_roles for role in roles)
+
+    async def get_by_roles(self, applet_id: uuid.UUID, ordered_roles: list[Role]) -> Role | None:
+        """Returns the first role of ordered_roles the user has."""
+        applet_roles = await self.for_applet(applet_id)
+        return next((role for role in ordered_roles if role in applet_roles), None)
+
+    async def get_priority_role(self, applet_id: uuid.UUID) -> Role | None:
+        return await self.get_by_roles(applet_id, _PRIORITY)
+
+    async def get_meta(self, applet_id: uuid.UUID, role: Role) -> dict | None:
+        applet_roles = await self.for_applet(applet_id)
+        return applet_roles.get(role)
+
+
+def _forget(session: Session):
+    session.info.pop(_MEMO_KEY, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _forget_on_change(orm_execute_state: ORMExecuteState):
+    if orm_execute_state.is_select:
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is UserAppletAccessSchema.__table__:
+        _forget(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_flush")
+def _forget_on_flush(session: Session, flush_context):
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(instance, UserAppletAccessSchema) for instance in changed):
+        _forget(session)
+
+
+event.listen(Session, "after_commit", _forget)
+event.listen(Session, "after_rollback", _forget)
@@ -1,6 +1,5 @@
 import uuid
 
-from apps.workspaces.crud.applet_access import AppletAccessCRUD
 from apps.workspaces.domain.constants import Role
 from apps.workspaces.errors import (
     AnswerCheckAccessDenied,
@@ -19,6 +18,7 @@ from apps.workspaces.errors import (
     WorkspaceAccessDenied,
     WorkspaceFolderManipulationAccessDenied,
 )
+from apps.workspaces.service.access_roles import AccessRoles
 
 
 class CheckAccessService:
@@ -26,6 +26,7 @@ class CheckAccessService:
         self.session = session
         self.user_id = user_id
         self.is_super_admin = is_super_admin
+        self.roles = AccessRoles(session, user_id)
 
     async def _check_workspace_roles(
         self,
@@ -37,7 +38,7 @@ class CheckAccessService:
         if owner_id == self.user_id:
             return
 
-        has_access = await AppletAccessCRUD(self.session).has_any_roles_for_workspace(owner_id, self.user_id, roles)
+        has_access = await self.roles.has_any_for_workspace(owner_id, roles)
 
         if not has_access:
             raise exception or WorkspaceAccessDenied()
@@ -49,7 +50,7 @@ class CheckAccessService:
         *,
         exception=None,
     ):
-        has_access = await AppletAccessCRUD(self.session).has_any_roles_for_applet(applet_id, self.user_id, roles)
+        has_access = await self.roles.has_any_for_applet(applet_id, roles)
 
         if not has_access:
             raise exception or AppletAccessDenied()
@@ -100,18 +101,18 @@ class CheckAccessService:
     async def check_applet_create_access(self, owner_id: uuid.UUID):
         if owner_id == self.user_id:
             return
-        has_access = await AppletAccessCRUD(self.session).can_create_applet(owner_id, self.user_id)
+        has_access = await self.roles.has_any_for_workspace(owner_id, Role.editors())
         if not has_access:
             raise AppletCreationAccessDenied()
 
     async def check_applet_edit_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_edit_applet(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, Role.editors())
 
         if not has_access:
             raise AppletEditionAccessDenied()
 
     async def check_applet_retention_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_set_retention(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, [Role.OWNER, Role.MANAGER])
 
         if not has_access:
             raise AppletEditionAccessDenied()
@@ -124,47 +125,47 @@ class CheckAccessService:
         )
 
     async def check_applet_duplicate_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_edit_applet(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, Role.editors())
         if not has_access:
             raise AppletDuplicateAccessDenied()
 
     async def check_applet_delete_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_edit_applet(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, Role.editors())
         if not has_access:
             raise AppletDeleteAccessDenied()
 
     async def check_answer_create_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).has_role(applet_id, self.user_id, Role.RESPONDENT)
+        has_access = await self.roles.has_any_for_applet(applet_id, [Role.RESPONDENT])
 
         if not has_access:
             raise AnswerCreateAccessDenied()
 
     async def check_answer_review_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_see_data(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, Role.reviewers())
 
         if not has_access:
             raise AnswerViewAccessDenied()
 
     async def check_note_crud_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_see_data(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, Role.reviewers())
 
         if not has_access:
             raise AnswerNoteCRUDAccessDenied()
 
     async def check_applet_invite_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_invite_anyone(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, Role.inviters())
 
         if not has_access:
             raise AppletInviteAccessDenied()
 
     async def check_applet_schedule_create_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).can_set_schedule_and_notifications(applet_id, self.user_id)
+        has_access = await self.roles.has_any_for_applet(applet_id, Role.schedulers())
 
         if not has_access:
             raise AppletSetScheduleAccessDenied()
 
     async def check_create_transfer_ownership_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).has_role(applet_id, self.user_id, Role.OWNER)
+        has_access = await self.roles.has_any_for_applet(applet_id, [Role.OWNER])
 
         if not has_access:
             raise TransferOwnershipAccessDenied()
@@ -174,22 +175,23 @@ class CheckAccessService:
             raise PublishConcealAccessDenied()
 
     async def check_answers_export_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).check_export_access(applet_id, self.user_id)
-
-        if not has_access:
+        if await self.roles.has_any_for_applet(applet_id, [Role.OWNER, Role.MANAGER, Role.RESPONDENT]):
+            return
+        reviewer_meta = await self.roles.get_meta(applet_id, Role.REVIEWER)
+        if not reviewer_meta or not reviewer_meta.get("respondents"):
             raise AppletAccessDenied()
 
     async def check_applet_share_library_access(self, applet_id: uuid.UUID):
         await self._check_applet_roles(applet_id, [Role.OWNER])
 
     async def check_answers_mobile_data_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).has_role(applet_id, self.user_id, Role.RESPONDENT)
+        has_access = await self.roles.has_any_for_applet(applet_id, [Role.RESPONDENT])
 
         if not has_access:
             raise AppletAccessDenied()
 
     async def check_answer_check_access(self, applet_id: uuid.UUID):
-        has_access = await AppletAccessCRUD(self.session).has_role(applet_id, self.user_id, Role.RESPONDENT)
+        has_access = await self.roles.has_any_for_applet(applet_id, [Role.RESPONDENT])
 
         if not has_access:
             raise AnswerCheckAccessDenied()
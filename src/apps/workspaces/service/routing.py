@@ -0,0 +1,118 @@
+import asyncio
+import uuid
+
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from apps.workspaces.domain.workspace import WorkspaceArbitrary
+from config import settings
+from infrastructure.logger import logger
+from infrastructure.utility import RedisCache
+
+__all__ = ["ArbitraryRouting", "invalidate_arbitrary_routing"]
+
+_MEMO_KEY = "arbitrary_routing"
+_INVALIDATED_KEY = "arbitrary_routing_invalidated"
+_invalidation_tasks: set[asyncio.Task] = set()
+
+
+class ArbitraryRouting:
+    """Map applet_id -> arbitrary server settings of the applet workspace.
+
+    Settings are kept in process memory only, entries are tagged with a
+    version stamp stored in Redis. Changing arbitrary settings or applet
+    owners replaces the stamp, which drops entries in every process.
+    The stamp and found settings are memoized in the session, so call
+    sites of one request share them.
+    """
+
+    redis_key = "ArbitraryRouting:version"
+    _entries: TTLCache = TTLCache(
+        maxsize=settings.database.arbitrary_routing.size,
+        ttl=settings.database.arbitrary_routing.ttl,
+    )
+
+    def __init__(self, session):
+        self.session = session
+
+    @property
+    def _memo(self) -> dict:
+        return self.session.info.setdefault(_MEMO_KEY, dict())
+
+    async def _get_version(self) -> str:
+        memo = self._memo
+        if version := memo.get("version"):
+            return version
+        cache = RedisCache()
+        try:
+            version = await cache.get(self.redis_key)
+            if not version:
+                version = uuid.uuid4().hex
+                await cache.set(self.redis_key, version, ex=settings.database.arbitrary_routing.ttl)
+        except Exception as e:
+            # Without the stamp entries can't be trusted
+            logger.exception(e)
+            version = uuid.uuid4().hex
+        if isinstance(version, bytes):
+            version = version.decode()
+        memo["version"] = version
+        return version
+
+    async def get(self, applet_id: uuid.UUID) -> tuple[bool, WorkspaceArbitrary | None]:
+        """Returns (found, settings), settings are None for default servers."""
+        memo = self._memo
+        if applet_id in memo:
+            return True, memo[applet_id]
+        version = await self._get_version()
+        entry = self._entries.get(applet_id)
+        if entry and entry[0] == version:
+            memo[applet_id] = entry[1]
+            return True, entry[1]
+        return False, None
+
+    async def set(self, applet_id: uuid.UUID, info: WorkspaceArbitrary | None):
+        version = await self._get_version()
+        self._entries[applet_id] = (version, info)
+        self._memo[applet_id] = info
+
+    @classmethod
+    async def invalidate(cls):
+        cls._entries.clear()
+        await RedisCache().set(cls.redis_key, uuid.uuid4().hex, ex=settings.database.arbitrary_routing.ttl)
+
+
+async def invalidate_arbitrary_routing(session):
+    """Drop cached arbitrary server settings changed within the session
+    transaction. Settings are dropped right away and once more after
+    the commit, so settings read by a concurrent request before the
+    commit do not outlive the transaction.
+    """
+    session.info.pop(_MEMO_KEY, None)
+    session.info[_INVALIDATED_KEY] = True
+    await ArbitraryRouting.invalidate()
+
+
+async def _invalidate():
+    try:
+        await ArbitraryRouting.invalidate()
+    except Exception as e:
+        logger.exception(e)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session):
+    if not session.info.pop(_INVALIDATED_KEY, None):
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_invalidate())
+    _invalidation_tasks.add(task)
+    task.add_done_callback(_invalidation_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_invalidated(session: Session):
+    session.info.pop(_INVALIDATED_KEY, None)
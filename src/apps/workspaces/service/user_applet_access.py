@@ -19,6 +19,7 @@ from apps.workspaces.errors import (
     UserSecretIdAlreadyExists,
     UserSecretIdAlreadyExistsInInvitation,
 )
+from apps.workspaces.service.access_roles import AccessRoles
 
 
 class UserAppletAccessService:
@@ -26,6 +27,7 @@ class UserAppletAccessService:
         self._user_id = user_id
         self._applet_id = applet_id
         self.session = session
+        self._roles = AccessRoles(session, user_id)
 
     async def _get_default_role_meta(self, role: Role, user_id: uuid.UUID) -> dict:
         meta: dict = {}
@@ -227,10 +229,7 @@ class UserAppletAccessService:
         - Change roles of managers(for admin)/coordinators/editors/reviewers
         - Delete applet
         """
-        access = await UserAppletAccessCRUD(self.session).get_by_roles(
-            self._user_id, self._applet_id, [Role.OWNER, Role.MANAGER]
-        )
-        return getattr(access, "role", None)
+        return await self._roles.get_by_roles(self._applet_id, [Role.OWNER, Role.MANAGER])
 
     async def get_respondent_managers_role(self) -> Role | None:
         """
@@ -243,12 +242,7 @@ class UserAppletAccessService:
         - Invite new reviewer to specific respondent
         - Set schedule/notifications for respondents
         """
-        access = await UserAppletAccessCRUD(self.session).get_by_roles(
-            self._user_id,
-            self._applet_id,
-            [Role.OWNER, Role.MANAGER, Role.COORDINATOR],
-        )
-        return getattr(access, "role", None)
+        return await self._roles.get_by_roles(self._applet_id, [Role.OWNER, Role.MANAGER, Role.COORDINATOR])
 
     async def get_editors_role(self) -> Role | None:
         """
@@ -260,12 +254,7 @@ class UserAppletAccessService:
         - Can view all applets
         # TODO: which applets, assigned or all applets in organization
         """
-        access = await UserAppletAccessCRUD(self.session).get_by_roles(
-            self._user_id,
-            self._applet_id,
-            [Role.OWNER, Role.MANAGER, Role.EDITOR],
-        )
-        return getattr(access, "role", None)
+        return await self._roles.get_by_roles(self._applet_id, [Role.OWNER, Role.MANAGER, Role.EDITOR])
 
     async def get_reviewers_role(self):
         """
@@ -275,10 +264,7 @@ class UserAppletAccessService:
         - View/Export all respondents' data
         - Delete specific respondents' data
         """
-        access = await UserAppletAccessCRUD(self.session).get_by_roles(
-            self._user_id, self._applet_id, [Role.OWNER, Role.MANAGER]
-        )
-        return getattr(access, "role", None)
+        return await self._roles.get_by_roles(self._applet_id, [Role.OWNER, Role.MANAGER])
 
     async def get_reviewer_for_respondent_role(self):
         """
@@ -289,12 +275,7 @@ class UserAppletAccessService:
         - View assigned respondents' data
         - Export assigned respondents' data
         """
-        access = await UserAppletAccessCRUD(self.session).get_by_roles(
-            self._user_id,
-            self._applet_id,
-            [Role.OWNER, Role.MANAGER, Role.REVIEWER],
-        )
-        return getattr(access, "role", None)
+        return await self._roles.get_by_roles(self._applet_id, [Role.OWNER, Role.MANAGER, Role.REVIEWER])
 
     async def get_respondents_role(self):
         """
@@ -303,8 +284,7 @@ class UserAppletAccessService:
         Permissions:
         - Answer to applet
         """
-        access = await UserAppletAccessCRUD(self.session).get_by_roles(
-            self._user_id,
+        return await self._roles.get_by_roles(
             self._applet_id,
             [
                 Role.OWNER,
@@ -315,7 +295,6 @@ class UserAppletAccessService:
                 Role.RESPONDENT,
             ],
         )
-        return getattr(access, "role", None)
 
     async def get_access(self, role: Role) -> UserAppletAccess | None:
         schema = await UserAppletAccessCRUD(self.session).get(self._user_id, self._applet_id, role)
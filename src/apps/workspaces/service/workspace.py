@@ -29,6 +29,7 @@ from apps.workspaces.errors import (
     WorkspaceNotFoundError,
 )
 from apps.workspaces.service.check_access import CheckAccessService
+from apps.workspaces.service.routing import ArbitraryRouting, invalidate_arbitrary_routing
 from apps.workspaces.service.user_access import UserAccessService
 
 
@@ -90,13 +91,14 @@ class WorkspaceService:
         owner_id: uuid.UUID,
         applet_id: uuid.UUID | None,
         query_params: QueryParams,
-    ) -> Tuple[list[WorkspaceRespondent], int]:
-        users, total = await UserAppletAccessCRUD(self.session).get_workspace_respondents(
+    ) -> Tuple[list[WorkspaceRespondent], int, str | None]:
+        """Returns respondents of the page, total count and the cursor
+        of the next page.
+        """
+        return await UserAppletAccessCRUD(self.session).get_workspace_respondents(
             self._user_id, owner_id, applet_id, query_params
         )
 
-        return users, total
-
     async def get_workspace_managers(
         self,
         owner_id: uuid.UUID,
@@ -242,13 +244,20 @@ class WorkspaceService:
         )
 
     async def get_arbitrary_info(self, applet_id: uuid.UUID) -> WorkspaceArbitrary | None:
+        routing = ArbitraryRouting(self.session)
+        found, info = await routing.get(applet_id)
+        if found:
+            return info
+
         schema = await UserWorkspaceCRUD(self.session).get_by_applet_id(applet_id)
-        if not schema:
-            return None
-        try:
-            return WorkspaceArbitrary.from_orm(schema) if schema else None
-        except ValidationError:
-            return None
+        info = None
+        if schema:
+            try:
+                info = WorkspaceArbitrary.from_orm(schema)
+            except ValidationError:
+                pass
+        await routing.set(applet_id, info)
+        return info
 
     async def get_arbitrary_info_by_owner_id(self, owner_id: uuid.UUID) -> WorkspaceArbitrary | None:
         schema = await UserWorkspaceCRUD(self.session).get_by_user_id(owner_id)
@@ -296,6 +305,7 @@ class WorkspaceService:
         for k, v in data.dict(by_alias=False).items():
             setattr(schema, k, v)
         await repository.update_by_user_id(schema.user_id, schema)
+        await invalidate_arbitrary_routing(self.session)
 
     async def get_arbitrary_list(self) -> list[WorkspaceArbitrary]:
         schemas = await UserWorkspaceCRUD(self.session).get_arbitrary_list()
@@ -0,0 +1,48 @@
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.applets.domain.applet_create_update import AppletCreate
+from apps.applets.domain.applet_full import AppletFull
+from apps.applets.service.applet import AppletService
+from apps.themes.service import ThemeService
+from apps.users.domain import User
+from apps.workspaces.crud.applet_access import AppletAccessCRUD
+from apps.workspaces.domain.constants import Role
+from apps.workspaces.errors import AppletAccessDenied
+from apps.workspaces.service.access_roles import AccessRoles
+from apps.workspaces.service.check_access import CheckAccessService
+from apps.workspaces.service.user_applet_access import UserAppletAccessService
+
+
+@pytest.fixture
+async def applet(session: AsyncSession, tom: User, applet_minimal_data: AppletCreate) -> AppletFull:
+    await ThemeService(session, tom.id).get_or_create_default()
+    return await AppletService(session, tom.id).create(applet_minimal_data)
+
+
+async def test_check_access__roles_are_loaded_once(
+    session: AsyncSession, tom: User, applet: AppletFull, mocker: MockerFixture
+):
+    spy = mocker.spy(AppletAccessCRUD, "get_user_applet_roles")
+    service = CheckAccessService(session, tom.id)
+
+    await service.check_applet_detail_access(applet.id)
+    await service.check_applet_edit_access(applet.id)
+    await service.check_answer_create_access(applet.id)
+    await service.check_answers_export_access(applet.id)
+    assert await UserAppletAccessService(session, tom.id, applet.id).get_organizers_role() == Role.OWNER
+    assert spy.call_count == 1
+
+
+async def test_check_access__role_change_drops_loaded_roles(
+    session: AsyncSession, tom: User, lucy: User, applet: AppletFull
+):
+    service = CheckAccessService(session, lucy.id)
+    with pytest.raises(AppletAccessDenied):
+        await service.check_applet_detail_access(applet.id)
+
+    await UserAppletAccessService(session, tom.id, applet.id).add_role(lucy.id, Role.RESPONDENT)
+
+    await service.check_applet_detail_access(applet.id)
+    assert await AccessRoles(session, lucy.id).get_priority_role(applet.id) == Role.RESPONDENT
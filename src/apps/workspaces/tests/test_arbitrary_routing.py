@@ -0,0 +1,70 @@
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.applets.domain.applet_create_update import AppletCreate
+from apps.applets.domain.applet_full import AppletFull
+from apps.applets.service.applet import AppletService
+from apps.themes.service import ThemeService
+from apps.users.domain import User
+from apps.workspaces.constants import StorageType
+from apps.workspaces.crud.workspaces import UserWorkspaceCRUD
+from apps.workspaces.domain.workspace import WorkspaceArbitraryCreate
+from apps.workspaces.service.workspace import WorkspaceService
+
+
+@pytest.fixture
+async def applet(session: AsyncSession, tom: User, applet_minimal_data: AppletCreate) -> AppletFull:
+    await ThemeService(session, tom.id).get_or_create_default()
+    return await AppletService(session, tom.id).create(applet_minimal_data)
+
+
+@pytest.fixture
+def arbitrary_create(arbitrary_db_url: str) -> WorkspaceArbitraryCreate:
+    return WorkspaceArbitraryCreate(
+        database_uri=arbitrary_db_url,
+        use_arbitrary=True,
+        storage_access_key="key",
+        storage_secret_key="key",
+        storage_type=StorageType.AWS,
+        storage_region="us-east-1",
+    )
+
+
+async def test_get_arbitrary_info__workspace_is_loaded_once(
+    session: AsyncSession,
+    tom: User,
+    applet: AppletFull,
+    arbitrary_create: WorkspaceArbitraryCreate,
+    mocker: MockerFixture,
+):
+    srv = WorkspaceService(session, tom.id)
+    await srv.create_workspace_from_user(tom)
+    await srv.set_arbitrary_server(arbitrary_create)
+    spy = mocker.spy(UserWorkspaceCRUD, "get_by_applet_id")
+
+    info = await srv.get_arbitrary_info(applet.id)
+    assert info
+    assert info.database_uri == arbitrary_create.database_uri
+    assert await srv.get_arbitrary_info(applet.id) == info
+    # other sessions use settings cached in the process
+    session.info.clear()
+    assert await srv.get_arbitrary_info(applet.id) == info
+    assert spy.call_count == 1
+
+
+async def test_get_arbitrary_info__set_arbitrary_server_drops_cached_settings(
+    session: AsyncSession,
+    tom: User,
+    applet: AppletFull,
+    arbitrary_create: WorkspaceArbitraryCreate,
+):
+    srv = WorkspaceService(session, tom.id)
+    await srv.create_workspace_from_user(tom)
+    assert await srv.get_arbitrary_info(applet.id) is None
+
+    await srv.set_arbitrary_server(arbitrary_create)
+
+    info = await srv.get_arbitrary_info(applet.id)
+    assert info
+    assert info.database_uri == arbitrary_create.database_uri
@@ -1,5 +1,9 @@
+import base64
+import json
 import uuid
 
+import pytest
+
 from apps.shared.test import BaseTest
 from apps.users.cruds.user import UsersCRUD
 from apps.users.db.schemas import UserSchema
@@ -217,6 +221,58 @@ class TestWorkspaces(BaseTest):
         response = await client.get(self.workspace_applets_url.format(owner_id="00000000-0000-0000-0000-000000000000"))
         assert response.status_code == 404
 
+    @pytest.mark.parametrize("ordering", ("-isPinned,-createdAt", "secretIds", "-createdAt"))
+    async def test_get_workspace_respondents_by_cursor(self, client, tom, ordering):
+        await client.login(self.login_url, tom.email_encrypted, "Test1234!")
+        url = self.workspace_respondents_url.format(owner_id=tom.id)
+        response = await client.get(url, dict(ordering=ordering, limit=100))
+        assert response.status_code == 200, response.json()
+        expected = [respondent["id"] for respondent in response.json()["result"]]
+        assert response.json()["cursor"] is None
+
+        ids: list[str] = []
+        params = dict(ordering=ordering, limit=2)
+        while True:
+            response = await client.get(url, params)
+            assert response.status_code == 200, response.json()
+            data = response.json()
+            assert data["count"] == len(expected)
+            ids += [respondent["id"] for respondent in data["result"]]
+            if not data["cursor"]:
+                break
+            params["cursor"] = data["cursor"]
+        assert ids == expected
+
+    async def test_get_workspace_respondents_invalid_cursor(self, client, tom):
+        await client.login(self.login_url, tom.email_encrypted, "Test1234!")
+        response = await client.get(
+            self.workspace_respondents_url.format(owner_id=tom.id),
+            dict(cursor="not a cursor"),
+        )
+        assert response.status_code == 400
+
+    async def test_get_workspace_respondents_cursor_of_another_ordering(self, client, tom):
+        await client.login(self.login_url, tom.email_encrypted, "Test1234!")
+        url = self.workspace_respondents_url.format(owner_id=tom.id)
+        response = await client.get(url, dict(ordering="secretIds", limit=2))
+        cursor = response.json()["cursor"]
+        assert cursor
+
+        response = await client.get(url, dict(ordering="-createdAt", limit=2, cursor=cursor))
+        assert response.status_code == 400
+
+    async def test_get_workspace_respondents_changed_cursor(self, client, tom):
+        await client.login(self.login_url, tom.email_encrypted, "Test1234!")
+        url = self.workspace_respondents_url.format(owner_id=tom.id)
+        response = await client.get(url, dict(ordering="secretIds", limit=2))
+        token, signature = response.json()["cursor"].split(".")
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        payload["v"][0] = {"d": "2024-01-01T00:00:00"}
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        response = await client.get(url, dict(ordering="secretIds", limit=2, cursor=f"{token}.{signature}"))
+        assert response.status_code == 400
+
     async def test_get_workspace_respondents(self, client, tom):
         await client.login(self.login_url, tom.email_encrypted, "Test1234!")
         response = await client.get(
@@ -246,7 +302,7 @@ class TestWorkspaces(BaseTest):
                 )
                 assert response.status_code == 200
                 data = response.json()
-                assert set(data.keys()) == {"count", "result"}
+                assert set(data.keys()) == {"count", "result", "cursor"}
                 assert data["count"] == 1
                 result = data["result"]
                 assert len(result) == 1
@@ -290,7 +346,7 @@ class TestWorkspaces(BaseTest):
                 )
                 assert response.status_code == 200
                 data = response.json()
-                assert set(data.keys()) == {"count", "result"}
+                assert set(data.keys()) == {"count", "result", "cursor"}
                 assert data["count"] == 1
                 result = data["result"]
                 assert len(result) == 1
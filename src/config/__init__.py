@@ -4,20 +4,23 @@ from pydantic import BaseSettings
 
 from config.alerts import AlertsSettings
 from config.anonymous_respondent import AnonymousRespondent
+from config.applets import AppletsSettings
 from config.authentication import AuthenticationSettings
 from config.cdn import CDNSettings
 from config.cors import CorsSettings
 from config.database import DatabaseSettings
+from config.library import LibrarySettings
 from config.logs import Logs
 from config.mailing import MailingSettings
 from config.notification import FirebaseCloudMessagingSettings
 from config.rabbitmq import RabbitMQSettings
 from config.redis import RedisSettings
+from config.schedule import ScheduleSettings
 from config.secret import SecretSettings
 from config.sentry import SentrySettings
 from config.service import JsonLdConverterSettings, ServiceSettings
 from config.superuser import SuperAdmin
-from config.task import AnswerEncryption, AudioFileConvert, ImageConvert
+from config.task import AnswerEncryption, AnswerRetention, AudioFileConvert, ImageConvert, TokenBlacklistCompaction
 
 
 # NOTE: Settings powered by pydantic
@@ -72,6 +75,15 @@ class Settings(BaseSettings):
     # Alerts configs
     alerts: AlertsSettings = AlertsSettings()
 
+    # Schedule configs
+    schedule: ScheduleSettings = ScheduleSettings()
+
+    # Library configs
+    library: LibrarySettings = LibrarySettings()
+
+    # Applets configs
+    applets: AppletsSettings = AppletsSettings()
+
     # NOTE: This config is used by SQLAlchemy for imports
     migrations_apps: list[str]
 
@@ -80,8 +92,10 @@ class Settings(BaseSettings):
     anonymous_respondent = AnonymousRespondent()
 
     task_answer_encryption = AnswerEncryption()
+    task_answer_retention = AnswerRetention()
     task_audio_file_convert = AudioFileConvert()
     task_image_convert = ImageConvert()
+    task_token_blacklist_compaction = TokenBlacklistCompaction()
 
     logs: Logs = Logs()
 
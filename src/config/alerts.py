@@ -3,3 +3,15 @@ from pydantic import BaseModel
 
 class AlertsSettings(BaseModel):
     ws_fetching_periodicity_sec: int = 5
+    # Number of alerts waiting to be sent to one websocket,
+    # the oldest alert is dropped when a socket does not keep up
+    ws_queue_size: int = 100
+    # Applet and workspace data of alerts is cached for this period.
+    # Set in seconds
+    ws_meta_ttl: int = 60
+    ws_meta_cache_size: int = 1024
+    # Delay before resubscribing after a lost Redis connection. Set in seconds
+    ws_reconnect_delay: int = 1
+    # Alert emails to one person are sent at most once per this period,
+    # alerts of the period are announced by one email. Set in seconds
+    mail_window: int = 60
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class AppletsSettings(BaseModel):
+    # Set in seconds. Rendered single language applet documents are
+    # never invalidated, documents of changed applets expire
+    document_ttl: int = 86400
@@ -24,3 +24,7 @@ class AuthenticationSettings(BaseModel):
     algorithm: str = "HS256"
     token_type: str = "Bearer"
     password_recover: PasswordRecoverSettings = PasswordRecoverSettings()
+    # Set in seconds
+    last_seen_flush_interval: int = 60
+    # Set in seconds
+    revoked_tokens_resync_interval: int = 5 * 60
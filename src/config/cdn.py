@@ -22,6 +22,12 @@ class CDNSettings(BaseModel):
     endpoint_url: str | None = None
     storage_address: str | None = None
 
+    # Threads shared by all storage clients for blocking calls,
+    # also the size of the connection pool of every client
+    executor_max_workers: int = 32
+    # Number of storage clients kept for reuse
+    clients_cache_size: int = 256
+
     @property
     def url(self):
         if self.domain:
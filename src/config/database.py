@@ -1,13 +1,39 @@
 from pydantic import BaseModel
 
 
+class PoolSettings(BaseModel):
+    size: int = 5
+    max_overflow: int = 10
+    # Set in seconds
+    recycle: int = 30 * 60
+    # Set in seconds
+    timeout: int = 30
+
+
+class ArbitraryPoolSettings(PoolSettings):
+    size: int = 2
+    max_overflow: int = 5
+    # Engines of arbitrary servers that were not used during this period
+    # are disposed. Set in seconds
+    idle_ttl: int = 10 * 60
+
+
+class ArbitraryRoutingSettings(BaseModel):
+    # Arbitrary server settings of applets are kept in process memory
+    # for this period unless they change earlier. Set in seconds
+    ttl: int = 5 * 60
+    size: int = 10000
+
+
 class DatabaseSettings(BaseModel):
     host: str = "postgres"
     port: int = 5432
     password: str = "postgres"
     user: str = "postgres"
     db: str = "mindlogger_backend"
-    pool_size: int = 2
+    pool: PoolSettings = PoolSettings()
+    arbitrary_pool: ArbitraryPoolSettings = ArbitraryPoolSettings()
+    arbitrary_routing: ArbitraryRoutingSettings = ArbitraryRoutingSettings()
 
     @property
     def url(self) -> str:
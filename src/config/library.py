@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class LibrarySettings(BaseModel):
+    # Number of applet versions with rendered activities and flows kept
+    # in process memory. Shared versions never change
+    cache_size: int = 1000
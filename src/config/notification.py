@@ -18,6 +18,12 @@ class FirebaseCloudMessagingSettings(BaseModel):
     client_x509_cert_url: str | None
     universe_domain: str | None
     ttl: int = 7 * 24 * 60 * 60
+    # Firebase accepts at most 500 tokens per multicast message
+    batch_size: int = 500
+    max_concurrency: int = 4
+    retries: int = 3
+    # Set in seconds, doubled for every next retry
+    retry_delay: float = 1
 
     @property
     def certificate(self) -> dict:
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ScheduleSettings(BaseModel):
+    # Respondent schedule snapshots are kept in the cache for this period
+    # unless the schedule changes earlier. Set in seconds
+    snapshot_ttl: int = 24 * 60 * 60
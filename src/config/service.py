@@ -36,3 +36,14 @@ class JsonLdConverterSettings(BaseModel):
     """Configure json-ld converter service settings."""
 
     protocol_password: str = ""
+    # Directory of loaded documents, kept between restarts if set
+    document_cache_dir: str | None = None
+    # Serve documents from the cache directory only
+    offline: bool = False
+    document_cache_size: int = 1000
+    # Set in seconds, documents are revalidated with ETag after it
+    document_cache_ttl: int = 3600
+    context_cache_size: int = 1000
+    max_connections: int = 8
+    # Set in seconds
+    request_timeout: int = 30
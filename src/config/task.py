@@ -5,6 +5,26 @@ class AnswerEncryption(BaseModel):
     batch_limit: int = 1000
     max_retries: int = 5
     retry_timeout: int = 12 * 60 * 60
+    # Number of applets reencrypted at the same time
+    max_concurrency: int = 4
+
+
+class AnswerRetention(BaseModel):
+    # Cron schedule of the purge of expired answers
+    cron: str = "0 3 * * *"
+    batch_limit: int = 1000
+    # Pause between batches in seconds, keeps the load of answer databases low
+    batch_pause: float = 0.5
+    # Expired answers are counted only
+    dry_run: bool = False
+
+
+class TokenBlacklistCompaction(BaseModel):
+    # Cron schedule of the removal of expired blacklisted tokens
+    cron: str = "15 * * * *"
+    batch_limit: int = 5000
+    # Pause between batches in seconds
+    batch_pause: float = 0.1
 
 
 class AudioFileConvert(BaseModel):
@@ -1,36 +1,135 @@
+import asyncio
 import json
+import time
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from config import settings
+from config.database import PoolSettings
 
 __all__ = ["session_manager", "atomic", "build_engine"]
 
 
-def build_engine(uri: str) -> AsyncEngine:
+def build_engine(uri: str, pool: PoolSettings | None = None) -> AsyncEngine:
+    """Build an async engine.
+
+    Without pool settings the engine opens a new connection for every
+    session (NullPool), which is suitable for one-off scripts and tests.
+    """
+    if pool is None:
+        pool_options: dict = dict(poolclass=NullPool)
+    else:
+        pool_options = dict(
+            pool_size=pool.size,
+            max_overflow=pool.max_overflow,
+            pool_recycle=pool.recycle,
+            pool_timeout=pool.timeout,
+        )
     return create_async_engine(
         uri,
         future=True,
         pool_pre_ping=True,
         echo=False,
-        poolclass=NullPool,
         json_serializer=lambda x: json.dumps(x),
         json_deserializer=lambda x: json.loads(x),
+        **pool_options,
     )
 
 
-class SessionManager:
-    @staticmethod
-    def get_session(uri: str = settings.database.url) -> sessionmaker:
-        return sessionmaker(
-            build_engine(uri),
+class _EngineEntry:
+    def __init__(self, engine: AsyncEngine, idle_ttl: int | None):
+        self.engine = engine
+        self.session_maker = sessionmaker(
+            engine,
             class_=AsyncSession,
             expire_on_commit=False,
             autoflush=False,
             autocommit=False,
         )
+        self.idle_ttl = idle_ttl
+        self.last_used_at = time.monotonic()
+        # Connections in use, an engine is never idle while sessions hold them
+        self.checked_out = 0
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, *args):
+        self.checked_out += 1
+        self.last_used_at = time.monotonic()
+
+    def _on_checkin(self, *args):
+        self.checked_out = max(self.checked_out - 1, 0)
+        self.last_used_at = time.monotonic()
+
+    def is_idle(self, now: float) -> bool:
+        if self.idle_ttl is None or self.checked_out:
+            return False
+        return now - self.last_used_at > self.idle_ttl
+
+
+class SessionManager:
+    """Process-wide registry of pooled engines keyed by database URI.
+
+    The main database engine lives for the whole process. Engines of
+    arbitrary servers are disposed after no connection of them was used for
+    `settings.database.arbitrary_pool.idle_ttl` seconds.
+    """
+
+    def __init__(self):
+        self._engines: dict[str, _EngineEntry] = {}
+        self._disposing: set[asyncio.Task] = set()
+
+    def _create_entry(self, uri: str) -> _EngineEntry:
+        is_main = uri == settings.database.url
+        pool = settings.database.pool if is_main else settings.database.arbitrary_pool
+        idle_ttl = None if is_main else settings.database.arbitrary_pool.idle_ttl
+        if settings.env == "testing":
+            # Pooled asyncpg connections are bound to an event loop and
+            # pytest fixtures run in different loops.
+            return _EngineEntry(build_engine(uri), idle_ttl)
+        return _EngineEntry(build_engine(uri, pool), idle_ttl)
+
+    def get_engine(self, uri: str = settings.database.url) -> AsyncEngine:
+        return self._get_entry(uri).engine
+
+    def get_session(self, uri: str = settings.database.url) -> sessionmaker:
+        return self._get_entry(uri).session_maker
+
+    def _get_entry(self, uri: str) -> _EngineEntry:
+        now = time.monotonic()
+        self._evict_idle(now)
+        entry = self._engines.get(uri)
+        if entry is None:
+            entry = self._engines[uri] = self._create_entry(uri)
+        entry.last_used_at = now
+        return entry
+
+    def _evict_idle(self, now: float):
+        idle_uris = [uri for uri, entry in self._engines.items() if entry.is_idle(now)]
+        for uri in idle_uris:
+            entry = self._engines.pop(uri)
+            self._schedule_dispose(entry.engine)
+
+    def _schedule_dispose(self, engine: AsyncEngine):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without running loop connections are closed by the garbage
+            # collector together with the pool.
+            return
+        task = loop.create_task(engine.dispose())
+        self._disposing.add(task)
+        task.add_done_callback(self._disposing.discard)
+
+    async def dispose(self):
+        engines = [entry.engine for entry in self._engines.values()]
+        self._engines.clear()
+        await asyncio.gather(*(engine.dispose() for engine in engines))
+        if self._disposing:
+            await asyncio.gather(*self._disposing, return_exceptions=True)
 
 
 session_manager = SessionManager()
@@ -5,7 +5,8 @@ from typing import Any, Generic, Type, TypeVar
 
 from sqlalchemy import delete, func, select, update
 from sqlalchemy.cimmutabledict import immutabledict
-from sqlalchemy.engine import Result
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Result, Row
 from sqlalchemy.exc import MultipleResultsFound, NoResultFound
 from sqlalchemy.orm import Query
 
@@ -13,6 +14,9 @@ from infrastructure.database.base import Base
 
 ConcreteSchema = TypeVar("ConcreteSchema", bound=Base)
 
+# Limit of query arguments of asyncpg
+MAX_QUERY_ARGUMENTS = 32767
+
 __all__ = ["BaseCRUD"]
 
 
@@ -91,6 +95,69 @@ class BaseCRUD(Generic[ConcreteSchema]):
         await self.session.flush()
         return deepcopy(schemas)
 
+    async def _update_changed(self, instances: list[ConcreteSchema], values: list[dict]) -> list[ConcreteSchema]:
+        """Assigns values to loaded instances and flushes them.
+
+        Only values that differ from the stored ones are assigned, so
+        unchanged instances are not written at all and changed ones are
+        updated by their changed columns. None stands for the column
+        default as it does on insert. Returns changed instances.
+        """
+        columns = self.schema_class.__table__.columns
+        changed = []
+        for instance, instance_values in zip(instances, values):
+            is_changed = False
+            for key, value in instance_values.items():
+                default = columns[key].default if key in columns else None
+                if value is None and default is not None:
+                    if not default.is_scalar:
+                        continue
+                    value = default.arg
+                if getattr(instance, key) != value:
+                    setattr(instance, key, value)
+                    is_changed = True
+            if is_changed:
+                changed.append(instance)
+        if changed:
+            await self.session.flush(changed)
+        return changed
+
+    async def _insert_many(
+        self,
+        values: list[dict],
+        *,
+        index_elements: list | None = None,
+        update_columns: list[str] | None = None,
+        batch_size: int | None = None,
+    ) -> list[Row]:
+        """Inserts rows with multi-row INSERT ... RETURNING statements.
+
+        Rows are not added to the session, no ORM instances are created
+        or copied, so plain result rows are returned. With index_elements
+        conflicting rows are updated with update_columns of new values or
+        skipped without update_columns, skipped rows are not returned.
+        """
+        if not values:
+            return []
+        columns = self.schema_class.__table__.columns
+        if not batch_size:
+            batch_size = max(1, MAX_QUERY_ARGUMENTS // len(columns))
+
+        rows: list[Row] = []
+        for start in range(0, len(values), batch_size):
+            query = insert(self.schema_class).values(values[start : start + batch_size])
+            if index_elements and update_columns:
+                query = query.on_conflict_do_update(
+                    index_elements=index_elements,
+                    set_={column: query.excluded[column] for column in update_columns},
+                )
+            elif index_elements:
+                query = query.on_conflict_do_nothing(index_elements=index_elements)
+            query = query.returning(*columns)
+            db_result = await self._execute(query)
+            rows.extend(db_result.all())
+        return rows
+
     async def _all(self) -> list[ConcreteSchema]:
         query = select(self.schema_class)
         results = await self._execute(query=query)
@@ -0,0 +1,61 @@
+"""Library full-text search vector
+
+Revision ID: 3f1c8e2a9b7d
+Revises: 736adb0ea547
+Create Date: 2024-02-14 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "3f1c8e2a9b7d"
+down_revision = "736adb0ea547"
+branch_labels = None
+depends_on = None
+
+SEARCH_TSV = (
+    "setweight(to_tsvector('simple', "
+    "coalesce(immutable_array_to_string(keywords, ' '), '')), 'A') || "
+    "setweight(to_tsvector('simple', "
+    "coalesce(immutable_array_to_string(search_keywords, ' '), '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # array_to_string is stable, generated columns need immutable functions
+    op.execute(
+        sa.DDL(
+            """
+            create or replace function immutable_array_to_string(text[], text)
+            returns text
+            language sql immutable parallel safe as
+            $$ select array_to_string($1, $2) $$;
+            """
+        )
+    )
+    op.add_column(
+        "library",
+        sa.Column(
+            "search_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_TSV, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_library_search_tsv",
+        "library",
+        ["search_tsv"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_library_search_tsv", table_name="library")
+    op.drop_column("library", "search_tsv")
+    op.execute(
+        sa.DDL("drop function if exists immutable_array_to_string(text[], text);")
+    )
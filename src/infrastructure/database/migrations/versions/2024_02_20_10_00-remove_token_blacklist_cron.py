@@ -0,0 +1,37 @@
+"""Remove cron removing expired blacklisted tokens
+
+Expired tokens are removed in batches by the compact_token_blacklist task.
+
+Revision ID: 8d2e4b6a1c3f
+Revises: 3f1c8e2a9b7d
+Create Date: 2024-02-20 10:00:00.000000
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+from config import settings
+
+# revision identifiers, used by Alembic.
+revision = "8d2e4b6a1c3f"
+down_revision = "3f1c8e2a9b7d"
+branch_labels = None
+depends_on = None
+
+task_name = "clear_token_blacklist"
+schedule = "0 9 * * *"
+query = text("delete from token_blacklist " "where \"exp\" < now() at time zone 'utc'")
+
+
+def upgrade() -> None:
+    if settings.env != "testing":
+        op.execute(text("SELECT cron.unschedule(:task_name);").bindparams(task_name=task_name))
+
+
+def downgrade() -> None:
+    if settings.env != "testing":
+        op.execute(
+            text(f"SELECT cron.schedule(:task_name, :schedule, $${query}$$);").bindparams(
+                task_name=task_name, schedule=schedule
+            )
+        )
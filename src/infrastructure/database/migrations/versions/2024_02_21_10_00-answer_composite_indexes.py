@@ -0,0 +1,41 @@
+"""Answer composite indexes
+
+Revision ID: 5b7e9c1d2f4a
+Revises: 8d2e4b6a1c3f
+Create Date: 2024-02-21 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b7e9c1d2f4a"
+down_revision = "8d2e4b6a1c3f"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_answers_items_answer_id", "answers_items", ["answer_id"]),
+    ("ix_answers_applet_id_created_at", "answers", ["applet_id", "created_at"]),
+    ("ix_answers_applet_id_respondent_id_created_at", "answers", ["applet_id", "respondent_id", "created_at"]),
+    (
+        "ix_answers_applet_id_activity_history_id_created_at",
+        "answers",
+        ["applet_id", "activity_history_id", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    # Indexes are built without blocking answer submits
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        # Covered by the composite indexes
+        op.drop_index("ix_answers_applet_id", table_name="answers", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("ix_answers_applet_id", "answers", ["applet_id"], unique=False, postgresql_concurrently=True)
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Answer composite indexes
+
+Revision ID: 9e3f5a7b1c2d
+Revises: 60528d410fd1
+Create Date: 2024-02-21 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9e3f5a7b1c2d"
+down_revision = "60528d410fd1"
+branch_labels = None
+depends_on = None
+
+# Arbitrary servers have the answers_items.answer_id index from the start
+INDEXES = [
+    ("ix_answers_applet_id_created_at", "answers", ["applet_id", "created_at"]),
+    ("ix_answers_applet_id_respondent_id_created_at", "answers", ["applet_id", "respondent_id", "created_at"]),
+    (
+        "ix_answers_applet_id_activity_history_id_created_at",
+        "answers",
+        ["applet_id", "activity_history_id", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    # Indexes are built without blocking answer submits
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
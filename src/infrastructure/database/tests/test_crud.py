@@ -0,0 +1,77 @@
+import datetime
+import uuid
+
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.authentication.db.schemas import TokenBlacklistSchema
+from apps.authentication.domain.token import TokenPurpose
+from infrastructure.database.crud import BaseCRUD
+
+
+class _CRUD(BaseCRUD[TokenBlacklistSchema]):
+    schema_class = TokenBlacklistSchema
+
+
+def _values(*jtis: str) -> list[dict]:
+    exp = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+    return [dict(jti=jti, user_id=uuid.uuid4(), exp=exp, type=TokenPurpose.ACCESS) for jti in jtis]
+
+
+async def test_insert_many_returns_rows_in_order(session: AsyncSession):
+    rows = await _CRUD(session)._insert_many(_values("a", "b", "c"))
+
+    assert [row.jti for row in rows] == ["a", "b", "c"]
+    assert len({row.id for row in rows}) == 3
+    assert await _CRUD(session).count() == 3
+
+
+async def test_insert_many_without_values(session: AsyncSession, mocker: MockerFixture):
+    execute = mocker.spy(_CRUD, "_execute")
+
+    assert await _CRUD(session)._insert_many([]) == []
+    execute.assert_not_called()
+
+
+async def test_insert_many_in_batches(session: AsyncSession, mocker: MockerFixture):
+    execute = mocker.spy(_CRUD, "_execute")
+
+    rows = await _CRUD(session)._insert_many(_values("a", "b", "c"), batch_size=2)
+
+    assert [row.jti for row in rows] == ["a", "b", "c"]
+    assert execute.call_count == 2
+
+
+async def test_insert_many_batches_by_query_arguments(session: AsyncSession, mocker: MockerFixture):
+    columns = len(TokenBlacklistSchema.__table__.columns)
+    mocker.patch("infrastructure.database.crud.MAX_QUERY_ARGUMENTS", columns * 2)
+    execute = mocker.spy(_CRUD, "_execute")
+
+    await _CRUD(session)._insert_many(_values("a", "b", "c"))
+
+    assert execute.call_count == 2
+
+
+async def test_insert_many_updates_conflicting_rows(session: AsyncSession):
+    crud = _CRUD(session)
+    [stored] = await crud._insert_many(_values("a"))
+    values = _values("a", "b")
+
+    rows = await crud._insert_many(values, index_elements=[TokenBlacklistSchema.jti], update_columns=["user_id"])
+
+    assert [(row.jti, row.user_id) for row in rows] == [("a", values[0]["user_id"]), ("b", values[1]["user_id"])]
+    assert rows[0].id == stored.id
+    assert await crud.count() == 2
+
+
+async def test_insert_many_skips_conflicting_rows(session: AsyncSession):
+    crud = _CRUD(session)
+    [stored] = await crud._insert_many(_values("a"))
+
+    rows = await crud._insert_many(_values("a", "b"), index_elements=[TokenBlacklistSchema.jti])
+
+    assert [row.jti for row in rows] == ["b"]
+    instance = await crud._get("jti", "a")
+    assert instance is not None
+    assert instance.user_id == stored.user_id
+    assert await crud.count() == 2
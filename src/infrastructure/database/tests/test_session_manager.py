@@ -0,0 +1,114 @@
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config import settings
+from config.database import PoolSettings
+from infrastructure.database import core
+from infrastructure.database.core import SessionManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> FakeClock:
+    clock = FakeClock()
+    mocker.patch("infrastructure.database.core.time", clock)
+    return clock
+
+
+@pytest.fixture
+def built_engines(mocker: MockerFixture) -> list[tuple[str, PoolSettings | None]]:
+    """Records pool settings of built engines, engines do not pool connections."""
+    built: list[tuple[str, PoolSettings | None]] = []
+    build_engine = core.build_engine
+
+    def fake_build_engine(uri: str, pool: PoolSettings | None = None) -> AsyncEngine:
+        built.append((uri, pool))
+        return build_engine(uri)
+
+    mocker.patch("infrastructure.database.core.build_engine", fake_build_engine)
+    return built
+
+
+@pytest.fixture
+async def manager(built_engines, clock):
+    manager = SessionManager()
+    yield manager
+    await manager.dispose()
+
+
+async def test_engines_are_shared_per_uri(manager: SessionManager, built_engines, arbitrary_db_url: str):
+    assert manager.get_session() is manager.get_session()
+    assert manager.get_engine(arbitrary_db_url) is manager.get_engine(arbitrary_db_url)
+    assert manager.get_engine() is not manager.get_engine(arbitrary_db_url)
+    assert [uri for uri, _ in built_engines] == [settings.database.url, arbitrary_db_url]
+
+
+async def test_pool_settings_per_uri(
+    manager: SessionManager, built_engines, arbitrary_db_url: str, mocker: MockerFixture
+):
+    mocker.patch("config.settings.env", "production")
+
+    manager.get_session()
+    manager.get_session(arbitrary_db_url)
+
+    assert built_engines == [
+        (settings.database.url, settings.database.pool),
+        (arbitrary_db_url, settings.database.arbitrary_pool),
+    ]
+
+
+async def test_pooling_disabled_in_tests(manager: SessionManager, built_engines):
+    manager.get_session()
+
+    assert built_engines == [(settings.database.url, None)]
+
+
+async def test_idle_arbitrary_engine_is_disposed(
+    manager: SessionManager, clock: FakeClock, arbitrary_db_url: str, mocker: MockerFixture
+):
+    dispose = mocker.spy(AsyncEngine, "dispose")
+    main_engine = manager.get_engine()
+    arbitrary_engine = manager.get_engine(arbitrary_db_url)
+
+    clock.now += settings.database.arbitrary_pool.idle_ttl + 1
+
+    # The main engine is never idle
+    assert manager.get_engine() is main_engine
+    assert manager.get_engine(arbitrary_db_url) is not arbitrary_engine
+    assert [call.args for call in dispose.call_args_list] == [(arbitrary_engine,)]
+
+
+async def test_engine_is_not_disposed_while_session_is_used(
+    manager: SessionManager, clock: FakeClock, arbitrary_db_url: str
+):
+    arbitrary_engine = manager.get_engine(arbitrary_db_url)
+    session_maker = manager.get_session(arbitrary_db_url)
+
+    async with session_maker() as session:
+        await session.execute(text("select 1"))
+        clock.now += settings.database.arbitrary_pool.idle_ttl + 1
+        manager.get_engine()
+        assert manager.get_engine(arbitrary_db_url) is arbitrary_engine
+
+    clock.now += settings.database.arbitrary_pool.idle_ttl + 1
+    manager.get_engine()
+    assert manager.get_engine(arbitrary_db_url) is not arbitrary_engine
+
+
+async def test_dispose_disposes_all_engines(manager: SessionManager, arbitrary_db_url: str, mocker: MockerFixture):
+    dispose = mocker.spy(AsyncEngine, "dispose")
+    engines = {manager.get_engine(), manager.get_engine(arbitrary_db_url)}
+
+    await manager.dispose()
+
+    assert {call.args[0] for call in dispose.call_args_list} == engines
+    assert manager.get_engine() not in engines
@@ -29,7 +29,8 @@ async def get_presign_service(
                 user_id,
                 applet_id,
                 access,
+                arbitrary_info,
             )
         if arbitrary_info.storage_type.lower() == StorageType.GCP:
-            return GCPPresignService(session, user_id, applet_id, access)
-    return S3PresignService(session, user_id, applet_id, access)
+            return GCPPresignService(session, user_id, applet_id, access, arbitrary_info)
+    return S3PresignService(session, user_id, applet_id, access, arbitrary_info)
@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 
+from apps.authentication.services.revocation import token_revocation_filter
+from apps.users.services.last_seen import last_seen_buffer
 from broker import broker
+from infrastructure.database import session_manager
+from infrastructure.utility import cdn_executor
 
 
 async def startup_taskiq() -> None:
@@ -15,9 +19,37 @@ async def shutdown_taskiq() -> None:
         await broker.shutdown()
 
 
+async def startup_last_seen_buffer() -> None:
+    if not broker.is_worker_process:
+        last_seen_buffer.start()
+
+
+async def shutdown_last_seen_buffer() -> None:
+    await last_seen_buffer.stop()
+
+
+async def startup_token_revocation_filter() -> None:
+    if not broker.is_worker_process:
+        token_revocation_filter.start()
+
+
+async def shutdown_token_revocation_filter() -> None:
+    await token_revocation_filter.stop()
+
+
+async def shutdown_database() -> None:
+    await session_manager.dispose()
+
+
+async def shutdown_cdn_executor() -> None:
+    cdn_executor.shutdown()
+
+
 def startup(app: FastAPI):
     async def _startup():
         await startup_taskiq()
+        await startup_last_seen_buffer()
+        await startup_token_revocation_filter()
 
     return _startup
 
@@ -25,5 +57,9 @@ def startup(app: FastAPI):
 def shutdown(app: FastAPI):
     async def _shutdown():
         await shutdown_taskiq()
+        await shutdown_last_seen_buffer()
+        await shutdown_token_revocation_filter()
+        await shutdown_database()
+        await shutdown_cdn_executor()
 
     return _shutdown
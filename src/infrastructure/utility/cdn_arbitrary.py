@@ -10,12 +10,16 @@ from infrastructure.utility.cdn_config import CdnConfig
 
 
 class ArbitraryS3CdnClient(CDNClient):
+    def client_key(self, config: CdnConfig) -> tuple:
+        return config.region, config.access_key, config.secret_key
+
     def configure_client(self, config: CdnConfig):
         return boto3.client(
             "s3",
             aws_access_key_id=self.config.access_key,
             aws_secret_access_key=self.config.secret_key,
             region_name=self.config.region,
+            config=self.client_config(),
         )
 
 
@@ -27,6 +31,9 @@ class ArbitraryGCPCdnClient(CDNClient):
     def generate_private_url(self, key):
         return f"gs://{self.config.bucket}/{key}"
 
+    def client_key(self, config: CdnConfig) -> tuple:
+        return self.endpoint_url, config.bucket, config.access_key, config.secret_key
+
     def configure_client(self, config):
         return boto3.client(
             "s3",
@@ -34,6 +41,7 @@ class ArbitraryGCPCdnClient(CDNClient):
             aws_secret_access_key=self.config.secret_key,
             region_name=self.config.bucket,
             endpoint_url=self.endpoint_url,
+            config=self.client_config(),
         )
 
 
@@ -49,6 +57,9 @@ class ArbitraryAzureCdnClient(CDNClient):
     def generate_private_url(self, key):
         return f"https://{self.config.bucket}.blob.core.windows.net/mindlogger/{key}"  # noqa
 
+    def client_key(self, _) -> tuple:
+        return (self.sec_key,)
+
     def configure_client(self, _):
         blob_service_client = BlobServiceClient.from_connection_string(self.sec_key)
         with suppress(Exception):
@@ -1,23 +1,112 @@
 import asyncio
+import functools
 import io
 import mimetypes
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from typing import BinaryIO
+from typing import Any, BinaryIO, Callable, Hashable
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from apps.shared.exception import NotFoundError
+from config import settings
 from infrastructure.utility.cdn_config import CdnConfig
 
+__all__ = ["CDNClient", "CDNExecutor", "cdn_executor"]
+
+
+class CDNExecutor:
+    """Pool of threads shared by all storage clients for blocking calls."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self.submitted = 0
+        self.in_flight = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cdn")
+        return self._executor
+
+    @staticmethod
+    def _call(submitted_at: float, func: Callable, *args, **kwargs) -> tuple[float, Any]:
+        started_at = time.monotonic()
+        return started_at - submitted_at, func(*args, **kwargs)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._call, time.monotonic(), func, *args, **kwargs)
+        self.submitted += 1
+        self.in_flight += 1
+        try:
+            wait, result = await loop.run_in_executor(self._get_executor(), call)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        return result
+
+    @property
+    def stats(self) -> dict:
+        return dict(
+            max_workers=self.max_workers,
+            submitted=self.submitted,
+            in_flight=self.in_flight,
+            failed=self.failed,
+            avg_wait=self.total_wait / self.submitted if self.submitted else 0.0,
+            max_wait=self.max_wait,
+        )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+cdn_executor = CDNExecutor(settings.cdn.executor_max_workers)
+
 
 class CDNClient:
     default_container_name = "mindlogger"
+    # Clients are thread safe and keep connection pools,
+    # so they are shared by all instances with the same credentials.
+    _clients: OrderedDict[Hashable, Any] = OrderedDict()
 
     def __init__(self, config: CdnConfig, env: str):
         self.config = config
         self.env = env
-        self.client = self.configure_client(config)
+        self.client = self._get_client(config)
+
+    def client_key(self, config) -> tuple:
+        """Returns the key of parameters the client is configured with."""
+        return config.endpoint_url, config.region, config.access_key, config.secret_key
+
+    def _get_client(self, config):
+        key = (self.__class__, *self.client_key(config))
+        client = self._clients.get(key)
+        if client is None:
+            client = self.configure_client(config)
+            if client is None:
+                return None
+        self._clients[key] = client
+        self._clients.move_to_end(key)
+        while len(self._clients) > settings.cdn.clients_cache_size:
+            self._clients.popitem(last=False)
+        return client
+
+    @staticmethod
+    def client_config() -> Config:
+        return Config(max_pool_connections=settings.cdn.executor_max_workers)
 
     @classmethod
     def generate_key(cls, scope, unique, filename):
@@ -36,9 +125,10 @@ class CDNClient:
                 region_name=config.region,
                 aws_access_key_id=config.access_key,
                 aws_secret_access_key=config.secret_key,
+                config=self.client_config(),
             )
         try:
-            return boto3.client("s3", region_name=config.region)
+            return boto3.client("s3", region_name=config.region, config=self.client_config())
         # TODO: do we need this? If exception is caught self.client will be None
         except KeyError:
             print("CDN configuration is not full")
@@ -53,9 +143,7 @@ class CDNClient:
         )
 
     async def upload(self, path, body: BinaryIO):
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self._upload, path, body)
-        await asyncio.wrap_future(future)
+        await cdn_executor.run(self._upload, path, body)
 
     def _check_existence(self, key: str):
         try:
@@ -66,9 +154,7 @@ class CDNClient:
     async def check_existence(self, key: str):
         if self.env == "testing":
             return
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self._check_existence, key)
-            return await asyncio.wrap_future(future)
+        return await cdn_executor.run(self._check_existence, key)
 
     def download(self, key):
         file = io.BytesIO()
@@ -94,22 +180,22 @@ class CDNClient:
         return url
 
     async def generate_presigned_url(self, key):
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self._generate_presigned_url, key)
-            url = await asyncio.wrap_future(future)
-            return url
+        return await cdn_executor.run(self._generate_presigned_url, key)
+
+    def _generate_presigned_urls(self, keys: list[str]) -> list[str]:
+        return [self._generate_presigned_url(key) for key in keys]
+
+    async def generate_presigned_urls(self, keys: list[str]) -> list[str]:
+        # Signing does not call the storage, so the whole batch is one job
+        return await cdn_executor.run(self._generate_presigned_urls, keys)
 
     async def delete_object(self, key: str | None):
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self.client.delete_object, Bucket=self.config.bucket, Key=key)
-            await asyncio.wrap_future(future)
+        await cdn_executor.run(self.client.delete_object, Bucket=self.config.bucket, Key=key)
 
     async def list_object(self, key: str):
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self.client.list_objects, Bucket=self.config.bucket, Prefix=key)
-            result = await asyncio.wrap_future(future)
-            return result.get("Contents", [])
+        result = await cdn_executor.run(self.client.list_objects, Bucket=self.config.bucket, Prefix=key)
+        return result.get("Contents", [])
 
     def generate_presigned_post(self, key):
-        # Not needed ThreadPoolExecutor because there is no any IO operation (no API calls to s3)
+        # Not needed executor because there is no any IO operation (no API calls to s3)
         return self.client.generate_presigned_post(self.config.bucket, key, ExpiresIn=self.config.ttl_signed_urls)
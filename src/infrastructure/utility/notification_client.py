@@ -2,13 +2,15 @@ import asyncio
 import enum
 import json
 import uuid
+from abc import ABC, abstractmethod
 from collections import defaultdict
 
 import firebase_admin
-from firebase_admin import credentials, messaging
+from firebase_admin import credentials, exceptions, messaging
 
 from apps.shared.domain import InternalModel
 from config import settings
+from infrastructure.logger import logger
 
 
 class FirebaseNotificationType(str, enum.Enum):
@@ -30,8 +32,28 @@ class FirebaseMessage(InternalModel):
     data: FirebaseData
 
 
-class FCMNotificationTest:
-    notifications: dict[str, list] = defaultdict(list)
+def _is_transient(error: Exception) -> bool:
+    return isinstance(
+        error,
+        (
+            exceptions.UnavailableError,
+            exceptions.InternalError,
+            exceptions.DeadlineExceededError,
+            exceptions.ResourceExhaustedError,
+        ),
+    )
+
+
+class _FCMDispatcher(ABC):
+    """Sends a message to devices in chunks of at most FCM__BATCH_SIZE
+    tokens, several chunks at a time. Transient errors are retried with
+    exponential backoff, only for the failed tokens.
+    Returns unregistered tokens, callers should drop them.
+    """
+
+    @abstractmethod
+    async def _send(self, tokens: list[str], message: FirebaseMessage) -> dict[str, Exception]:
+        """Sends one chunk, returns errors of failed tokens."""
 
     async def notify(
         self,
@@ -42,14 +64,62 @@ class FCMNotificationTest:
         extra_kwargs: dict | None = None,
         *args,
         **kwargs,
-    ):
+    ) -> list[str]:
+        devices = list(dict.fromkeys(devices))
         if not devices:
-            return
-        for device in devices:
-            self.notifications[device].append(json.dumps(message.dict(by_alias=True), default=str))
+            return []
+        batch_size = settings.fcm.batch_size
+        semaphore = asyncio.Semaphore(settings.fcm.max_concurrency)
+        results = await asyncio.gather(
+            *(
+                self._dispatch_chunk(semaphore, devices[i : i + batch_size], message)
+                for i in range(0, len(devices), batch_size)
+            )
+        )
+        return [token for unregistered in results for token in unregistered]
+
+    async def _dispatch_chunk(
+        self, semaphore: asyncio.Semaphore, tokens: list[str], message: FirebaseMessage
+    ) -> list[str]:
+        unregistered: list[str] = []
+        for attempt in range(settings.fcm.retries + 1):
+            if attempt:
+                await asyncio.sleep(settings.fcm.retry_delay * 2 ** (attempt - 1))
+            try:
+                async with semaphore:
+                    errors = await self._send(tokens, message)
+            except Exception as e:
+                if not _is_transient(e):
+                    logger.exception(e)
+                    return unregistered
+                continue
+            unregistered += [token for token, error in errors.items() if isinstance(error, messaging.UnregisteredError)]
+            tokens = [token for token, error in errors.items() if _is_transient(error)]
+            if not tokens:
+                return unregistered
+        logger.warning(f"FCM: {len(tokens)} notifications were not sent after {settings.fcm.retries} retries")
+        return unregistered
+
+
+class FCMNotificationTest(_FCMDispatcher):
+    """Local transport, messages are stored per device.
+    Tokens of `unregistered` fail as unregistered.
+    """
+
+    notifications: dict[str, list] = defaultdict(list)
+    unregistered: set[str] = set()
+
+    async def _send(self, tokens: list[str], message: FirebaseMessage) -> dict[str, Exception]:
+        errors: dict[str, Exception] = dict()
+        for token in tokens:
+            if token in self.unregistered:
+                errors[token] = messaging.UnregisteredError("Requested entity was not found.")
+                continue
+            self.notifications[token].append(json.dumps(message.dict(by_alias=True), default=str))
+        return errors
 
 
-class FCMNotification:
+class FCMNotification(_FCMDispatcher):
     """Singleton FCM Notification client"""
 
     _initialized = False
@@ -74,40 +144,24 @@ class FCMNotification:
 
         self._initialized = True
 
-    async def notify(
-        self,
-        devices: list,
-        message: FirebaseMessage,
-        time_to_live: int | None = None,
-        badge: str | None = None,
-        extra_kwargs: dict | None = None,
-        *args,
-        **kwargs,
-    ):
+    async def notify(self, devices: list, message: FirebaseMessage, *args, **kwargs) -> list[str]:
         if not self._initialized:
-            return
-        devices = list(set(devices))
-        if len(devices) == 0:
-            return
-        elif devices and len(devices) > 1:
-            await asyncio.to_thread(
-                messaging.send_each_for_multicast,
-                messaging.MulticastMessage(
-                    devices,
-                    android=messaging.AndroidConfig(ttl=settings.fcm.ttl, priority="high"),
-                    data=dict(message=json.dumps(message.dict(by_alias=True), default=str)),
-                    apns=messaging.APNSConfig(payload=messaging.APNSPayload(aps=messaging.Aps(content_available=True))),
-                ),
-                app=self._app,
-            )
-        else:
-            await asyncio.to_thread(
-                messaging.send,
-                messaging.Message(
-                    android=messaging.AndroidConfig(ttl=settings.fcm.ttl, priority="high"),
-                    data=dict(message=json.dumps(message.dict(by_alias=True), default=str)),
-                    token=devices[0],
-                    apns=messaging.APNSConfig(payload=messaging.APNSPayload(aps=messaging.Aps(content_available=True))),
-                ),
-                app=self._app,
-            )
+            return []
+        return await super().notify(devices, message, *args, **kwargs)
+
+    async def _send(self, tokens: list[str], message: FirebaseMessage) -> dict[str, Exception]:
+        response = await asyncio.to_thread(
+            messaging.send_each_for_multicast,
+            messaging.MulticastMessage(
+                tokens,
+                android=messaging.AndroidConfig(ttl=settings.fcm.ttl, priority="high"),
+                data=dict(message=json.dumps(message.dict(by_alias=True), default=str)),
+                apns=messaging.APNSConfig(payload=messaging.APNSPayload(aps=messaging.Aps(content_available=True))),
+            ),
+            app=self._app,
+        )
+        return {
+            token: result.exception
+            for token, result in zip(tokens, response.responses)
+            if not result.success and result.exception
+        }
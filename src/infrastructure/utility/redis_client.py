@@ -1,4 +1,5 @@
 import datetime
+import fnmatch
 import json
 import re
 import typing
@@ -22,7 +23,9 @@ class RedisCacheTest:
 
         return value
 
-    async def set(self, name, value, ex=None, **kwargs):
+    async def set(self, name, value, ex=None, nx=False, **kwargs):
+        if nx and await self.get(name) is not None:
+            return None
         now = datetime.datetime.utcnow()
         self._storage[name] = [
             value,
@@ -30,6 +33,9 @@ class RedisCacheTest:
         ]
         return True
 
+    async def set_many(self, values: dict[str, typing.Any], ex=None, nx=False) -> list[bool]:
+        return [bool(await self.set(key, value, ex=ex, nx=nx)) for key, value in values.items()]
+
     async def delete(self, key: str) -> bool:
         self._storage.pop(key)
         return True
@@ -47,23 +53,29 @@ class RedisCacheTest:
         return filtered_keys
 
     async def mget(self, keys) -> list[typing.Any]:
-        results = []
-        for key in keys:
-            result, expire = self._storage.get(key, [None, None])
-            if expire > datetime.datetime.utcnow():
-                results.append(result)
-        return results
+        return [await self.get(key) for key in keys]
 
     async def publish(self, channel: str, value: dict):
         values, expiry = self._storage.get(channel, ([], None))
         values.append(json.dumps(value, default=str))
         self._storage[channel] = (values, expiry)
 
+    async def publish_many(self, messages: list[tuple[str, dict]]):
+        for channel, value in messages:
+            await self.publish(channel, value)
+
     async def messages(self, channel_name: str):
         values, expiry = self._storage.get(channel_name, ([], None))
         for value in values:
             yield value
 
+    async def pattern_messages(self, pattern: str):
+        for channel, (values, _) in list(self._storage.items()):
+            if not isinstance(values, list) or not fnmatch.fnmatchcase(channel, pattern):
+                continue
+            for value in values:
+                yield dict(type="pmessage", pattern=pattern, channel=channel, data=value)
+
 
 class RedisCache:
     """Singleton Redis cache client"""
@@ -129,14 +141,28 @@ class RedisCache:
         except aioredis.RedisError:
             return None
 
-    async def set(self, key: str, value: EncodableT, ex=None) -> bool:
+    async def set(self, key: str, value: EncodableT, ex=None, nx=False) -> bool:
+        """Set the value, with nx=True only if the key does not exist."""
         if not self._cache:
             return False
         if not ex:
             ex = self.expire_duration
-        result = await self._cache.set(key, value, ex=ex)
+        result = await self._cache.set(key, value, ex=ex, nx=nx)
         return result
 
+    async def set_many(self, values: dict[str, EncodableT], ex=None, nx=False) -> list[bool]:
+        """Set all values in one round trip, returns whether each key is set."""
+        if not self._cache:
+            return [False] * len(values)
+        if not ex:
+            ex = self.expire_duration
+        if isinstance(self._cache, RedisCacheTest):
+            return await self._cache.set_many(values, ex=ex, nx=nx)
+        async with self._cache.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, value, ex=ex, nx=nx)
+            return [bool(result) for result in await pipe.execute()]
+
     async def delete(self, key) -> bool:
         if not self._cache:
             return False
@@ -157,9 +183,34 @@ class RedisCache:
         assert self._cache
         await self._cache.publish(channel, json.dumps(value, default=str))
 
+    async def publish_many(self, messages: list[tuple[str, dict]]):
+        """Publish all messages in one round trip."""
+        assert self._cache
+        if isinstance(self._cache, RedisCacheTest):
+            await self._cache.publish_many(messages)
+            return
+        async with self._cache.pipeline(transaction=False) as pipe:
+            for channel, value in messages:
+                pipe.publish(channel, json.dumps(value, default=str))
+            await pipe.execute()
+
     async def messages(self, channel_name: str):
         assert self._cache
         pubsub = self._cache.pubsub()
         await pubsub.subscribe(channel_name)
-        async for message in pubsub.listen():
-            yield message
+        try:
+            async for message in pubsub.listen():
+                yield message
+        finally:
+            await pubsub.close()
+
+    async def pattern_messages(self, pattern: str):
+        """Messages of all channels matching the glob-style pattern."""
+        assert self._cache
+        pubsub = self._cache.pubsub()
+        await pubsub.psubscribe(pattern)
+        try:
+            async for message in pubsub.listen():
+                yield message
+        finally:
+            await pubsub.close()
@@ -0,0 +1,75 @@
+import uuid
+from collections import defaultdict
+
+import pytest
+from firebase_admin import exceptions, messaging
+from pytest_mock import MockerFixture
+
+from infrastructure.utility import FCMNotificationTest, FirebaseMessage, FirebaseNotificationType
+
+
+@pytest.fixture
+def message() -> FirebaseMessage:
+    return FirebaseMessage(
+        title="Applet is updated.",
+        body="Applet is updated.",
+        data=dict(type=FirebaseNotificationType.APPLET_UPDATE, applet_id=uuid.uuid4()),
+    )
+
+
+@pytest.fixture(autouse=True)
+def fcm_settings(mocker: MockerFixture):
+    mocker.patch("config.settings.fcm.batch_size", 2)
+    mocker.patch("config.settings.fcm.retry_delay", 0)
+    mocker.patch.object(FCMNotificationTest, "notifications", defaultdict(list))
+    mocker.patch.object(FCMNotificationTest, "unregistered", set())
+
+
+async def test_notify_sends_chunks(mocker: MockerFixture, message: FirebaseMessage):
+    send = mocker.spy(FCMNotificationTest, "_send")
+    devices = [f"device{i}" for i in range(5)]
+
+    unregistered = await FCMNotificationTest().notify(devices + devices[:2], message)
+
+    assert unregistered == []
+    assert sorted(len(call.args[1]) for call in send.call_args_list) == [1, 2, 2]
+    assert set(FCMNotificationTest.notifications) == set(devices)
+    assert all(len(sent) == 1 for sent in FCMNotificationTest.notifications.values())
+
+
+async def test_notify_returns_unregistered(message: FirebaseMessage):
+    FCMNotificationTest.unregistered.add("device1")
+
+    unregistered = await FCMNotificationTest().notify(["device0", "device1", "device2"], message)
+
+    assert unregistered == ["device1"]
+    assert set(FCMNotificationTest.notifications) == {"device0", "device2"}
+
+
+async def test_notify_retries_transient_errors(mocker: MockerFixture, message: FirebaseMessage):
+    calls: list[list[str]] = []
+
+    async def send(tokens, _message):
+        calls.append(tokens)
+        if len(calls) == 1:
+            raise exceptions.UnavailableError("Unavailable")
+        if len(calls) == 2:
+            return {"device1": exceptions.InternalError("Internal"), "device0": messaging.UnregisteredError("Gone")}
+        return dict()
+
+    mocker.patch.object(FCMNotificationTest, "_send", side_effect=send)
+
+    unregistered = await FCMNotificationTest().notify(["device0", "device1"], message)
+
+    assert unregistered == ["device0"]
+    assert calls == [["device0", "device1"], ["device0", "device1"], ["device1"]]
+
+
+async def test_notify_gives_up_after_retries(mocker: MockerFixture, message: FirebaseMessage):
+    mocker.patch("config.settings.fcm.retries", 2)
+    send = mocker.patch.object(FCMNotificationTest, "_send", side_effect=exceptions.UnavailableError("Unavailable"))
+
+    unregistered = await FCMNotificationTest().notify(["device0"], message)
+
+    assert unregistered == []
+    assert send.call_count == 3